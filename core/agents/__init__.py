@@ -1,6 +1,6 @@
 """Agent implementations for the MONITOR system."""
 
-from .factory import build_agents
+from .factory import build_agents, cached_build_agents
 from .registry import AgentRegistry
 
-__all__ = ["AgentRegistry", "build_agents"]
+__all__ = ["AgentRegistry", "build_agents", "cached_build_agents"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 from core.generation.interfaces.llm import LLM, Message
@@ -30,6 +31,14 @@ class Agent:
             max_tokens=self.config.max_tokens,
         )
 
+    def stream(self, messages: list[Message]) -> Iterator[str]:
+        return self.config.llm.stream(
+            system_prompt=self.config.system_prompt,
+            messages=messages,
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+        )
+
 
 @dataclass
 class Session:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 # Import agents to trigger registration
@@ -29,3 +30,12 @@ def build_agents(llm: Any) -> dict[str, Any]:
         "continuity": agents.get("continuitymoderator"),
         "conductor": agents.get("conductor"),
     }
+
+
+@lru_cache(maxsize=8)
+def cached_build_agents(llm: Any) -> dict[str, Any]:
+    """build_agents memoized per LLM instance (agents are stateless).
+
+    The returned mapping is shared: treat it as read-only.
+    """
+    return build_agents(llm)
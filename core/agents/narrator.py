@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from core.agents.base import Agent
 from core.agents.registry import AgentRegistry
 
@@ -21,3 +23,9 @@ def narrator_prompt():
 def narrator_agent(llm) -> Agent:
     """Legacy compatibility: create narrator agent."""
     return AgentRegistry.create_agent("narrator", llm)
+
+
+@lru_cache(maxsize=8)
+def cached_narrator_agent(llm) -> Agent:
+    """Narrator agent memoized per LLM instance (agents are stateless)."""
+    return narrator_agent(llm)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from core.agents.base import Agent, AgentConfig
 from core.agents.registry import AgentRegistry
 from core.loaders.agent_prompts import load_agent_prompts
@@ -16,3 +18,9 @@ def resolve_prompt() -> str:
 def resolve_agent(llm) -> Agent:
     """Legacy function - use AgentRegistry.create_agent('resolve', llm) instead."""
     return AgentRegistry.create_agent('resolve', llm)
+
+
+@lru_cache(maxsize=8)
+def cached_resolve_agent(llm) -> Agent:
+    """Resolve agent memoized per LLM instance (agents are stateless)."""
+    return resolve_agent(llm)
@@ -4,6 +4,7 @@ from collections import OrderedDict
 from dataclasses import dataclass, field
 import json
 from pathlib import Path
+import threading
 import time
 from typing import Any
 
@@ -17,6 +18,8 @@ class ReadThroughCache:
     capacity: int = 256
     ttl_seconds: float = 60.0
     _store: OrderedDict[str, tuple[Any, float]] = field(default_factory=OrderedDict)
+    # Instances are shared across request and worker threads; guards the LRU order
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def _evict_if_needed(self):
         while len(self._store) > self.capacity:
@@ -24,27 +27,32 @@ class ReadThroughCache:
 
     def get(self, key: str) -> Any | None:
         now = time.time()
-        item = self._store.get(key)
-        if not item:
-            return None
-        value, expires = item
-        if expires < now:
-            try:
+        with self._lock:
+            item = self._store.get(key)
+            if not item:
+                return None
+            value, expires = item
+            if expires < now:
                 del self._store[key]
-            except KeyError:
-                pass
-            return None
-        self._store.move_to_end(key, last=True)
-        return value
+                return None
+            self._store.move_to_end(key, last=True)
+            return value
 
     def set(self, key: str, value: Any) -> None:
         expires = time.time() + self.ttl_seconds
-        self._store[key] = (value, expires)
-        self._store.move_to_end(key, last=True)
-        self._evict_if_needed()
+        with self._lock:
+            self._store[key] = (value, expires)
+            self._store.move_to_end(key, last=True)
+            self._evict_if_needed()
 
     def clear(self) -> None:
-        self._store.clear()
+        with self._lock:
+            self._store.clear()
+
+    def size(self) -> int:
+        """Number of stored entries, including expired ones not yet evicted."""
+        with self._lock:
+            return len(self._store)
 
     @staticmethod
     def make_key(method: str, params: dict[str, Any]) -> str:
@@ -14,6 +14,32 @@ from core.utils.env import env_bool
 from .agent_utils import safe_agent_call
 from .nodes import critic_node, planner_node, recorder_node, resolve_decider_node
 
+# Lazily resolved optional dependencies, memoized after the first successful import
+_LG: tuple[Any, Any] | None = None
+_LC_TOOLS_BUILDER: Any | None = None
+
+
+def _load_langgraph() -> tuple[Any, Any]:
+    """Import langgraph on first use and return ``(END, StateGraph)``."""
+    global _LG
+    if _LG is None:
+        try:
+            from langgraph.graph import END, StateGraph
+        except Exception as e:
+            raise RuntimeError("LangGraph is not installed. Please install langgraph.") from e
+        _LG = (END, StateGraph)
+    return _LG
+
+
+def _load_lc_tools_builder() -> Any:
+    """Import ``build_langchain_tools`` on first use."""
+    global _LC_TOOLS_BUILDER
+    if _LC_TOOLS_BUILDER is None:
+        from core.engine.lc_tools import build_langchain_tools
+
+        _LC_TOOLS_BUILDER = build_langchain_tools
+    return _LC_TOOLS_BUILDER
+
 
 def _env_flag(name: str, default: str = "0") -> bool:
     """Parse common boolean-ish env flags once using shared util."""
@@ -25,10 +51,7 @@ def build_langgraph_flow(tools: Any, config: dict | None = None):
 
     This function avoids importing langgraph at module import time to keep it optional.
     """
-    try:
-        from langgraph.graph import END, StateGraph
-    except Exception as e:
-        raise RuntimeError("LangGraph is not installed. Please install langgraph.") from e
+    END, StateGraph = _load_langgraph()
 
     # Optional LangChain tools (env-gated)
     cfg = config or {}
@@ -36,8 +59,7 @@ def build_langgraph_flow(tools: Any, config: dict | None = None):
     use_lc_tools = bool(cfg.get("use_lc_tools", _env_flag("MONITOR_LC_TOOLS", "0")))
     if use_lc_tools:
         try:
-            from core.engine.lc_tools import build_langchain_tools
-
+            build_langchain_tools = _load_lc_tools_builder()
             lc_list = build_langchain_tools(tools["ctx"])  # returns a list of Tool objects
             lc_tools = {t.name: t for t in lc_list}
         except Exception:
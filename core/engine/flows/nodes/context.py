@@ -6,6 +6,9 @@ from typing import Any
 
 from ..state import FlowState, fetch_relations, safe_act
 
+# Prompt templates bound once at import time
+_STEWARD_TMPL = "Validate plan and draft context: {ctx}".format
+
 
 def librarian(state: FlowState, tools: dict[str, Any]) -> FlowState:
     """Gather evidence and context for the current operation."""
@@ -34,18 +37,11 @@ def librarian(state: FlowState, tools: dict[str, Any]) -> FlowState:
 def steward(state: FlowState, tools: dict[str, Any]) -> FlowState:
     """Validate context and provide guidance."""
     # LLM-backed steward for quick validation hints
+    ctx = str({k: v for k, v in state.items() if k in ("plan", "evidence")})[:800]
     hints = safe_act(
         tools,
         "steward",
-        [
-            {
-                "role": "user",
-                "content": (
-                    f"Validate plan and draft context: "
-                    f"{str({k: v for k, v in state.items() if k in ['plan', 'evidence']})[:800]}"
-                ),
-            }
-        ],
+        [{"role": "user", "content": _STEWARD_TMPL(ctx=ctx)}],
         default=None,
     )
 
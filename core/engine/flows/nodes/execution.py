@@ -26,24 +26,20 @@ def execute_actions(state: FlowState, tools: dict[str, Any]) -> FlowState:
 
             if tool == "bootstrap_story":
                 res = tools["bootstrap_story_tool"](ctx, **args)
-                try:
+                if isinstance(res, dict):
+                    refs = res.get("refs")
+                    refs = refs if isinstance(refs, dict) else {}
+                    result = res.get("result")
+                    result = result if isinstance(result, dict) else {}
                     new_scene_id = (
-                        (res.get("refs") or {}).get("scene_id")
-                        or (res.get("result") or {}).get("scene_id")
-                        or new_scene_id
+                        refs.get("scene_id") or result.get("scene_id") or new_scene_id
                     )
                     new_story_id = (
-                        (res.get("refs") or {}).get("story_id")
-                        or (res.get("result") or {}).get("story_id")
-                        or new_story_id
+                        refs.get("story_id") or result.get("story_id") or new_story_id
                     )
                     new_universe_id = (
-                        (res.get("refs") or {}).get("universe_id")
-                        or (res.get("result") or {}).get("universe_id")
-                        or new_universe_id
+                        refs.get("universe_id") or result.get("universe_id") or new_universe_id
                     )
-                except Exception:
-                    pass
 
                 try:
                     # Capture tags from args to seed continuity across nodes
@@ -9,6 +9,9 @@ from core.engine.flow_utils import ops_prelude as flow_ops_prelude
 
 from ..state import MONITOR_PERSONA, MONITOR_VERBOSE_TASKS, FlowState, safe_act
 
+# Prompt templates bound once at import time
+_DIRECTOR_TMPL = "Intent: {intent}. Return a tiny plan.".format
+
 
 def ops_prelude(actions: list[dict[str, Any]]) -> str | None:
     """Generate operations prelude for planned actions."""
@@ -22,7 +25,7 @@ def director(state: FlowState, tools: dict[str, Any]) -> FlowState:
     reply = safe_act(
         tools,
         "director",
-        [{"role": "user", "content": f"Intent: {intent}. Return a tiny plan."}],
+        [{"role": "user", "content": _DIRECTOR_TMPL(intent=intent)}],
         default=None,
     )
 
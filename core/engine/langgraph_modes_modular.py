@@ -2,26 +2,25 @@
 
 from __future__ import annotations
 
-import re
+from collections import deque
 from typing import Any, NotRequired, TypedDict
-import uuid
 
 from core.engine.tools import ToolContext
 from core.generation.interfaces.llm import Message
 
 from .modes.monitor import monitor_node as modular_monitor_node
-from .modes.narration_mode import narration_node as modular_narration_node
+from .modes.narration_mode import narrator_node as modular_narration_node
 from .modes.router import classify_intent as modular_classify_intent
 
 # Import modular components
 from .modes.state import GraphState as ModularGraphState
-from .modes.state import Mode
+from .modes.state import Mode, append_message, ensure_history, generate_id, get_meta
 
 
 # Legacy GraphState for backward compatibility
 class GraphState(TypedDict, total=False):
     # Conversación acumulada
-    messages: list[Message]
+    messages: list[Message] | deque[Message]
     # Último input del usuario (para el step actual)
     input: str
     # Modo actual decidido por el router
@@ -38,68 +37,42 @@ class GraphState(TypedDict, total=False):
     meta: NotRequired[dict]
 
 
-_CMD_MONITOR = re.compile(r"^[\s]*[\/@]?(monitor)\b", re.IGNORECASE)
-_CMD_NARRATE = re.compile(r"^[\s]*[\/@]?(narrar|narrador|narrate|narrator)\b", re.IGNORECASE)
-_CMD_HELP = re.compile(r"^[\s]*[\/@]?help\b", re.IGNORECASE)
-
-
 def _append(state: GraphState, role: str, content: str) -> None:
-    msgs = state.get("messages") or []
-    msgs.append({"role": role, "content": content})
-    state["messages"] = msgs
+    # Same bounded deque history as the modular nodes
+    append_message(state, role, content)  # type: ignore[arg-type]
 
 
 def _gen_id(prefix: str) -> str:
-    return f"{prefix}:{uuid.uuid4().hex[:8]}"
-
-
-def _convert_to_modular_state(state: GraphState) -> ModularGraphState:
-    """Convert legacy GraphState to modular GraphState."""
-    return {
-        "messages": state.get("messages", []),
-        "text": state.get("input", ""),
-        "mode": state.get("mode"),
-        "last_mode": state.get("last_mode"),
-        "override_mode": state.get("override_mode"),
-        "universe_id": state.get("universe_id"),
-        "session_id": state.get("session_id"),
-        "meta": state.get("meta", {}),
-    }
-
-
-def _convert_from_modular_state(modular_state: ModularGraphState) -> GraphState:
-    """Convert modular GraphState back to legacy GraphState."""
-    return {
-        "messages": modular_state.get("messages", []),
-        "input": modular_state.get("text", ""),
-        "mode": modular_state.get("mode"),
-        "last_mode": modular_state.get("last_mode"),
-        "override_mode": modular_state.get("override_mode"),
-        "universe_id": modular_state.get("universe_id"),
-        "session_id": modular_state.get("session_id"),
-        "meta": modular_state.get("meta", {}),
-    }
+    return generate_id(prefix)
+
+
+def _as_modular_state(state: GraphState) -> ModularGraphState:
+    """Prepare a legacy state for the modular nodes, in place.
+
+    Both schemas share the same keys, so no copy is made: history and meta are
+    created on the state itself if missing and the nodes mutate it directly.
+    """
+    ensure_history(state)  # type: ignore[arg-type]
+    get_meta(state)  # type: ignore[arg-type]
+    return state  # type: ignore[return-value]
 
 
 def classify_intent(state: GraphState) -> GraphState:
-    """Legacy wrapper for modular classify_intent."""
-    modular_state = _convert_to_modular_state(state)
-    result = modular_classify_intent(modular_state)
-    return _convert_from_modular_state(result)
+    """Legacy wrapper for modular classify_intent (mutates state)."""
+    return modular_classify_intent(_as_modular_state(state))  # type: ignore[return-value]
 
 
 def narration_node(state: GraphState, ctx: ToolContext | None = None) -> GraphState:
-    """Legacy wrapper for modular narration_node."""
-    modular_state = _convert_to_modular_state(state)
-    result = modular_narration_node(modular_state, ctx)
-    return _convert_from_modular_state(result)
+    """Legacy wrapper for modular narration_node (mutates state).
+
+    Narration needs no tools; ``ctx`` is accepted so both nodes share a signature.
+    """
+    return modular_narration_node(_as_modular_state(state))  # type: ignore[return-value]
 
 
 def monitor_node(state: GraphState, ctx: ToolContext | None = None) -> GraphState:
-    """Legacy wrapper for modular monitor_node."""
-    modular_state = _convert_to_modular_state(state)
-    result = modular_monitor_node(modular_state, ctx)
-    return _convert_from_modular_state(result)
+    """Legacy wrapper for modular monitor_node (mutates state)."""
+    return modular_monitor_node(_as_modular_state(state), ctx)  # type: ignore[return-value]
 
 
 def build_langgraph_modes(tools: ToolContext | None = None) -> Any:
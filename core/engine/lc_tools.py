@@ -2,6 +2,24 @@ from __future__ import annotations
 
 from typing import Any
 
+# Read-only query service methods exposed to LangChain agents
+_ALLOWED_QUERIES = frozenset(
+    {
+        "system_usage_summary",
+        "effective_system_for_universe",
+        "effective_system_for_story",
+        "effective_system_for_scene",
+        "effective_system_for_entity",
+        "effective_system_for_entity_in_story",
+        "relation_state_history",
+        "relations_effective_in_scene",
+        "relation_is_active_in_scene",
+        # Additional safe read helpers
+        "entities_in_scene",
+        "facts_for_scene",
+    }
+)
+
 
 def build_langchain_tools(ctx: Any) -> list[Any]:
     """Return LangChain Tool objects wrapping query, rules, and recorder tools.
@@ -13,24 +31,15 @@ def build_langchain_tools(ctx: Any) -> list[Any]:
     except Exception as e:
         raise RuntimeError("LangChain is not installed. Please install langchain.") from e
 
+    # Bound once per tool set: the allowed methods this query service provides
+    dispatch = {
+        name: fn for name in _ALLOWED_QUERIES if (fn := getattr(ctx.query_service, name, None))
+    }
+
     def _query(method: str, **kwargs):
-        allowed = {
-            "system_usage_summary",
-            "effective_system_for_universe",
-            "effective_system_for_story",
-            "effective_system_for_scene",
-            "effective_system_for_entity",
-            "effective_system_for_entity_in_story",
-            "relation_state_history",
-            "relations_effective_in_scene",
-            "relation_is_active_in_scene",
-            # Additional safe read helpers
-            "entities_in_scene",
-            "facts_for_scene",
-        }
-        if method not in allowed:
+        fn = dispatch.get(method)
+        if fn is None:
             raise ValueError(f"Query method not allowed: {method}")
-        fn = getattr(ctx.query_service, method)
         return fn(**kwargs)
 
     def _rules(action: str, **kwargs) -> dict[str, Any]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 try:
@@ -18,35 +19,63 @@ class LibrarianService:
         self.q = query_service
 
     def scene_brief(self, scene_id: str, limits: dict[str, int] | None = None) -> str:
-        lim = {"rels": 8, "ents": 8, "facts": 6}
-        lim.update(limits or {})
-        lines: list[str] = [f"Context for scene {scene_id}:"]
-        try:
-            rels = self.q.relations_effective_in_scene(scene_id)
-            if rels:
-                lines.append("- Relations:")
-                for r in rels[: lim["rels"]]:
-                    a = r.get("a") or r.get("A") or r.get("from") or "?"
-                    b = r.get("b") or r.get("B") or r.get("to") or "?"
-                    t = r.get("type") or r.get("TYPE") or "REL"
-                    lines.append(f"  • {a} -[{t}]-> {b}")
-        except Exception:
-            pass
-        try:
-            ents = self.q.entities_in_scene(scene_id)
-            if ents:
-                lines.append("- Participants:")
-                for e in ents[: lim["ents"]]:
-                    lines.append(f"  • {e.get('id') or e.get('name')}")
-        except Exception:
-            pass
+        parts = [self._safe_fetch(method, scene_id) for method in _BRIEF_QUERIES]
+        return _format_brief(scene_id, *parts, limits)
+
+    async def scene_brief_async(self, scene_id: str, limits: dict[str, int] | None = None) -> str:
+        """scene_brief with the three queries in flight at once.
+
+        Uses the query service's ``*_async`` methods when it has them, otherwise
+        runs the sync ones in worker threads. A failed query leaves its section out.
+        """
+        results = await asyncio.gather(
+            *(self._fetch_async(method, scene_id) for method in _BRIEF_QUERIES),
+            return_exceptions=True,
+        )
+        parts = [r if isinstance(r, list) else [] for r in results]
+        return _format_brief(scene_id, *parts, limits)
+
+    def _safe_fetch(self, method: str, scene_id: str) -> list[dict[str, Any]]:
         try:
-            facts = self.q.facts_for_scene(scene_id)
-            if facts:
-                lines.append("- Facts:")
-                for f in facts[: lim["facts"]]:
-                    desc = f.get("description") or f.get("text") or "(no description)"
-                    lines.append(f"  • {desc[:100]}")
+            return getattr(self.q, method)(scene_id) or []
         except Exception:
-            pass
-        return "\n".join(lines[: 2 + lim["rels"] + lim["ents"] + lim["facts"]])
+            return []
+
+    async def _fetch_async(self, method: str, scene_id: str) -> list[dict[str, Any]]:
+        native = getattr(self.q, f"{method}_async", None)
+        if native is not None:
+            return await native(scene_id) or []
+        return await asyncio.to_thread(getattr(self.q, method), scene_id) or []
+
+
+# Independent reads behind a scene brief: relations, participants, facts
+_BRIEF_QUERIES = ("relations_effective_in_scene", "entities_in_scene", "facts_for_scene")
+
+
+def _format_brief(
+    scene_id: str,
+    rels: list[dict[str, Any]],
+    ents: list[dict[str, Any]],
+    facts: list[dict[str, Any]],
+    limits: dict[str, int] | None,
+) -> str:
+    lim = {"rels": 8, "ents": 8, "facts": 6}
+    lim.update(limits or {})
+    lines: list[str] = [f"Context for scene {scene_id}:"]
+    if rels:
+        lines.append("- Relations:")
+        for r in rels[: lim["rels"]]:
+            a = r.get("a") or r.get("A") or r.get("from") or "?"
+            b = r.get("b") or r.get("B") or r.get("to") or "?"
+            t = r.get("type") or r.get("TYPE") or "REL"
+            lines.append(f"  • {a} -[{t}]-> {b}")
+    if ents:
+        lines.append("- Participants:")
+        for e in ents[: lim["ents"]]:
+            lines.append(f"  • {e.get('id') or e.get('name')}")
+    if facts:
+        lines.append("- Facts:")
+        for f in facts[: lim["facts"]]:
+            desc = f.get("description") or f.get("text") or "(no description)"
+            lines.append(f"  • {desc[:100]}")
+    return "\n".join(lines)
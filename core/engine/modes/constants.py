@@ -1,11 +1,101 @@
 """Constants and patterns for mode classification."""
 
 import re
+from typing import NamedTuple
 
-# Command patterns for intent classification
-CMD_MONITOR = re.compile(r"^[\s]*[\/@]?(monitor)\b", re.IGNORECASE)
-CMD_NARRATE = re.compile(r"^[\s]*[\/@]?(narrar|narrador|narrate|narrator)\b", re.IGNORECASE)
-CMD_HELP = re.compile(r"^[\s]*[\/@]?help\b", re.IGNORECASE)
+# Conversation history kept in state (older turns are dropped)
+CHAT_HISTORY_MAX = 64
+# Turns of history sent to the LLM per call
+LLM_CONTEXT_TURNS = 8
+# History windows advance in blocks of this many messages (stable prompt prefix).
+# Even, so a block is whole user/assistant turns: the prefix then holds for two
+# turns and the window always opens on the same role.
+LLM_CONTEXT_STEP = 4
+
+# Command pattern for intent classification: one case-insensitive pass over the
+# input head; ``lastgroup`` is "help", "mon" or "nar".
+CMD_RE = re.compile(
+    r"[/@]?(?:(?P<help>help)|(?P<mon>monitor)|(?P<nar>narrar|narrador|narrate|narrator))\b",
+    re.IGNORECASE,
+)
+# Longest command ("/narrador") plus one char for the word boundary
+CMD_HEAD = 10
+
+
+def match_command(text: str) -> str | None:
+    """Return "help", "mon" or "nar" if the (stripped) text starts with a command.
+
+    A single anchored, case-insensitive match over the head of the text: no
+    lowercased copy or slice, and non-commands fail on the first character.
+    """
+    m = CMD_RE.match(text, 0, CMD_HEAD)
+    return m.lastgroup if m else None
+
+# Static system prompts. Kept byte-identical across calls and placed before any
+# per-turn content so providers with automatic prefix caching can reuse them.
+MONITOR_SYSTEM_PROMPT = (
+    "Eres el Monitor, un asistente operacional. Responde breve, preciso y accionable. "
+    "No escribas narrativa. Si la petición requiere ejecutar acciones reales "
+    "(crear/actualizar/consultar universos, multiversos, datos), "
+    "propón un plan de 2-3 pasos y confirma los datos faltantes."
+)
+
+# Narrator per-universe context; sent ahead of the history so it stays in the cached prefix
+NARRATOR_STYLE = "Mantén tono diegético, conciso."
+NARRATOR_CONTEXT_TMPL = ("Universo actual: {universe}. " + NARRATOR_STYLE).format
+
+# Narrator instructions for one-shot setup beats; the per-call details go in the user turn
+INTRO_BEAT_PROMPT = (
+    "You are the GM. Write a short intro beat (3-5 sentences) based on the given topics "
+    "and interests. Keep it engaging and concise."
+)
+SCENE_PRIMER_PROMPT = (
+    "Genera un inicio breve (3-5 frases) para la primera escena dada su premisa/título."
+)
+
+# Classifier inputs are cut to this many characters; intent is clear from the opening
+CLASSIFIER_INPUT_MAX_CHARS = 400
+
+INTENT_CLASSIFIER_SYSTEM_PROMPT = """You are a precise intent classifier. Return only valid JSON.
+
+Classify the user input as either "narration" or "monitor":
+
+- "narration": Creative storytelling, character interactions, world-building
+- "monitor": Operational commands, data queries, system management
+
+Respond with JSON: {"intent": "narration|monitor", "confidence": 0.0-1.0, "reason": "brief explanation"}"""
+
+# Structured-output schema for both intent classifiers (passed to LLM.complete_json)
+INTENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "intent": {"type": "string", "enum": ["narration", "monitor"]},
+        "confidence": {"type": "number"},
+        "reason": {"type": "string"},
+    },
+    "required": ["intent", "confidence", "reason"],
+    "additionalProperties": False,
+}
+
+
+class IntentVerdict(NamedTuple):
+    """Validated classifier reply (INTENT_SCHEMA)."""
+
+    intent: str
+    confidence: float
+    reason: str
+
+
+def decode_intent_verdict(data: dict) -> IntentVerdict:
+    """Validate a decoded classifier reply in one step; ValueError if unusable.
+
+    Confidence is clamped to [0, 1] so an over-eager reply cannot outrank commands.
+    """
+    intent = str(data.get("intent") or "").lower()
+    if intent not in ("narration", "monitor"):
+        raise ValueError(f"unusable intent: {intent!r}")
+    confidence = min(1.0, max(0.0, float(data.get("confidence") or 0.0)))
+    return IntentVerdict(intent, confidence, str(data.get("reason") or ""))
 
 # Help text content
 HELP_TEXT = """
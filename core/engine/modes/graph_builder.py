@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Generator
+import queue
+import threading
 from typing import Any
 
 from core.engine.tools import ToolContext
 
 from .graph_state import GraphState
-from .intent_classifier import classify_intent
-from .monitor_node import monitor_node
-from .narrator_node import narrator_node
+from .intent_classifier import aclassify_intent, classify_intent
+from .monitor_node import amonitor_node, monitor_node
+from .narrator_node import anarrator_node, aprefetch_scene_brief, narrator_node
+
+# The compiled graph does not depend on tools (they travel in the state), so it is
+# built once per process and shared by every adapter.
+_COMPILED: Any | None = None
+_COMPILED_LOCK = threading.Lock()
+# Set once langgraph failed to import, so later builds skip the import attempt
+_LANGGRAPH_MISSING = False
+# Adapters are stateless; the tools-less one (the common case) is shared
+_DEFAULT_ADAPTER: Any | None = None
 
 
 def build_langgraph_modes(tools: ToolContext | None = None) -> Any:
@@ -17,12 +30,32 @@ def build_langgraph_modes(tools: ToolContext | None = None) -> Any:
 
     Returns a compiled graph with .invoke(state_dict) -> state_dict method.
     """
-    try:
-        pass
-    except Exception:  # pragma: no cover - environment without langgraph
-        return _create_sequential_adapter(tools)
+    global _DEFAULT_ADAPTER, _LANGGRAPH_MISSING
+    if tools is None and _DEFAULT_ADAPTER is not None:
+        return _DEFAULT_ADAPTER
+
+    if _LANGGRAPH_MISSING:
+        adapter = _create_sequential_adapter(tools)
+    else:
+        try:
+            adapter = _create_langgraph_adapter(tools, _get_compiled_graph())
+        except ImportError:  # pragma: no cover - environment without langgraph
+            _LANGGRAPH_MISSING = True
+            adapter = _create_sequential_adapter(tools)
 
-    return _create_langgraph_adapter(tools)
+    if tools is None:
+        _DEFAULT_ADAPTER = adapter
+    return adapter
+
+
+def _with_tools(state: dict[str, Any], tools: ToolContext | None) -> dict[str, Any]:
+    """Return state carrying the adapter's tools; copies only when they must be swapped in.
+
+    Otherwise the caller's dict is used as is and the nodes update it in place.
+    """
+    if tools is None or state.get("tools") is tools:
+        return state
+    return {**state, "tools": tools}
 
 
 def _create_sequential_adapter(tools: ToolContext | None) -> Any:
@@ -30,11 +63,7 @@ def _create_sequential_adapter(tools: ToolContext | None) -> Any:
 
     class _SeqAdapter:
         def invoke(self, state: dict[str, Any]) -> dict[str, Any]:
-            s = dict(state)
-            if tools is not None:
-                s["tools"] = tools  # type: ignore[assignment]
-
-            s = classify_intent(s)
+            s = classify_intent(_with_tools(state, tools))
 
             if s.get("mode", "narration") == "narration":
                 s = narrator_node(s)
@@ -43,52 +72,175 @@ def _create_sequential_adapter(tools: ToolContext | None) -> Any:
 
             return s
 
+        async def ainvoke(self, state: dict[str, Any]) -> dict[str, Any]:
+            s = await _aclassify_and_prefetch(_with_tools(state, tools))
+
+            if s.get("mode", "narration") == "narration":
+                return await anarrator_node(s)
+            return await amonitor_node(s)
+
+        async def ainvoke_batch(self, states: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return await _ainvoke_all(self, states)
+
+        def stream(self, state: dict[str, Any]) -> Generator[str, None, dict[str, Any]]:
+            return _stream_turn(self.invoke, state)
+
     return _SeqAdapter()
 
 
-def _create_langgraph_adapter(tools: ToolContext | None) -> Any:
-    """Create LangGraph-based adapter with fallback."""
-    from langgraph.graph import END, StateGraph
+def _get_compiled_graph() -> Any:
+    """Return the process-wide compiled modes graph, building it on first use."""
+    global _COMPILED
+    if _COMPILED is None:
+        with _COMPILED_LOCK:
+            if _COMPILED is None:
+                _COMPILED = _compile_graph()
+    return _COMPILED
 
-    class S(dict):
-        pass
 
-    # Build the graph
-    g = StateGraph(S)
-    g.add_node("classify", classify_intent)
-    g.add_node("narrator", narrator_node)
-    g.add_node("monitor", monitor_node)
-    g.set_entry_point("classify")
+def _compile_graph() -> Any:
+    """Build and compile the classify -> narrator|monitor graph."""
+    from langchain_core.runnables import RunnableLambda
+    from langgraph.graph import END, StateGraph
 
-    def pick_branch(state: GraphState) -> str:
-        mode = state.get("mode", "narration")
-        return "narrator" if mode == "narration" else "monitor"
+    # Typed schema: a bare dict subclass declares no channels, so the input was
+    # dropped and invoke() returned None (forcing the sequential fallback).
+    # Each node carries an async twin used by ainvoke().
+    g = StateGraph(GraphState)
+    g.add_node("classify", RunnableLambda(classify_intent, afunc=_aclassify_and_prefetch))
+    g.add_node("narrator", RunnableLambda(narrator_node, afunc=anarrator_node))
+    g.add_node("monitor", RunnableLambda(monitor_node, afunc=amonitor_node))
+    g.set_entry_point("classify")
 
-    g.add_conditional_edges("classify", pick_branch, {"narrator": "narrator", "monitor": "monitor"})
+    # The decided mode maps straight onto the node name
+    g.add_conditional_edges(
+        "classify",
+        lambda s: s.get("mode", "narration"),
+        {"narration": "narrator", "monitor": "monitor"},
+    )
     g.add_edge("narrator", END)
     g.add_edge("monitor", END)
 
-    compiled = g.compile()
+    return g.compile()
+
+
+async def _aclassify_and_prefetch(state: GraphState) -> GraphState:
+    """Classify while the narrator's scene brief loads; the brief is dropped for monitor turns."""
+    brief = asyncio.ensure_future(aprefetch_scene_brief(state))
+    try:
+        s = await aclassify_intent(state)
+    except BaseException:
+        brief.cancel()
+        raise
+    if s.get("mode", "narration") == "narration":
+        s["_librarian_brief"] = await brief
+    else:
+        brief.cancel()
+    return s
+
+
+def _create_langgraph_adapter(tools: ToolContext | None, compiled: Any) -> Any:
+    """Wrap the shared compiled graph with per-call tools injection and fallback."""
+    fallback = _create_sequential_adapter(tools)
 
     class _Adapter:
         def __init__(self, _compiled):
             self._compiled = _compiled
 
         def invoke(self, inputs: dict[str, Any]) -> dict[str, Any]:
+            # Prepared once; the fallback reuses it (its tools already match)
+            inputs, streamed = _track_stream(_with_tools(inputs, tools))
             try:
-                # Propagate ToolContext to state
-                if tools is not None:
-                    inputs = dict(inputs)
-                    inputs["tools"] = tools  # type: ignore[index]
-
                 out = self._compiled.invoke(inputs)
                 if out is not None:
                     return out
 
             except Exception:
-                pass
+                # Part of the reply already reached the client; a rerun would repeat it
+                if streamed():
+                    raise
 
             # Sequential fallback for robustness
-            return _create_sequential_adapter(tools).invoke(inputs)
+            return fallback.invoke(inputs)
+
+        async def ainvoke(self, inputs: dict[str, Any]) -> dict[str, Any]:
+            inputs, streamed = _track_stream(_with_tools(inputs, tools))
+            try:
+                out = await self._compiled.ainvoke(inputs)
+                if out is not None:
+                    return out
+
+            except Exception:
+                if streamed():
+                    raise
+
+            return await fallback.ainvoke(inputs)
+
+        async def ainvoke_batch(self, inputs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return await _ainvoke_all(self, inputs)
+
+        def stream(self, inputs: dict[str, Any]) -> Generator[str, None, dict[str, Any]]:
+            return _stream_turn(self.invoke, inputs)
 
     return _Adapter(compiled)
+
+
+def _track_stream(state: dict[str, Any]) -> tuple[dict[str, Any], Callable[[], bool]]:
+    """Wrap the state's stream_cb; the returned probe tells whether it emitted a chunk."""
+    on_chunk = state.get("stream_cb")
+    if on_chunk is None:
+        return state, lambda: False
+    emitted = threading.Event()
+
+    def _cb(chunk: str) -> None:
+        emitted.set()
+        on_chunk(chunk)
+
+    return {**state, "stream_cb": _cb}, emitted.is_set
+
+
+async def _ainvoke_all(adapter: Any, states: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Run independent turns concurrently so their LLM round-trips overlap.
+
+    Results keep the input order. Turns must belong to different sessions.
+    """
+    return list(await asyncio.gather(*(adapter.ainvoke(s) for s in states)))
+
+
+def _stream_turn(
+    invoke: Callable[[dict[str, Any]], dict[str, Any]], state: dict[str, Any]
+) -> Generator[str, None, dict[str, Any]]:
+    """Run one turn in a worker thread, yielding reply chunks as the LLM emits them.
+
+    The final state is the generator's return value (``out = yield from adapter.stream(s)``).
+    Replies that are not LLM-generated (help, wizards, actions) are yielded whole.
+    """
+    chunks: queue.SimpleQueue[Any] = queue.SimpleQueue()
+    done = object()
+    result: dict[str, Any] = {}
+
+    def _run() -> None:
+        try:
+            result["state"] = invoke({**state, "stream_cb": chunks.put})
+        except BaseException as e:  # re-raised in the consumer
+            result["error"] = e
+        finally:
+            chunks.put(done)
+
+    threading.Thread(target=_run, name="modes-stream", daemon=True).start()
+
+    streamed = False
+    while (chunk := chunks.get()) is not done:
+        streamed = True
+        yield chunk
+
+    if "error" in result:
+        raise result["error"]
+    out = result["state"]
+    out.pop("stream_cb", None)
+    if not streamed:
+        for m in reversed(out.get("messages") or ()):
+            if m.get("role") == "assistant":
+                yield m.get("content", "")
+                break
+    return out
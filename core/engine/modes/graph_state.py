@@ -6,19 +6,46 @@ for managing conversation state across nodes.
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable
+from itertools import count, islice
+import os
 from typing import Any, Literal, NotRequired, TypedDict
-import uuid
 
 from core.generation.interfaces.llm import Message
 
+from .constants import CHAT_HISTORY_MAX, LLM_CONTEXT_STEP
+
+# Ids are a random per-process salt plus a counter: unique across processes without
+# building a UUID (and reading the OS RNG) for every id
+_ID_SALT = os.urandom(4).hex()
+_ID_COUNTER = count()
+
 Mode = Literal["narration", "monitor"]
 
 
+class WizardState(TypedDict, total=False):
+    """Multi-turn wizard progress, kept in state["meta"]["wizard"] as a plain dict."""
+
+    flow: str
+    # Fields the wizard is still waiting for (lets replies skip the full parser)
+    needs: list[str]
+    topics: list[str]
+    interests: list[str]
+    system_id: str
+    universe_name: str
+    story_title: str
+    name: str
+    multiverse_id: str
+    universe_id: str
+    story_id: str
+
+
 class GraphState(TypedDict, total=False):
     """State shared across all graph nodes."""
 
     # Conversación acumulada
-    messages: list[Message]
+    messages: list[Message] | deque[Message]
     # Último input del usuario (para el step actual)
     input: str
     # Modo actual decidido por el router
@@ -37,19 +64,81 @@ class GraphState(TypedDict, total=False):
     user: NotRequired[dict]
     # Metadatos (confianza/razón del router, flags)
     meta: NotRequired[dict]
+    # Callback que recibe la respuesta del LLM en fragmentos (streaming opcional)
+    stream_cb: NotRequired[Callable[[str], Any]]
     # Tools context
     tools: NotRequired[Any]
     # Internal flags
     _help: NotRequired[bool]
+    # Librarian scene brief prefetched for the narrator (consumed on use)
+    _librarian_brief: NotRequired[str | None]
+
+
+def ensure_history(state: GraphState) -> deque[Message]:
+    """Make state["messages"] a deque bounded to CHAT_HISTORY_MAX and return it.
+
+    Graph entry points call this once per turn so later appends mutate in place.
+    """
+    msgs = state.get("messages")
+    if not isinstance(msgs, deque):
+        msgs = deque(msgs or (), maxlen=CHAT_HISTORY_MAX)
+        state["messages"] = msgs
+    return msgs
+
+
+def get_meta(state: GraphState) -> dict[str, Any]:
+    """Return state["meta"], creating it once so callers can mutate it in place."""
+    meta = state.get("meta")
+    if meta is None:
+        meta = state["meta"] = {}
+    return meta
+
+
+def get_wizard(state: GraphState) -> WizardState:
+    """Return the live wizard dict in state["meta"], creating it if missing."""
+    return get_meta(state).setdefault("wizard", {})  # type: ignore[return-value]
 
 
 def append_message(state: GraphState, role: str, content: str) -> None:
     """Add a message to the conversation history."""
-    msgs = state.get("messages") or []
+    msgs = state.get("messages")
+    if not isinstance(msgs, deque):
+        msgs = ensure_history(state)
     msgs.append({"role": role, "content": content})
-    state["messages"] = msgs
+    # Count of messages ever appended; anchors context windows once the deque drops old ones
+    meta = get_meta(state)
+    meta["history_seq"] = meta.get("history_seq", len(msgs) - 1) + 1
+
+
+def recent_messages(state: GraphState, n: int) -> list[Message]:
+    """Return the last n messages (oldest first) without copying the whole history.
+
+    Walks the history from the end, so the cost is O(n) regardless of its length.
+    """
+    if n <= 0:
+        return []
+    window = list(islice(reversed(state.get("messages") or ()), n))
+    window.reverse()
+    return window
+
+
+def anchored_messages(state: GraphState, n: int, step: int = LLM_CONTEXT_STEP) -> list[Message]:
+    """Return up to n recent messages whose first one only moves every `step` appends.
+
+    A plain last-n window drops one message from the front every turn, so the
+    prompt prefix changes each time and provider prompt caches never hit. Here
+    the window start advances in blocks of `step`, keeping it byte-stable across
+    turns; the window holds between n - step + 1 and n messages.
+    """
+    msgs = state.get("messages") or ()
+    total = (state.get("meta") or {}).get("history_seq", len(msgs))
+    excess = total - n
+    if excess <= 0:
+        return recent_messages(state, n)
+    start = -(-excess // step) * step  # round up to a block boundary
+    return recent_messages(state, total - start)
 
 
 def generate_id(prefix: str) -> str:
     """Generate a unique ID with the given prefix."""
-    return f"{prefix}:{uuid.uuid4().hex[:8]}"
+    return f"{prefix}:{_ID_SALT}{next(_ID_COUNTER):04x}"
@@ -2,13 +2,49 @@
 
 from __future__ import annotations
 
-import json
-
-from core.engine.monitor_parser import parse_monitor_intent
-from core.generation.providers import select_llm_from_env
-
-from .constants import CMD_MONITOR, CMD_NARRATE
-from .graph_state import GraphState
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+import re
+
+from core.engine.cache import ReadThroughCache
+from core.engine.monitor_parser import cached_parse_monitor_intent
+from core.generation.providers import cached_llm_from_env
+from core.utils.env import env_bool
+
+from .constants import (
+    CLASSIFIER_INPUT_MAX_CHARS,
+    INTENT_CLASSIFIER_SYSTEM_PROMPT,
+    INTENT_SCHEMA,
+    IntentVerdict,
+    decode_intent_verdict,
+    match_command,
+)
+from .graph_state import GraphState, ensure_history, get_meta
+from .router_draft import confident_draft, record_verdict
+
+# Set MONITOR_ROUTER_LLM=0 to classify with commands/parser only (no LLM round trip)
+_LLM_ROUTER_ENABLED = env_bool("MONITOR_ROUTER_LLM", True)
+
+# Set MONITOR_ROUTER_SPECULATIVE=1 to keep the LLM off the critical path: the turn
+# is routed on the session's previous verdict while the LLM classifies in background
+_SPECULATIVE = env_bool("MONITOR_ROUTER_SPECULATIVE", False)
+_REFINE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="router-refine")
+# In-flight/last LLM verdict per session, consumed as the next turn's prior
+_REFINED = ReadThroughCache(capacity=1024, ttl_seconds=600.0)
+
+_WS = re.compile(r"\s+")
+_WORD = re.compile(r"\w+")
+
+# Keyword prefilter: words counted per mode; two or more hits (and more than the
+# other mode) decide the turn without the LLM. Phrases are matched as substrings.
+_MONITOR_KWS = frozenset(
+    {"list", "create", "seed", "retcon", "show", "save", "fact", "facts", "universe", "multiverse"}
+)
+_MONITOR_PHRASES = ("end scene", "add scene")
+_NARR_KWS = frozenset({"dice", "roll", "say", "do", "narrate", "continue"})
+_PREFILTER_MIN_HITS = 2
+# LLM verdicts keyed by normalized input; repeated phrasings skip the round trip
+_VERDICT_CACHE = ReadThroughCache(capacity=1024, ttl_seconds=600.0)
 
 
 def classify_intent(state: GraphState) -> GraphState:
@@ -16,36 +52,87 @@ def classify_intent(state: GraphState) -> GraphState:
 
     Returns updated state with mode, confidence, and reasoning.
     """
+    pending = _classify_fast(state)
+    if pending is None:
+        return state
+    text, confidence, reason = pending
+    if _SPECULATIVE and state.get("session_id"):
+        return _record(state, *_classify_speculative(state, text, confidence, reason))
+    return _record(state, *_classify_with_llm(text, confidence, reason))
+
+
+async def aclassify_intent(state: GraphState) -> GraphState:
+    """Async variant of classify_intent; the LLM call runs off the event loop."""
+    pending = _classify_fast(state)
+    if pending is None:
+        return state
+    text, confidence, reason = pending
+    if _SPECULATIVE and state.get("session_id"):
+        return _record(state, *_classify_speculative(state, text, confidence, reason))
+    decision = await asyncio.to_thread(_classify_with_llm, text, confidence, reason)
+    return _record(state, *decision)
+
+
+def _classify_fast(state: GraphState) -> tuple[str, float, str] | None:
+    """Apply overrides, commands and the parser.
+
+    Returns None when the decision is final (and recorded on the state);
+    otherwise (text, confidence, reason) for the LLM classifier.
+    """
+    ensure_history(state)
     text = state.get("input", "").strip()
     override = state.get("override_mode")
 
     # Handle explicit overrides
     if override in ("narration", "monitor"):
-        state["mode"] = override
-        meta = state.get("meta") or {}
-        meta.update({"router": {"confidence": 1.0, "reason": "override", "decided": override}})
-        state["meta"] = meta
-        return state
+        _record(state, override, 1.0, "override")
+        return None
 
     # Check for explicit commands
-    mode = "narration"  # default
     confidence = 0.6
     reason = "default"
 
-    if CMD_MONITOR.match(text):
-        mode, confidence, reason = "monitor", 1.0, "explicit_cmd"
-    elif CMD_NARRATE.match(text):
-        mode, confidence, reason = "narration", 1.0, "explicit_cmd"
-    elif parse_monitor_intent(text):
-        mode, confidence, reason = "monitor", 0.9, "parsed_intent"
-    else:
+    # One combined match for every command; monitor_node reuses the help flag
+    cmd = match_command(text)
+    if cmd == "help":
+        state["_help"] = True
+        _record(state, "monitor", 1.0, "help")
+    elif cmd == "mon":
+        _record(state, "monitor", 1.0, "explicit_cmd")
+    elif cmd == "nar":
+        _record(state, "narration", 1.0, "explicit_cmd")
+    elif cached_parse_monitor_intent(text):
+        _record(state, "monitor", 0.9, "parsed_intent")
+    elif (draft := confident_draft(text)) is not None:
+        # Local draft is confident enough; skip the LLM verification
+        _record(state, draft[0], draft[1], "draft")
+    elif (kw_mode := _keyword_prefilter(text)) is not None:
+        _record(state, kw_mode, 0.8, "keyword_prefilter")
+    elif _LLM_ROUTER_ENABLED:
         # Use LLM for classification
-        mode, confidence, reason = _classify_with_llm(text, confidence, reason)
+        return text, confidence, reason
+    else:
+        _record(state, "narration", confidence, reason)
+    return None
 
+
+def _keyword_prefilter(text: str) -> str | None:
+    """Return the mode with clearly more keyword hits, or None when ambiguous."""
+    lowered = text.lower()
+    words = set(_WORD.findall(lowered))
+    mon = len(words & _MONITOR_KWS) + sum(p in lowered for p in _MONITOR_PHRASES)
+    nar = len(words & _NARR_KWS)
+    if mon >= _PREFILTER_MIN_HITS and mon > nar:
+        return "monitor"
+    if nar >= _PREFILTER_MIN_HITS and nar > mon:
+        return "narration"
+    return None
+
+
+def _record(state: GraphState, mode: str, confidence: float, reason: str) -> GraphState:
+    """Record the routing decision on the state."""
     state["mode"] = mode
-    meta = state.get("meta") or {}
-    meta.update({"router": {"confidence": confidence, "reason": reason, "decided": mode}})
-    state["meta"] = meta
+    get_meta(state)["router"] = {"confidence": confidence, "reason": reason, "decided": mode}
     return state
 
 
@@ -54,32 +141,81 @@ def _classify_with_llm(
 ) -> tuple[str, float, str]:
     """Use LLM to classify intent when patterns don't match."""
     try:
-        llm = select_llm_from_env()
-        prompt = f'''Classify this user input as either "narration" or "monitor":
+        verdict = _llm_verdict(text, default_confidence)
+    except Exception:
+        return "narration", default_confidence, default_reason
+    return _accept_verdict(verdict, default_confidence, default_reason)
 
-Input: "{text}"
 
-- "narration": Creative storytelling, character interactions, world-building
-- "monitor": Operational commands, data queries, system management
+def _accept_verdict(
+    verdict: IntentVerdict, default_confidence: float, default_reason: str
+) -> tuple[str, float, str]:
+    """Use the LLM verdict when it beats the default confidence, else narration."""
+    lm_intent, lm_conf, lm_reason = verdict
+    if lm_conf >= default_confidence:
+        return lm_intent, lm_conf, f"llm:{lm_reason}"
+    return "narration", default_confidence, default_reason
 
-Respond with JSON: {{"intent": "narration|monitor", "confidence": 0.0-1.0, "reason": "brief explanation"}}'''
 
-        out = llm.complete(
-            system_prompt="You are a precise intent classifier. Return only valid JSON.",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            max_tokens=100,
-        )
+def _classify_speculative(
+    state: GraphState, text: str, default_confidence: float, default_reason: str
+) -> tuple[str, float, str]:
+    """Route now on the session's previous LLM verdict; classify this input in background.
 
-        data = json.loads(out) if isinstance(out, str) else {}
-        lm_intent = str(data.get("intent", "")).lower()
-        lm_conf = float(data.get("confidence", 0.0))
-        lm_reason = str(data.get("reason", ""))
+    Conversations tend to stay in one mode, so the last refined verdict is a good
+    prior. Its result warms the verdict cache and becomes the next turn's prior.
+    A verdict already cached for this input is used directly. Requires a session_id.
+    """
+    session = state["session_id"]
+    cached = _VERDICT_CACHE.get(_verdict_key(text))
+    if cached is not None:
+        return _accept_verdict(cached, default_confidence, default_reason)
 
-        if lm_intent in ("narration", "monitor") and lm_conf >= default_confidence:
-            return lm_intent, lm_conf, f"llm:{lm_reason}"
+    decision = ("narration", default_confidence, default_reason)
+    prev: Future | None = _REFINED.get(session)
+    if prev is not None and prev.done() and prev.exception() is None:
+        lm_intent, lm_conf, _ = prev.result()
+        if lm_conf >= default_confidence:
+            decision = (lm_intent, lm_conf, "speculative:prior")
 
-    except Exception:
-        pass
+    _REFINED.set(session, _REFINE_POOL.submit(_llm_verdict, text, default_confidence))
+    return decision
 
-    return "narration", default_confidence, default_reason
+
+def _llm_verdict(text: str, min_confidence: float) -> IntentVerdict:
+    """Ask the LLM for (intent, confidence, reason), cached on normalized input.
+
+    Only verdicts at/above ``min_confidence`` (those _accept_verdict takes) are
+    cached and logged for the draft classifier. Raises ValueError for unusable
+    verdicts so they are never cached.
+    """
+    text = text[:CLASSIFIER_INPUT_MAX_CHARS]
+    key = _verdict_key(text)
+    cached = _VERDICT_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    llm = cached_llm_from_env()
+    data = llm.complete_json(
+        system_prompt=INTENT_CLASSIFIER_SYSTEM_PROMPT,
+        messages=[{"role": "user", "content": f'Input: "{text}"'}],
+        schema=INTENT_SCHEMA,
+        temperature=0.0,
+        max_tokens=48,
+    )
+    verdict = decode_intent_verdict(data)
+    if verdict.confidence >= min_confidence:
+        record_verdict(text, verdict.intent)
+        _VERDICT_CACHE.set(key, verdict)
+    return verdict
+
+
+def _verdict_key(text: str) -> str:
+    """Verdict cache key: the classifier input, lowercased with whitespace collapsed."""
+    return _WS.sub(" ", text[:CLASSIFIER_INPUT_MAX_CHARS].lower())
+
+
+def clear_intent_cache() -> None:
+    """Drop cached LLM verdicts and session priors (tests, prompt changes)."""
+    _VERDICT_CACHE.clear()
+    _REFINED.clear()
@@ -5,11 +5,26 @@ from __future__ import annotations
 from core.engine.monitor_parser import MonitorIntent
 from core.engine.tools import query_tool
 
-from ..state import GraphState, append_message
-from .utils import commit_deltas
+from ..state import GraphState
+from .utils import commit_deltas, monitor_reply
 
 
-def handle_create_multiverse(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+def _named_line(row: dict) -> str:
+    """List line "- name (id)"; the name falls back to the id."""
+    id_ = row.get("id")
+    return f"- {row.get('name') or id_} ({id_})"
+
+
+def _story_line(row: dict) -> str:
+    id_ = row.get("id")
+    return (
+        f"- {row.get('title') or id_} (id={id_}, arc={row.get('arc_id') or '-'}, "
+        f"seq={row.get('sequence_index')})"
+    )
+
+
+@monitor_reply
+def handle_create_multiverse(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle creating a new multiverse."""
     new_mv = {
         "id": intent.id,
@@ -19,12 +34,11 @@ def handle_create_multiverse(state: GraphState, intent: MonitorIntent, ctx) -> G
     deltas = {"new_multiverse": new_mv, "_draft": f"Create multiverse {intent.name}"}
     res = commit_deltas(ctx, deltas)
     action_reply = f"Multiverso creado (modo={res.get('mode')})."
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_create_universe(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_create_universe(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle creating a new universe."""
     mv_id = intent.multiverse_id or state.get("multiverse_id")
     universe_id = state.get("universe_id")
@@ -43,43 +57,40 @@ def handle_create_universe(state: GraphState, intent: MonitorIntent, ctx) -> Gra
         },
     )
     action_reply = f"Universo creado (modo={res.get('mode')})."
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_save_fact(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_save_fact(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle saving a fact to the current scene/universe."""
     universe_id = state.get("universe_id")
     desc = (intent.description or "").strip()
     fact = {"description": desc or "(sin descripción)", "universe_id": universe_id}
-    if intent.scene_id or state.get("scene_id"):
-        fact["occurs_in"] = intent.scene_id or state.get("scene_id")
+    scene_id = intent.scene_id or state.get("scene_id")
+    if scene_id:
+        fact["occurs_in"] = scene_id
     res = commit_deltas(ctx, {"facts": [fact], "universe_id": universe_id, "_draft": desc[:120]})
     action_reply = f"Hecho guardado (modo={res.get('mode')})."
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_list_multiverses(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_list_multiverses(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle listing all available multiverses."""
     try:
         rows = query_tool(ctx, "list_multiverses") if ctx else []
         if not rows:
             action_reply = "No multiverses found."
         else:
-            lines = [f"- {r.get('name') or r.get('id')} ({r.get('id')})" for r in rows]
-            action_reply = "Multiverses:\n" + "\n".join(lines)
+            action_reply = "Multiverses:\n" + "\n".join(map(_named_line, rows))
     except Exception as e:
         action_reply = f"Error listing multiverses: {e}"
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_list_universes(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_list_universes(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle listing universes in a multiverse."""
     mv = intent.multiverse_id or state.get("multiverse_id")
     if not mv:
@@ -90,17 +101,15 @@ def handle_list_universes(state: GraphState, intent: MonitorIntent, ctx) -> Grap
             if not rows:
                 action_reply = f"No universes found in {mv}."
             else:
-                lines = [f"- {r.get('name') or r.get('id')} ({r.get('id')})" for r in rows]
-                action_reply = f"Universes in {mv}:\n" + "\n".join(lines)
+                action_reply = f"Universes in {mv}:\n" + "\n".join(map(_named_line, rows))
         except Exception as e:
             action_reply = f"Error listing universes: {e}"
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_list_stories(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_list_stories(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle listing stories in a universe."""
     uid = intent.universe_id or state.get("universe_id")
     if not uid:
@@ -111,14 +120,8 @@ def handle_list_stories(state: GraphState, intent: MonitorIntent, ctx) -> GraphS
             if not rows:
                 action_reply = f"No stories found in {uid}."
             else:
-                lines = [
-                    f"- {r.get('title') or r.get('id')} (id={r.get('id')}, arc={r.get('arc_id') or '-'}, seq={r.get('sequence_index')})"
-                    for r in rows
-                ]
-                action_reply = f"Stories in {uid}:\n" + "\n".join(lines)
+                action_reply = f"Stories in {uid}:\n" + "\n".join(map(_story_line, rows))
         except Exception as e:
             action_reply = f"Error listing stories: {e}"
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
@@ -5,10 +5,21 @@ from __future__ import annotations
 from core.engine.monitor_parser import MonitorIntent
 from core.engine.tools import query_tool
 
-from ..state import GraphState, append_message
+from ..state import GraphState
+from .utils import monitor_reply
 
 
-def handle_show_entity_info(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+def _entity_by_name(ctx, uid: str, name: str) -> dict | None:
+    """Look up an entity by name through the shared read cache.
+
+    The query matches names case-insensitively, so the name is lowercased first:
+    "Rogue" and "rogue" then share one cache entry instead of two round trips.
+    """
+    return query_tool(ctx, "entity_by_name_in_universe", universe_id=uid, name=name.lower())
+
+
+@monitor_reply
+def handle_show_entity_info(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle showing detailed information about an entity."""
     uid = intent.universe_id or state.get("universe_id")
     name = (intent.entity_name or "").strip()
@@ -16,11 +27,7 @@ def handle_show_entity_info(state: GraphState, intent: MonitorIntent, ctx) -> Gr
         action_reply = "Please provide an entity name and universe (e.g., show 'Tony Stark' in universe u:demo)."
     else:
         try:
-            ent = (
-                query_tool(ctx, "entity_by_name_in_universe", universe_id=uid, name=name)
-                if ctx
-                else None
-            )
+            ent = _entity_by_name(ctx, uid, name) if ctx else None
             if not ent:
                 action_reply = f"Entity '{name}' not found in {uid}."
             else:
@@ -30,21 +37,18 @@ def handle_show_entity_info(state: GraphState, intent: MonitorIntent, ctx) -> Gr
                 if scenes:
                     info.append("Appears in scenes:")
                     info.extend(
-                        [
-                            f"  - story={s.get('story_id')}, scene={s.get('scene_id')}, seq={s.get('sequence_index')}"
-                            for s in scenes
-                        ]
+                        f"  - story={s.get('story_id')}, scene={s.get('scene_id')}, seq={s.get('sequence_index')}"
+                        for s in scenes
                     )
                 action_reply = "\n".join(info)
         except Exception as e:
             action_reply = f"Error fetching entity info: {e}"
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_list_enemies(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_list_enemies(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle listing enemies of a character in a universe."""
     uid = intent.universe_id or state.get("universe_id")
     name = (intent.entity_name or "").strip()
@@ -52,11 +56,7 @@ def handle_list_enemies(state: GraphState, intent: MonitorIntent, ctx) -> GraphS
         action_reply = "Please provide a character name and universe (e.g., enemies of 'Rogue' in universe u:demo)."
     else:
         try:
-            ent = (
-                query_tool(ctx, "entity_by_name_in_universe", universe_id=uid, name=name)
-                if ctx
-                else None
-            )
+            ent = _entity_by_name(ctx, uid, name) if ctx else None
             if not ent:
                 action_reply = f"Entity '{name}' not found in {uid}."
             else:
@@ -66,21 +66,20 @@ def handle_list_enemies(state: GraphState, intent: MonitorIntent, ctx) -> GraphS
                     if ctx
                     else []
                 )
-                lines = [f"- {r.get('name')} ({r.get('id')})" for r in rows] if rows else []
                 action_reply = (
-                    (f"Enemies in {uid}:\n" + "\n".join(lines))
-                    if lines
+                    f"Enemies in {uid}:\n"
+                    + "\n".join(f"- {r.get('name')} ({r.get('id')})" for r in rows)
+                    if rows
                     else f"No enemies found in {uid}."
                 )
         except Exception as e:
             action_reply = f"Error listing enemies: {e}"
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_last_seen(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_last_seen(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle finding when a character was last seen."""
     uid = intent.universe_id or state.get("universe_id")
     name = (intent.entity_name or "").strip()
@@ -88,29 +87,45 @@ def handle_last_seen(state: GraphState, intent: MonitorIntent, ctx) -> GraphStat
         action_reply = "Please provide a character name and universe (e.g., last time they saw 'Deadpool' in universe u:demo)."
     else:
         try:
-            ent = (
-                query_tool(ctx, "entity_by_name_in_universe", universe_id=uid, name=name)
-                if ctx
-                else None
-            )
-            if not ent:
+            last = _last_seen_scene(ctx, uid, name) if ctx else None
+            if last is None:
                 action_reply = f"Entity '{name}' not found in {uid}."
+            elif not last:
+                action_reply = f"No appearances found for {name}."
             else:
-                # Find scenes for entity then pick the highest sequence index per story
-                scenes = query_tool(ctx, "scenes_for_entity", entity_id=ent["id"]) if ctx else []
-                if not scenes:
-                    action_reply = f"No appearances found for {name}."
-                else:
-                    # Simple sort by (story_id, sequence_index)
-                    scenes_sorted = sorted(
-                        scenes,
-                        key=lambda s: (s.get("story_id"), s.get("sequence_index") or -1),
-                    )
-                    last = scenes_sorted[-1]
-                    action_reply = f"Last seen in story={last.get('story_id')}, scene={last.get('scene_id')} (seq={last.get('sequence_index')})."
+                action_reply = f"Last seen in story={last.get('story_id')}, scene={last.get('scene_id')} (seq={last.get('sequence_index')})."
         except Exception as e:
             action_reply = f"Error computing last seen: {e}"
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
+
+
+def _last_seen_scene(ctx, uid: str, name: str) -> dict | None:
+    """Latest scene row for the named entity; None if not found, {} if it never appears.
+
+    Uses the fused last_scene_for_entity_by_name query (one round trip) and falls
+    back to entity lookup + scenes_for_entity on query services that lack it.
+    """
+    try:
+        # entity_by_name_in_universe also matches through scenes, so no row means not found
+        return (
+            query_tool(ctx, "last_scene_for_entity_by_name", universe_id=uid, name=name.lower())
+            or None
+        )
+    except AttributeError:
+        pass
+
+    ent = _entity_by_name(ctx, uid, name)
+    if not ent:
+        return None
+    scenes = query_tool(ctx, "scenes_for_entity", entity_id=ent["id"])
+    if not scenes:
+        return {}
+    # Single pass for the latest (story_id, sequence_index); no sorted copy. Stays
+    # in Python: packing the dict rows into numpy arrays costs more than the scan
+    return max(scenes, key=_scene_order)
+
+
+def _scene_order(scene: dict) -> tuple[str, int]:
+    seq = scene.get("sequence_index")
+    return (scene.get("story_id") or "", -1 if seq is None else seq)
@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
+from functools import partial
+import logging
 import re
 
 from core.engine.attribute_extractor import distill_entity_attributes
 from core.engine.monitor_parser import MonitorIntent
+from core.utils.env import env_float
 
-from ..state import GraphState, append_message, gen_id
-from .utils import commit_deltas
+from ..constants import SCENE_PRIMER_PROMPT
+from ..monitor_actions import run_in_background
+from ..state import GraphState, generate_id, get_meta
+from .utils import commit_deltas, monitor_reply
 
+logger = logging.getLogger(__name__)
 
-def handle_retcon_entity(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+# Seconds the scene wizard waits for its primer so both land in one commit; the
+# default keeps the LLM off the reply's critical path
+PRIMER_WAIT_S = env_float("MONITOR_PRIMER_WAIT_S", 0.0)
+
+# Wizard title: nombre "..." / name "..." (or any single-quoted text). The keywords
+# are ASCII, so ASCII case folding suffices; quoted titles may still be any text.
+_TITLE_RE = re.compile(r"(?:nombre|name)\s+\"([^\"]+)\"|'([^']+)'", re.IGNORECASE | re.ASCII)
+
+
+@monitor_reply
+def handle_retcon_entity(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle retconning (removing/changing) an entity."""
     uid = state.get("universe_id")
     name = (intent.entity_name or "").strip()
@@ -33,12 +50,11 @@ def handle_retcon_entity(state: GraphState, intent: MonitorIntent, ctx) -> Graph
         except Exception as e:
             action_reply = f"Error retconning entity: {e}"
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_seed_entities(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_seed_entities(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle seeding PCs or NPCs."""
     uid = state.get("universe_id")
     if not uid:
@@ -51,7 +67,7 @@ def handle_seed_entities(state: GraphState, intent: MonitorIntent, ctx) -> Graph
             # Assign IDs so we can link to the current scene if present
             new_entities = [
                 {
-                    "id": gen_id("entity"),
+                    "id": generate_id("entity"),
                     "name": n,
                     "type": intent.kind,
                     "universe_id": uid,
@@ -73,12 +89,11 @@ def handle_seed_entities(state: GraphState, intent: MonitorIntent, ctx) -> Graph
                 f"Seeded {len(new_entities)} {intent.kind or 'entity'}(s) (mode={res.get('mode')})."
             )
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_create_entity(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_create_entity(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle creating a new entity."""
     uid = state.get("universe_id")
     if not uid:
@@ -91,7 +106,7 @@ def handle_create_entity(state: GraphState, intent: MonitorIntent, ctx) -> Graph
             attrs = distill_entity_attributes(intent.description) if intent.description else {}
             if intent.entity_type:
                 attrs.setdefault("type", intent.entity_type)
-            e_id = gen_id("entity")
+            e_id = generate_id("entity")
             new_e = {
                 "id": e_id,
                 "name": intent.name,
@@ -111,27 +126,20 @@ def handle_create_entity(state: GraphState, intent: MonitorIntent, ctx) -> Graph
             res = commit_deltas(ctx, deltas)
             action_reply = f"Entity created (mode={res.get('mode')})."
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_wizard_setup_story(state: GraphState, text: str, ctx=None) -> GraphState:
+@monitor_reply
+def handle_wizard_setup_story(state: GraphState, text: str, ctx=None) -> str:
     """Handle wizard flow for setting up a story."""
-    wizard = (state.get("meta") or {}).get("wizard") or {}
+    wizard = get_meta(state).get("wizard") or {}
 
-    m = re.search(r"(?:nombre|name)\s+\"([^\"]+)\"|'([^']+)'", text, flags=re.IGNORECASE)
+    m = _TITLE_RE.search(text)
     title = (m.group(1) or m.group(2)) if m else None
     if not title:
-        append_message(
-            state,
-            "assistant",
-            'Por favor indica el nombre de la historia (p.ej. nombre "Prólogo").',
-        )
-        state["last_mode"] = "monitor"
-        return state
+        return 'Por favor indica el nombre de la historia (p.ej. nombre "Prólogo").'
 
-    st_id = gen_id("story")
+    st_id = generate_id("story")
     u_id = wizard.get("universe_id") or state.get("universe_id")
     new_story = {"id": st_id, "title": title, "universe_id": u_id}
     res = commit_deltas(
@@ -143,76 +151,91 @@ def handle_wizard_setup_story(state: GraphState, text: str, ctx=None) -> GraphSt
         },
     )
     # Move to scene setup
-    meta = state.get("meta") or {}
-    meta["wizard"] = {"flow": "setup_scene", "universe_id": u_id, "story_id": st_id}
-    state["meta"] = meta
-    append_message(
-        state,
-        "assistant",
-        f'Historia creada (modo={res.get("mode")}). Indica el nombre de la escena inicial (p.ej. nombre "Escena 1: Llegada").',
-    )
-    state["last_mode"] = "monitor"
-    return state
+    get_meta(state)["wizard"] = {"flow": "setup_scene", "universe_id": u_id, "story_id": st_id}
+    return f'Historia creada (modo={res.get("mode")}). Indica el nombre de la escena inicial (p.ej. nombre "Escena 1: Llegada").'
 
 
-def handle_wizard_setup_scene(state: GraphState, text: str, ctx=None) -> GraphState:
-    """Handle wizard flow for setting up a scene."""
-    from core.agents.narrator import narrator_agent
-    from core.generation.providers import select_llm_from_env
+def _generate_primer(title: str) -> str:
+    """Generate the opening beat for a new scene (runs on the background pool)."""
+    from core.agents.narrator import cached_narrator_agent
+    from core.generation.providers import cached_llm_from_env
 
-    wizard = (state.get("meta") or {}).get("wizard") or {}
+    agent = cached_narrator_agent(cached_llm_from_env())
+    return agent.act(
+        [
+            {
+                "role": "system",
+                "content": SCENE_PRIMER_PROMPT,
+            },
+            {
+                "role": "user",
+                "content": f"Escena: {title}. Presenta un gancho inmersivo.",
+            },
+        ]
+    )
 
-    m = re.search(r"(?:nombre|name)\s+\"([^\"]+)\"|'([^']+)'", text, flags=re.IGNORECASE)
-    title = (m.group(1) or m.group(2)) if m else None
-    if not title:
-        append_message(
-            state,
-            "assistant",
-            'Por favor indica el nombre de la escena (p.ej. nombre "Escena 1").',
-        )
-        state["last_mode"] = "monitor"
-        return state
 
-    sc_id = gen_id("scene")
-    story_id = wizard.get("story_id")
-    new_scene = {"id": sc_id, "title": title, "story_id": story_id}
-    res = commit_deltas(ctx, {"new_scene": new_scene, "_draft": f"Crear escena {title}"})
-    state["scene_id"] = sc_id
+def _primer_if_ready(job: Future | None) -> str | None:
+    """Return the primer if it arrives within PRIMER_WAIT_S, else None."""
+    if job is None:
+        return None
+    try:
+        return job.result(timeout=PRIMER_WAIT_S)
+    except Exception:  # still generating, or generation failed
+        return None
+
 
-    # Generate initial narrative and save as fact
+def _commit_primer(ctx, sc_id: str, title: str, job: Future) -> None:
+    """Record a late primer as its own Fact once generation finishes.
+
+    Runs as a done-callback on the background pool, so failures are logged and
+    otherwise ignored.
+    """
     try:
-        llm = select_llm_from_env()
-        agent = narrator_agent(llm)
-        primer = agent.act(
-            [
-                {
-                    "role": "system",
-                    "content": "Genera un inicio breve (3-5 frases) para la primera escena dada su premisa/título.",
-                },
-                {
-                    "role": "user",
-                    "content": f"Escena: {title}. Presenta un gancho inmersivo.",
-                },
-            ]
-        )
         commit_deltas(
             ctx,
             {
-                "facts": [{"description": primer, "occurs_in": sc_id}],
-                "_draft": primer[:120],
+                "facts": [{"description": job.result(), "occurs_in": sc_id}],
+                "_draft": f"Primer {title}",
             },
         )
-    except Exception:
-        pass
+    except Exception as e:
+        logger.debug("Scene primer for %s failed: %s", sc_id, e)
+
+
+@monitor_reply
+def handle_wizard_setup_scene(state: GraphState, text: str, ctx=None) -> str:
+    """Handle wizard flow for setting up a scene."""
+    wizard = get_meta(state).get("wizard") or {}
+
+    m = _TITLE_RE.search(text)
+    title = (m.group(1) or m.group(2)) if m else None
+    if not title:
+        return 'Por favor indica el nombre de la escena (p.ej. nombre "Escena 1").'
+
+    sc_id = generate_id("scene")
+    story_id = wizard.get("story_id")
+    new_scene = {"id": sc_id, "title": title, "story_id": story_id}
+    deltas: dict = {"new_scene": new_scene, "_draft": f"Crear escena {title}"}
+
+    # The primer is a nice-to-have generated in the background; when it is ready
+    # in time it rides in the scene's commit, otherwise it is recorded on its own.
+    # Without tools there is nowhere to record it, so it is not generated at all.
+    primer_job = run_in_background(_generate_primer, title) if ctx else None
+    primer = _primer_if_ready(primer_job)
+    if primer:
+        deltas["facts"] = [{"description": primer, "occurs_in": sc_id}]
+    res = commit_deltas(ctx, deltas)
+    if primer_job is not None and not primer:
+        primer_job.add_done_callback(partial(_commit_primer, ctx, sc_id, title))
+    state["scene_id"] = sc_id
 
     # Close wizard
-    meta = state.get("meta") or {}
-    meta.pop("wizard", None)
-    state["meta"] = meta
-    append_message(
-        state,
-        "assistant",
-        f"Escena creada (modo={res.get('mode')}). Narrativa inicial lista. Puedes continuar con /narrar para seguir la historia.",
-    )
-    state["last_mode"] = "monitor"
-    return state
+    get_meta(state).pop("wizard", None)
+    if primer:
+        primer_note = "La narrativa inicial ya está registrada. "
+    elif primer_job is not None:
+        primer_note = "La narrativa inicial se está generando. "
+    else:
+        primer_note = ""
+    return f"Escena creada (modo={res.get('mode')}). {primer_note}Puedes continuar con /narrar para seguir la historia."
@@ -4,48 +4,51 @@ from __future__ import annotations
 
 from core.engine.monitor_parser import MonitorIntent
 from core.engine.tools import query_tool
+from core.persistence.queries.facts import TRANSCRIPT_PREFIX
 
-from ..state import GraphState, append_message, gen_id
-from .utils import auto_flush_if_needed, commit_deltas
+from ..state import GraphState, generate_id, recent_messages
+from .utils import auto_flush_if_needed, commit_deltas, monitor_reply
 
+# Transcripts keep only the dialogue, with each message capped to bound the fact size
+_TRANSCRIPT_ROLES = frozenset(("user", "assistant"))
+_TRANSCRIPT_MSG_MAX_CHARS = 4000
 
-def handle_end_scene(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
-    """Handle ending current scene and starting the next one."""
-    # Auto-persist policy: at scene boundaries, commit staged work in copilot
+
+def _flush_at_boundary(ctx) -> str:
+    """Auto-persist staged work at a scene boundary (copilot); returns a reply prefix."""
     flush_res = auto_flush_if_needed(ctx, "end_scene")
-    persisted_msg = ""
     if isinstance(flush_res, dict) and flush_res.get("ok"):
-        persisted_msg = "Staged changes persisted. "
-    elif isinstance(flush_res, dict):
-        persisted_msg = "Could not persist staged changes now. "
-    else:
-        persisted_msg = ""
+        return "Staged changes persisted. "
+    if isinstance(flush_res, dict):
+        return "Could not persist staged changes now. "
+    return ""
+
 
+@monitor_reply
+def handle_end_scene(state: GraphState, intent: MonitorIntent, ctx) -> str:
+    """Handle ending current scene and starting the next one."""
     # Start next scene in the same story
     story_id = state.get("story_id")
     if not story_id:
-        append_message(
-            state,
-            "assistant",
-            persisted_msg + "Scene ended. No active story to start the next scene.",
-        )
-        state["last_mode"] = "monitor"
-        return state
+        return _flush_at_boundary(ctx) + "Scene ended. No active story to start the next scene."
 
     next_seq = None
     try:
         if ctx:
             scenes = query_tool(ctx, "scenes_in_story", story_id=story_id) or []
             # compute next sequence index; fallback: count + 1
-            seqs = [s.get("sequence_index") for s in scenes if s.get("sequence_index") is not None]
-            if seqs:
-                next_seq = (max(seqs) or 0) + 1
+            last_seq = max(
+                (s["sequence_index"] for s in scenes if s.get("sequence_index") is not None),
+                default=None,
+            )
+            if last_seq is not None:
+                next_seq = (last_seq or 0) + 1
             else:
                 next_seq = len(scenes) + 1
     except Exception:
         next_seq = None
 
-    new_sc_id = gen_id("scene")
+    new_sc_id = generate_id("scene")
     deltas = {
         "new_scene": {
             "id": new_sc_id,
@@ -56,36 +59,40 @@ def handle_end_scene(state: GraphState, intent: MonitorIntent, ctx) -> GraphStat
         "_draft": f"Start Scene {next_seq or ''}".strip(),
     }
     res = commit_deltas(ctx, deltas)
+    # Staged before the boundary flush so the next scene is persisted in the same batch
+    persisted_msg = _flush_at_boundary(ctx)
     state["scene_id"] = new_sc_id
     msg = (
         f"Scene ended. {persisted_msg}Started next scene (mode={res.get('mode')}). id={new_sc_id}"
         + (f", seq={next_seq}. " if next_seq else ". ")
         + "Handing off to the narrator to decide the intro and cast."
     )
-    append_message(state, "assistant", msg)
     # Nudge the router to go to narration on the next turn
     state["override_mode"] = "narration"
-    state["last_mode"] = "monitor"
-    return state
+    return msg
 
 
-def handle_add_scene(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+def _participant_ids(ctx, uid: str | None, names: list[str] | None) -> list[str]:
+    """Resolve participant names to entity ids with one batched lookup."""
+    if not (ctx and names and uid):
+        return []
+    try:
+        found = query_tool(ctx, "entities_by_names_in_universe", universe_id=uid, names=names) or {}
+    except Exception:
+        return []
+    return [found[n]["id"] for n in names if n in found]
+
+
+@monitor_reply
+def handle_add_scene(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle adding a new scene to a story."""
     uid = state.get("universe_id")
     story_id = intent.story_id or state.get("story_id")
     if not story_id:
         action_reply = "Please specify a story id (e.g., story st:...)."
     else:
-        sc_id = gen_id("scene")
-        participants_ids: list[str] = []
-        if ctx and intent.participants and uid:
-            for name in intent.participants:
-                try:
-                    ent = query_tool(ctx, "entity_by_name_in_universe", universe_id=uid, name=name)
-                    if ent:
-                        participants_ids.append(ent["id"])  # type: ignore[index]
-                except Exception:
-                    pass
+        sc_id = generate_id("scene")
+        participants_ids = _participant_ids(ctx, uid, intent.participants)
         deltas = {
             "new_scene": {
                 "id": sc_id,
@@ -106,27 +113,18 @@ def handle_add_scene(state: GraphState, intent: MonitorIntent, ctx) -> GraphStat
         state["story_id"] = story_id
         action_reply = f"Scene created (mode={res.get('mode')}). id={sc_id}"
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_modify_last_scene(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_modify_last_scene(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle modifying the last scene in the session."""
     sc_id = state.get("scene_id")
     if not sc_id:
         action_reply = "No last scene in session. Provide scene_id or create a scene first."
     else:
         uid = state.get("universe_id")
-        participants_ids: list[str] = []
-        if ctx and intent.participants and uid:
-            for name in intent.participants:
-                try:
-                    ent = query_tool(ctx, "entity_by_name_in_universe", universe_id=uid, name=name)
-                    if ent:
-                        participants_ids.append(ent["id"])  # type: ignore[index]
-                except Exception:
-                    pass
+        participants_ids = _participant_ids(ctx, uid, intent.participants)
         facts = []
         if intent.description:
             facts.append({"description": intent.description, "occurs_in": sc_id})
@@ -142,23 +140,20 @@ def handle_modify_last_scene(state: GraphState, intent: MonitorIntent, ctx) -> G
         res = commit_deltas(ctx, deltas)
         action_reply = f"Scene updated (mode={res.get('mode')})."
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_save_conversation(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_save_conversation(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle saving current conversation as a transcript."""
     uid = state.get("universe_id")
     sc_id = state.get("scene_id")
-    msgs = state.get("messages") or []
-    # Build a compact transcript (last ~30 turns)
-    lines = []
-    for m in msgs[-60:]:
-        r = m.get("role")
-        if r in ("user", "assistant"):
-            lines.append(f"{r}: {m.get('content', '')}")
-    transcript = "\n".join(lines)
+    # Build a compact transcript (last ~30 turns, each message capped)
+    transcript = "\n".join(
+        f"{m['role']}: {(m.get('content') or '')[:_TRANSCRIPT_MSG_MAX_CHARS]}"
+        for m in recent_messages(state, 60)
+        if m.get("role") in _TRANSCRIPT_ROLES
+    )
     if not transcript.strip():
         action_reply = "No conversation to save."
     else:
@@ -167,7 +162,7 @@ def handle_save_conversation(state: GraphState, intent: MonitorIntent, ctx) -> G
             {
                 "facts": [
                     {
-                        "description": f"TRANSCRIPT\n{transcript}",
+                        "description": f"{TRANSCRIPT_PREFIX}{transcript}",
                         "universe_id": uid,
                         "occurs_in": sc_id,
                     }
@@ -177,37 +172,25 @@ def handle_save_conversation(state: GraphState, intent: MonitorIntent, ctx) -> G
         )
         action_reply = f"Conversation saved (mode={res.get('mode')})."
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
 
 
-def handle_show_conversation(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_show_conversation(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle showing saved conversation transcript."""
-    # MVP: retrieve transcript fact(s) for current scene; if none, try universe-level
+    # Newest transcript of the current scene, else of the story; one filtered query
     sc_id = state.get("scene_id")
+    story_id = state.get("story_id")
     try:
-        facts = []
-        if ctx and sc_id:
-            facts = query_tool(ctx, "facts_for_scene", scene_id=sc_id) or []
-        if not facts and ctx and state.get("story_id"):
-            facts = query_tool(ctx, "facts_for_story", story_id=state.get("story_id")) or []
-        # filter transcript facts
-        transcripts = [
-            f
-            for f in (facts or [])
-            if isinstance(f.get("description"), str)
-            and f.get("description", "").startswith("TRANSCRIPT\n")
-        ]
-        if transcripts:
-            latest = transcripts[-1]
-            content = latest.get("description", "")[len("TRANSCRIPT\n") :]
+        latest = None
+        if ctx and (sc_id or story_id):
+            latest = query_tool(ctx, "latest_transcript_fact", scene_id=sc_id, story_id=story_id)
+        if latest:
+            content = (latest.get("description") or "")[len(TRANSCRIPT_PREFIX) :]
             action_reply = content or "(empty transcript)"
         else:
             action_reply = "No transcript found for the current scene/story."
     except Exception as e:
         action_reply = f"Error fetching transcript: {e}"
 
-    append_message(state, "assistant", action_reply)
-    state["last_mode"] = "monitor"
-    return state
+    return action_reply
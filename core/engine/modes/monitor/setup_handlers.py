@@ -2,24 +2,31 @@
 
 from __future__ import annotations
 
-from core.agents.narrator import narrator_agent
+import logging
+
+from core.agents.narrator import cached_narrator_agent
 from core.engine.monitor_parser import MonitorIntent
-from core.generation.providers import select_llm_from_env
+from core.generation.providers import cached_llm_from_env
 
-from ..state import GraphState, append_message, generate_id
+from ..constants import INTRO_BEAT_PROMPT
+from ..monitor_actions import run_in_background
+from ..state import GraphState, generate_id, get_wizard
 from .utils import (
     clear_wizard_state,
     commit_deltas,
-    get_wizard_state,
+    monitor_reply,
     update_wizard_state,
 )
 
+logger = logging.getLogger(__name__)
+
 
-def handle_start_story(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_start_story(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle the start_story action to create a complete story scaffolding."""
     # Gather topics/interests and optional names
-    w = dict(get_wizard_state(state))
-    w.update({"flow": "gm_onboarding"})
+    w = get_wizard(state)
+    w["flow"] = "gm_onboarding"
     if intent.topics:
         w["topics"] = intent.topics
     if intent.interests:
@@ -30,7 +37,6 @@ def handle_start_story(state: GraphState, intent: MonitorIntent, ctx) -> GraphSt
         w["universe_name"] = intent.name
     if intent.description:
         w["story_title"] = intent.description
-    update_wizard_state(state, w)
 
     # Ask for missing bits
     missing = []
@@ -39,13 +45,7 @@ def handle_start_story(state: GraphState, intent: MonitorIntent, ctx) -> GraphSt
     if not w.get("story_title"):
         missing.append('story title (e.g., story "Night Shift")')
     if missing:
-        append_message(
-            state,
-            "assistant",
-            "To start your story, please provide: " + ", ".join(missing) + ".",
-        )
-        state["last_mode"] = "monitor"
-        return state
+        return "To start your story, please provide: " + ", ".join(missing) + "."
 
     # Create scaffolding: multiverse, universe, arc, story, initial scene
     mv_id = state.get("multiverse_id") or generate_id("multiverse")
@@ -80,17 +80,36 @@ def handle_start_story(state: GraphState, intent: MonitorIntent, ctx) -> GraphSt
         "_draft": f"Start GM story: {w.get('story_title')}",
     }
     res = commit_deltas(ctx, deltas)
+    # The intro beat is generated and recorded off the critical path
+    intro_job = run_in_background(_record_intro_beat, ctx, dict(w), sc_id, uni_id) if ctx else None
+
+    # Save session context and inform user
+    state["multiverse_id"] = mv_id
+    state["universe_id"] = uni_id
+    state["story_id"] = st_id
+    state["scene_id"] = sc_id
+
+    # Clear wizard to avoid loops
+    clear_wizard_state(state)
+
+    intro_note = "The intro is being written; you" if intro_job is not None else "You"
+    return f"Story created (mode={res.get('mode')}). {intro_note} can /narrate to continue."
+
 
-    # Generate an intro beat and persist as Fact
+def _record_intro_beat(ctx, w: dict, sc_id: str, uni_id: str) -> None:
+    """Generate the story's intro beat and record it as a Fact of the first scene.
+
+    Runs on the background pool after the story was committed, so failures are
+    logged and otherwise ignored.
+    """
     try:
-        llm = select_llm_from_env()
-        agent = narrator_agent(llm)
+        agent = cached_narrator_agent(cached_llm_from_env())
         topics_text = ", ".join(w.get("topics") or [])
         primer = agent.act(
             [
                 {
                     "role": "system",
-                    "content": "You are the GM. Write a short intro beat (3-5 sentences) based on the given topics and interests. Keep it engaging and concise.",
+                    "content": INTRO_BEAT_PROMPT,
                 },
                 {
                     "role": "user",
@@ -102,34 +121,18 @@ def handle_start_story(state: GraphState, intent: MonitorIntent, ctx) -> GraphSt
             ctx,
             {
                 "facts": [{"description": primer, "occurs_in": sc_id, "universe_id": uni_id}],
-                "_draft": primer[:120],
+                "_draft": "Intro beat",
             },
         )
-    except Exception:
-        pass
-
-    # Save session context and inform user
-    state["multiverse_id"] = mv_id
-    state["universe_id"] = uni_id
-    state["story_id"] = st_id
-    state["scene_id"] = sc_id
+    except Exception as e:
+        logger.debug("Intro beat for %s failed: %s", sc_id, e)
 
-    # Clear wizard to avoid loops
-    clear_wizard_state(state)
-
-    append_message(
-        state,
-        "assistant",
-        f"Story created (mode={res.get('mode')}). You can now /narrate to continue from the intro.",
-    )
-    state["last_mode"] = "monitor"
-    return state
 
-
-def handle_setup_universe(state: GraphState, intent: MonitorIntent, ctx) -> GraphState:
+@monitor_reply
+def handle_setup_universe(state: GraphState, intent: MonitorIntent, ctx) -> str:
     """Handle the setup_universe action for step-by-step universe creation."""
     # Estado del wizard en meta.wizard
-    w = dict(get_wizard_state(state))
+    w = get_wizard(state)
     w.setdefault("flow", "setup_universe")
     if intent.id:
         w["universe_id"] = intent.id
@@ -147,14 +150,7 @@ def handle_setup_universe(state: GraphState, intent: MonitorIntent, ctx) -> Grap
 
     # Si faltan datos, pedirlos
     if missing:
-        update_wizard_state(state, w)
-        append_message(
-            state,
-            "assistant",
-            "Configurar universo: por favor indica " + ", ".join(missing) + ".",
-        )
-        state["last_mode"] = "monitor"
-        return state
+        return "Configurar universo: por favor indica " + ", ".join(missing) + "."
 
     # Tenemos suficientes datos → crear universo
     mv_id = w.get("multiverse_id") or state.get("multiverse_id")
@@ -167,10 +163,4 @@ def handle_setup_universe(state: GraphState, intent: MonitorIntent, ctx) -> Grap
     # Continuar wizard: crear historia
     update_wizard_state(state, {"flow": "setup_story", "universe_id": uid})
     state["universe_id"] = uid
-    append_message(
-        state,
-        "assistant",
-        f'Universo configurado (modo={res.get("mode")}). Indica el nombre de la historia inicial (p.ej. nombre "Prólogo").',
-    )
-    state["last_mode"] = "monitor"
-    return state
+    return f'Universo configurado (modo={res.get("mode")}). Indica el nombre de la historia inicial (p.ej. nombre "Prólogo").'
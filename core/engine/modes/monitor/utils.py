@@ -2,15 +2,37 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import wraps
+import logging
 from typing import TYPE_CHECKING, Any
 
 from core.engine.tools import ToolContext, recorder_tool
 
-from ..state import GraphState
+from ..monitor_actions import get_flusher
+from ..state import GraphState, append_message, get_meta
 
 if TYPE_CHECKING:
     pass
 
+logger = logging.getLogger(__name__)
+
+
+def monitor_reply(handler: Callable[..., str]) -> Callable[..., GraphState]:
+    """Turn a handler returning its reply text into one returning the updated state.
+
+    Appends the reply as the assistant message and marks the turn as monitor mode.
+    """
+
+    @wraps(handler)
+    def wrapper(state: GraphState, *args: Any, **kwargs: Any) -> GraphState:
+        reply = handler(state, *args, **kwargs)
+        append_message(state, "assistant", reply)
+        state["last_mode"] = "monitor"
+        return state
+
+    return wrapper
+
 
 def commit_deltas(ctx: ToolContext | None, deltas: dict[str, Any]) -> dict[str, Any]:
     """Commit deltas using the recorder tool."""
@@ -30,10 +52,7 @@ def auto_flush_if_needed(ctx: ToolContext | None, reason: str) -> dict[str, Any]
     """
     try:
         if ctx and getattr(ctx, "dry_run", True):
-            # Lazy import to avoid any circulars at module import time
-            from core.engine.orchestrator import flush_staging
-
-            return flush_staging(ctx)  # type: ignore[arg-type]
+            return get_flusher()(ctx)  # type: ignore[arg-type]
     except Exception:
         return {"ok": False, "error": "auto_flush_failed"}
     return None
@@ -41,18 +60,14 @@ def auto_flush_if_needed(ctx: ToolContext | None, reason: str) -> dict[str, Any]
 
 def get_wizard_state(state: GraphState) -> dict[str, Any]:
     """Get the current wizard state from the GraphState."""
-    return (state.get("meta") or {}).get("wizard") or {}
+    return get_meta(state).get("wizard") or {}
 
 
 def update_wizard_state(state: GraphState, wizard_data: dict[str, Any]) -> None:
     """Update the wizard state in the GraphState."""
-    meta = state.get("meta") or {}
-    meta["wizard"] = wizard_data
-    state["meta"] = meta
+    get_meta(state)["wizard"] = wizard_data
 
 
 def clear_wizard_state(state: GraphState) -> None:
     """Clear the wizard state from the GraphState."""
-    meta = state.get("meta") or {}
-    meta.pop("wizard", None)
-    state["meta"] = meta
+    get_meta(state).pop("wizard", None)
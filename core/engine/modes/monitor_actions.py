@@ -2,11 +2,52 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+import threading
+from typing import Any
+
 from core.engine.tools import ToolContext, recorder_tool
-from core.generation.interfaces.llm import Message
-from core.generation.providers import select_llm_from_env
+from core.generation.circuit_breaker import CircuitBreaker
+from core.generation.interfaces.llm import Message, collect_stream
+from core.generation.providers import cached_llm_from_env
+
+from . import response_cache
+from .constants import LLM_CONTEXT_TURNS, MONITOR_SYSTEM_PROMPT
+from .graph_state import GraphState, anchored_messages
+
+logger = logging.getLogger(__name__)
+
+# Shared by every Monitor fallback reply; opens after repeated provider failures
+_LLM_BREAKER = CircuitBreaker("monitor")
+_LLM_UNAVAILABLE_REPLY = (
+    "El asistente del Monitor no está disponible en este momento. "
+    "Los comandos (/help) siguen funcionando; intenta de nuevo en unos segundos."
+)
+
 
-from .graph_state import GraphState
+# Off-critical-path work (intro beats, scene primers) for the live and modular
+# monitor handlers: the turn's reply does not wait for it
+_BACKGROUND = ThreadPoolExecutor(max_workers=4, thread_name_prefix="monitor-bg")
+# Queued plus running jobs for the whole process; beyond this, new jobs are dropped
+# so a burst of wizard turns cannot pile up LLM calls behind a slow provider
+_BACKGROUND_SLOTS = threading.BoundedSemaphore(16)
+
+
+def run_in_background(fn: Callable[..., Any], *args: Any) -> Future | None:
+    """Run fn(*args) on the shared background pool; errors stay in the future.
+
+    Returns None (and skips fn) when the pool already has too many pending jobs.
+    """
+    # Release the semaphore that was acquired, even if the global is rebound meanwhile
+    slots = _BACKGROUND_SLOTS
+    if not slots.acquire(blocking=False):
+        logger.warning("Background pool saturated; skipping %s", getattr(fn, "__name__", fn))
+        return None
+    future = _BACKGROUND.submit(fn, *args)
+    future.add_done_callback(lambda _f: slots.release())
+    return future
 
 
 def commit_deltas(state: GraphState, deltas: dict) -> dict:
@@ -21,16 +62,30 @@ def commit_deltas(state: GraphState, deltas: dict) -> dict:
     )
 
 
+_flush_staging: Callable[..., Any] | None = None
+
+
+def get_flusher() -> Callable[..., Any]:
+    """Resolve orchestrator.flush_staging once, on first use.
+
+    Not a module-level import: the orchestrator package pulls in the engine
+    backends, live tool builder and persistence layer (~40 modules).
+    """
+    global _flush_staging
+    if _flush_staging is None:
+        from core.engine.orchestrator import flush_staging
+
+        _flush_staging = flush_staging
+    return _flush_staging
+
+
 def auto_flush_if_needed(state: GraphState, reason: str) -> dict | None:
     """Auto-flush staged changes at safe boundaries if in dry_run mode."""
     ctx: ToolContext | None = state.get("tools")  # type: ignore[assignment]
 
     try:
         if ctx and getattr(ctx, "dry_run", True):
-            # Lazy import to avoid circulars
-            from core.engine.orchestrator import flush_staging
-
-            return flush_staging(ctx)  # type: ignore[arg-type]
+            return get_flusher()(ctx)  # type: ignore[arg-type]
     except Exception:
         return {"ok": False, "error": "auto_flush_failed"}
 
@@ -39,17 +94,41 @@ def auto_flush_if_needed(state: GraphState, reason: str) -> dict | None:
 
 def generate_llm_response(state: GraphState, text: str) -> str:
     """Generate a default LLM response for operational queries."""
-    llm = select_llm_from_env()
+    llm = cached_llm_from_env()
+    msgs: list[Message] = anchored_messages(state, LLM_CONTEXT_TURNS - 1)
+    msgs.append({"role": "user", "content": text})
+
+    # Opt-in: a repeated ask in the same session and conversation reuses the answer
+    scope = response_cache.scope_for(state.get("session_id"), state.get("universe_id"))
+    embedder = getattr(state.get("tools"), "embedder", None)
+    cached = response_cache.lookup(scope, MONITOR_SYSTEM_PROMPT, msgs, embedder)
+    if cached is not None:
+        return cached
+
+    kwargs = {"system_prompt": MONITOR_SYSTEM_PROMPT, "temperature": 0.2, "max_tokens": 350}
+    if not _LLM_BREAKER.allow():
+        return _LLM_UNAVAILABLE_REPLY
+    stream_cb = state.get("stream_cb")
+    sent: list[str] = []
+
+    def _emit(chunk: str) -> None:
+        sent.append(chunk)
+        stream_cb(chunk)
 
-    system_prompt = (
-        "Eres el Monitor, un asistente operacional. Responde breve, preciso y accionable. "
-        "No escribas narrativa. Si la petición requiere ejecutar acciones reales "
-        "(crear/actualizar/consultar universos, multiversos, datos), "
-        "propón un plan de 2-3 pasos y confirma los datos faltantes."
-    )
-
-    msgs: list[Message] = (state.get("messages") or []) + [{"role": "user", "content": text}]
-
-    return llm.complete(
-        system_prompt=system_prompt, messages=msgs[-8:], temperature=0.2, max_tokens=350
-    )
+    try:
+        if stream_cb:
+            reply = collect_stream(llm.stream(messages=msgs, **kwargs), _emit)
+        else:
+            reply = llm.complete(messages=msgs, **kwargs)
+    except Exception as e:  # provider/network failure
+        logger.warning("Monitor LLM call failed: %s", e)
+        _LLM_BREAKER.record_failure(e)
+        if not sent:
+            return _LLM_UNAVAILABLE_REPLY
+        # The client already has part of the reply; keep history in step with it
+        tail = f"\n\n{_LLM_UNAVAILABLE_REPLY}"
+        stream_cb(tail)
+        return "".join(sent) + tail
+    _LLM_BREAKER.record_success()
+    response_cache.store(scope, MONITOR_SYSTEM_PROMPT, msgs, reply, embedder)
+    return reply
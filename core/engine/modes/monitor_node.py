@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-from core.engine.monitor_parser import parse_monitor_intent
+import asyncio
 
-from .constants import CMD_HELP, HELP_TEXT
-from .graph_state import GraphState, append_message
+from core.engine.monitor_parser import cached_parse_monitor_intent, parse_wizard_reply
+
+from .constants import HELP_TEXT, match_command
+from .graph_state import GraphState, append_message, get_meta
 from .monitor_actions import commit_deltas, generate_llm_response
 from .wizard_flows import handle_setup_universe_wizard, handle_start_story_wizard
 
+# Multi-turn wizards, keyed by the intent action that starts or continues them
+_WIZARD_HANDLERS = {
+    "start_story": handle_start_story_wizard,
+    "setup_universe": handle_setup_universe_wizard,
+}
+
 
 def monitor_node(state: GraphState) -> GraphState:
     """Respond as Monitor (operational mode).
@@ -18,15 +26,26 @@ def monitor_node(state: GraphState) -> GraphState:
     text = state.get("input", "").strip()
 
     # Handle help requests
-    if state.get("_help") or CMD_HELP.match(text):
+    if state.pop("_help", False) or match_command(text) == "help":
         append_message(state, "assistant", HELP_TEXT)
         state["last_mode"] = "monitor"
         return state
 
-    # Parse operational intent
-    intent = parse_monitor_intent(text)
+    # Parse operational intent; plain replies to a wizard prompt only need that
+    # wizard's fields, so they skip the full parser unless they carry none of them
+    wizard = get_meta(state).get("wizard") or {}
+    intent = None
+    if wizard.get("needs") and not text.startswith(("/", "@")):
+        intent = parse_wizard_reply(wizard.get("flow"), text)
+    if intent is None:
+        intent = cached_parse_monitor_intent(text)
     action_reply: str | None = None
 
+    wizard_handler = _WIZARD_HANDLERS.get(intent.action) if intent else None
+    if wizard_handler is not None:
+        # Wizards append their own reply; no LLM fallback for this turn
+        return wizard_handler(state, intent)
+
     if intent:
         action_reply = _handle_intent(state, intent)
 
@@ -40,24 +59,15 @@ def monitor_node(state: GraphState) -> GraphState:
     return state
 
 
-def _handle_intent(state: GraphState, intent: Any) -> str | None:
-    """Handle specific parsed intents."""
-    if intent.action == "start_story":
-        handle_start_story_wizard(state, intent)
-        return None  # Wizard handles the response
-
-    if intent.action == "setup_universe":
-        handle_setup_universe_wizard(state, intent)
-        return None  # Wizard handles the response
+async def amonitor_node(state: GraphState) -> GraphState:
+    """Async variant of monitor_node; blocking commits/LLM calls run in a worker thread."""
+    return await asyncio.to_thread(monitor_node, state)
 
-    if intent.action == "create_multiverse":
-        return _create_multiverse(state, intent)
 
-    if intent.action == "create_universe":
-        return _create_universe(state, intent)
-
-    # Add more intent handlers as needed
-    return None
+def _handle_intent(state: GraphState, intent: Any) -> str | None:
+    """Handle specific parsed intents; None when the action has no handler."""
+    handler = _ACTION_HANDLERS.get(intent.action)
+    return handler(state, intent) if handler is not None else None
 
 
 def _create_multiverse(state: GraphState, intent: Any) -> str:
@@ -96,3 +106,10 @@ def _create_universe(state: GraphState, intent: Any) -> str:
     )
 
     return f"Universo creado (modo={res.get('mode')})."
+
+
+# One-shot actions that return a reply, keyed by intent action
+_ACTION_HANDLERS = {
+    "create_multiverse": _create_multiverse,
+    "create_universe": _create_universe,
+}
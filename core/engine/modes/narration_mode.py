@@ -2,25 +2,25 @@
 
 from __future__ import annotations
 
-from core.agents.narrator import narrator_agent
-from core.generation.interfaces.llm import Message
-from core.generation.providers import select_llm_from_env
+from core.agents.narrator import cached_narrator_agent
+from core.generation.interfaces.llm import Message, collect_stream
+from core.generation.providers import cached_llm_from_env
 
-from .state import GraphState, append_message
+from .constants import LLM_CONTEXT_TURNS, NARRATOR_CONTEXT_TMPL
+from .state import GraphState, anchored_messages, append_message
 
 
 def narrator_node(state: GraphState) -> GraphState:
     """Responde como Narrador (diegético)."""
-    llm = select_llm_from_env()
-    agent = narrator_agent(llm)
+    llm = cached_llm_from_env()
+    agent = cached_narrator_agent(llm)
     universe = state.get("universe_id") or "default"
-    # Contexto breve como system si se quiere enriquecer en siguientes iteraciones
-    system_context = f"Universo actual: {universe}. Mantén tono diegético, conciso."
-    msgs: list[Message] = list(state.get("messages") or [])
-    if system_context:
-        msgs.append({"role": "system", "content": system_context})
+    # Contexto estable primero (prefijo cacheable), luego historial reciente y el input
+    msgs: list[Message] = [{"role": "system", "content": NARRATOR_CONTEXT_TMPL(universe=universe)}]
+    msgs.extend(anchored_messages(state, LLM_CONTEXT_TURNS - 2))
     msgs.append({"role": "user", "content": state.get("input", "")})
-    reply = agent.act(msgs[-8:])
+    stream_cb = state.get("stream_cb")
+    reply = collect_stream(agent.stream(msgs), stream_cb) if stream_cb else agent.act(msgs)
     append_message(state, "assistant", reply)
     state["last_mode"] = "narration"
     return state
@@ -2,32 +2,63 @@
 
 from __future__ import annotations
 
-from core.agents.narrator import narrator_agent
-from core.generation.interfaces.llm import Message
-from core.generation.providers import select_llm_from_env
+import asyncio
 
-from .graph_state import GraphState, append_message
+from core.agents.narrator import cached_narrator_agent
+from core.engine.librarian import LibrarianService
+from core.generation.interfaces.llm import Message, collect_stream
+from core.generation.providers import cached_llm_from_env
+from core.utils.env import env_bool
+
+from .constants import LLM_CONTEXT_TURNS, NARRATOR_CONTEXT_TMPL
+from .graph_state import GraphState, anchored_messages, append_message
+
+# Set MONITOR_NARRATOR_BRIEF=1 to ground narration in a librarian brief of the scene
+NARRATOR_BRIEF = env_bool("MONITOR_NARRATOR_BRIEF", False)
+
+
+def _librarian(state: GraphState) -> LibrarianService | None:
+    query_service = getattr(state.get("tools"), "query_service", None)
+    if not (NARRATOR_BRIEF and query_service is not None and state.get("scene_id")):
+        return None
+    return LibrarianService(query_service)
+
+
+async def aprefetch_scene_brief(state: GraphState) -> str | None:
+    """Load the narrator's scene brief (None when disabled or without a scene)."""
+    librarian = _librarian(state)
+    return await librarian.scene_brief_async(state["scene_id"]) if librarian else None
 
 
 def narrator_node(state: GraphState) -> GraphState:
     """Respond as Narrator (creative/diegetic mode)."""
-    llm = select_llm_from_env()
-    agent = narrator_agent(llm)
+    llm = cached_llm_from_env()
+    agent = cached_narrator_agent(llm)
     universe = state.get("universe_id") or "default"
 
-    # Add context as system message
-    system_context = f"Universo actual: {universe}. Mantén tono diegético, conciso."
-    msgs: list[Message] = list(state.get("messages") or [])
-
-    if system_context:
-        msgs.append({"role": "system", "content": system_context})
+    # Brief prefetched by the async classify step, else loaded here; used once
+    brief = state.get("_librarian_brief")
+    if brief is None and (librarian := _librarian(state)) is not None:
+        brief = librarian.scene_brief(state["scene_id"])
+    state["_librarian_brief"] = None
 
+    # Stable context first, then the scene brief, recent history and the new input
+    msgs: list[Message] = [{"role": "system", "content": NARRATOR_CONTEXT_TMPL(universe=universe)}]
+    if brief:
+        msgs.append({"role": "system", "content": brief})
+    msgs.extend(anchored_messages(state, LLM_CONTEXT_TURNS - 2))
     msgs.append({"role": "user", "content": state.get("input", "")})
 
-    # Generate response using last 8 messages for context
-    reply = agent.act(msgs[-8:])
+    # Generate response using the last LLM_CONTEXT_TURNS messages for context
+    stream_cb = state.get("stream_cb")
+    reply = collect_stream(agent.stream(msgs), stream_cb) if stream_cb else agent.act(msgs)
 
     append_message(state, "assistant", reply)
     state["last_mode"] = "narration"
 
     return state
+
+
+async def anarrator_node(state: GraphState) -> GraphState:
+    """Async variant of narrator_node; the blocking LLM call runs in a worker thread."""
+    return await asyncio.to_thread(narrator_node, state)
@@ -0,0 +1,140 @@
+"""Reply cache for the Monitor's free-form LLM answers (opt-in).
+
+Repeated asks ("help me plan...") are answered from memory instead of a new LLM
+round trip. Entries are scoped to one session/universe and keyed on a digest of
+every message sent to the LLM, so a reply is only reused for the same
+conversation. When the tools carry an embedder (``ToolContext.embedder``), a
+near-duplicate final ask after the same history is matched by cosine similarity.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Sequence
+import hashlib
+import math
+import re
+import threading
+import time
+
+from core.engine.cache import ReadThroughCache
+from core.generation.interfaces.llm import Message
+from core.utils.env import env_bool, env_float
+
+Embedder = Callable[[str], Sequence[float]]
+
+# Set MONITOR_RESPONSE_CACHE=1 to reuse replies to repeated asks within a session
+ENABLED = env_bool("MONITOR_RESPONSE_CACHE", False)
+# Cosine similarity at/above which a cached reply answers a near-duplicate ask
+SIMILARITY_MIN = env_float("MONITOR_RESPONSE_CACHE_SIM", 0.92)
+_TTL_S = 600.0
+_CAPACITY = 256
+# Near-duplicate candidates kept per conversation context
+_PER_CONTEXT = 8
+
+_WS = re.compile(r"\s+")
+# Full-conversation digest -> reply
+_EXACT = ReadThroughCache(capacity=_CAPACITY, ttl_seconds=_TTL_S)
+# Digest of everything but the final ask -> deque of (unit vector, reply, expires)
+_SIMILAR = ReadThroughCache(capacity=_CAPACITY, ttl_seconds=_TTL_S)
+# Embeddings of recent asks, so store() does not embed the same text again
+_VECTORS = ReadThroughCache(capacity=16, ttl_seconds=60.0)
+_LOCK = threading.Lock()
+
+
+def scope_for(session_id: str | None, universe_id: str | None) -> str | None:
+    """Cache scope of a conversation; None (no caching) without a session."""
+    return f"{session_id}|{universe_id or ''}" if session_id else None
+
+
+def _normalized(m: Message) -> str:
+    return f"{m.get('role')}: {_WS.sub(' ', str(m.get('content', ''))).strip().lower()}"
+
+
+def _digest(scope: str, system_prompt: str, msgs: Sequence[Message]) -> str:
+    h = hashlib.sha1(f"{scope}\x1f{system_prompt}".encode())
+    for m in msgs:
+        h.update(b"\x1f" + _normalized(m).encode("utf-8"))
+    return h.hexdigest()
+
+
+def cache_key(scope: str, system_prompt: str, msgs: Sequence[Message]) -> str:
+    """Digest of the scope, system prompt and every message sent (normalized)."""
+    return _digest(scope, system_prompt, msgs)
+
+
+def _unit_vector(text: str, embedder: Embedder) -> list[float] | None:
+    vec = _VECTORS.get(text)
+    if vec is not None:
+        return vec
+    try:
+        raw = [float(x) for x in embedder(text)]
+    except Exception:
+        return None
+    norm = math.sqrt(sum(x * x for x in raw))
+    if not norm:
+        return None
+    vec = [x / norm for x in raw]
+    _VECTORS.set(text, vec)
+    return vec
+
+
+def _best_match(entries: Sequence[tuple[list[float], str, float]], vec: list[float]) -> str | None:
+    """Reply of the closest live entry at/above SIMILARITY_MIN, else None."""
+    now = time.time()
+    best_sim, best = SIMILARITY_MIN, None
+    for other, reply, expires in entries:
+        if expires < now:
+            continue
+        sim = sum(a * b for a, b in zip(vec, other, strict=False))
+        if sim >= best_sim:
+            best_sim, best = sim, reply
+    return best
+
+
+def lookup(
+    scope: str | None,
+    system_prompt: str,
+    msgs: Sequence[Message],
+    embedder: Embedder | None = None,
+) -> str | None:
+    """Return a cached reply for this exact conversation, or None on a miss."""
+    if not ENABLED or not scope or not msgs:
+        return None
+    with _LOCK:
+        reply = _EXACT.get(cache_key(scope, system_prompt, msgs))
+        entries = list(_SIMILAR.get(_digest(scope, system_prompt, msgs[:-1])) or ())
+    if reply is not None or embedder is None or not entries:
+        return reply
+    vec = _unit_vector(_normalized(msgs[-1]), embedder)
+    return _best_match(entries, vec) if vec is not None else None
+
+
+def store(
+    scope: str | None,
+    system_prompt: str,
+    msgs: Sequence[Message],
+    reply: str,
+    embedder: Embedder | None = None,
+) -> None:
+    """Remember the reply generated for this conversation."""
+    if not ENABLED or not scope or not msgs or not reply:
+        return
+    vec = _unit_vector(_normalized(msgs[-1]), embedder) if embedder is not None else None
+    context = _digest(scope, system_prompt, msgs[:-1])
+    with _LOCK:
+        _EXACT.set(cache_key(scope, system_prompt, msgs), reply)
+        if vec is not None:
+            entries = _SIMILAR.get(context)
+            if entries is None:
+                entries = deque(maxlen=_PER_CONTEXT)
+            entries.append((vec, reply, time.time() + _TTL_S))
+            _SIMILAR.set(context, entries)
+
+
+def clear_response_cache() -> None:
+    """Drop every cached reply (tests, or after the system prompt changes)."""
+    with _LOCK:
+        _EXACT.clear()
+        _SIMILAR.clear()
+        _VECTORS.clear()
@@ -2,32 +2,114 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
 import re
 
-from core.generation.providers import select_llm_from_env
+from core.engine.cache import ReadThroughCache
+from core.generation.circuit_breaker import CircuitBreaker
+from core.generation.providers import cached_llm_from_env
+from core.utils.env import env_bool, env_float
 
-from .state import GraphState, Mode
+from .constants import (
+    CLASSIFIER_INPUT_MAX_CHARS,
+    INTENT_SCHEMA,
+    IntentVerdict,
+    decode_intent_verdict,
+    match_command,
+)
+from .router_draft import confident_draft, record_verdict
+from .state import GraphState, Mode, ensure_history, get_meta
 
-# Command patterns
-_CMD_MONITOR = re.compile(r"^[\s]*[\/@]?(monitor)\b", re.IGNORECASE)
-_CMD_NARRATE = re.compile(r"^[\s]*[\/@]?(narrar|narrador|narrate|narrator)\b", re.IGNORECASE)
-_CMD_HELP = re.compile(r"^[\s]*[\/@]?help\b", re.IGNORECASE)
+try:  # optional linear-time engine for the keyword alternations
+    import re2 as _kw_re  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    _kw_re = re
+
+logger = logging.getLogger(__name__)
+
+_WS = re.compile(r"\s+")
+
+# Keyword heuristics (substring match), unioned into one alternation per mode.
+# Not a token set: entries are stems ("crea" -> "crear") and multi-word phrases.
+_MON_KWS = (
+    "monitor:",
+    "administra",
+    "configura",
+    "crea",
+    "actualiza",
+    "consulta",
+    "borra",
+    "persistir",
+    "guardar",
+    "dataset",
+    "índice",
+    "indice",
+    "vector",
+    "embedding",
+)
+_NAR_KWS = (
+    "cuenta",
+    "narra",
+    "qué pasó",
+    "que paso",
+    "continúa",
+    "continua",
+    "siguiente capítulo",
+    "siguiente capitulo",
+    "rol",
+    "personaje",
+)
+_MON_KW_RE = _kw_re.compile("(?i)" + "|".join(map(re.escape, _MON_KWS)))
+_NAR_KW_RE = _kw_re.compile("(?i)" + "|".join(map(re.escape, _NAR_KWS)))
+
+
+def _keyword_mode(t: str) -> Mode | None:
+    """Return the mode whose keywords occur in t (monitor wins), or None."""
+    if _MON_KW_RE.search(t):
+        return "monitor"
+    return "narration" if _NAR_KW_RE.search(t) else None
+
+
+# LLM classifier cache keyed by (normalized text, last mode)
+_ROUTER_CACHE = ReadThroughCache(capacity=1024, ttl_seconds=600.0)
+_ROUTER_CACHE_STATS = {"hits": 0, "misses": 0}
+
+# Static classifier prompt; per-turn data goes only in the user message
+_ROUTER_SYS_V1 = (
+    "Clasifica el mensaje como 'narration' (historia diegética) o 'monitor' "
+    "(operaciones del sistema: crear/actualizar/consultar, admin, ERPs, APIs). "
+    'Responde SOLO JSON: {"intent":"narration|monitor","confidence":0.0-1.0,"reason":"..."}.'
+)
+
+# Skips the LLM refinement while the provider keeps failing
+_LLM_BREAKER = CircuitBreaker("router")
+
+# Kill switch for the LLM refinement (heuristics only) in latency-sensitive deployments
+_LLM_ROUTER_ENABLED = env_bool("MONITOR_ROUTER_LLM", True)
+# Heuristic confidence at/above which the LLM classifier is skipped
+_LLM_MIN_CONF = env_float("ROUTER_LLM_MIN_CONF", 0.9)
+# Budget for the LLM refinement in aclassify_intent before keeping the heuristic result
+_LLM_TIMEOUT_S = env_float("ROUTER_LLM_TIMEOUT_MS", 3000.0) / 1000.0
+
+
+# Built once; the help command returns it verbatim
+_HELP_TEXT = (
+    "Comandos disponibles (prefijo opcional / o @):\n"
+    "- /help: muestra este mensaje de ayuda.\n"
+    "- /monitor <pedido>: fuerza modo Monitor para administración (crear/actualizar/consultar).\n"
+    "- /narrar <mensaje>: fuerza modo Narración para continuar la historia.\n"
+    '- /monitor iniciar universo [<id>] [nombre "..."] [multiverso <id>]: asistente para crear un universo listo para narrar.\n'
+    "Consultas útiles (EN): list multiverses | list universes [multiverse <id>] | list stories [universe <id>] | show 'Tony Stark' in universe <id> | enemies of 'Rogue' in universe <id> | last time they saw 'Deadpool' in universe <id>.\n"
+    'GM onboarding: start a new story [topics "urban fantasy, heists"] [story "Night Shift"] | save conversation | end scene.\n'
+    "Consejo: si mezclas narrativa y administración, el enrutador intentará decidir, pero puedes forzar el modo con los comandos.\n"
+    "Persistencia: este endpoint opera en 'copilot' (dry-run/staging) por defecto. 'end scene' intenta persistir automáticamente los cambios en staging; envía mode='autopilot' para persistir siempre."
+)
 
 
 def get_help_text() -> str:
     """Return help text for available commands."""
-    return (
-        "Comandos disponibles (prefijo opcional / o @):\n"
-        "- /help: muestra este mensaje de ayuda.\n"
-        "- /monitor <pedido>: fuerza modo Monitor para administración (crear/actualizar/consultar).\n"
-        "- /narrar <mensaje>: fuerza modo Narración para continuar la historia.\n"
-        '- /monitor iniciar universo [<id>] [nombre "..."] [multiverso <id>]: asistente para crear un universo listo para narrar.\n'
-        "Consultas útiles (EN): list multiverses | list universes [multiverse <id>] | list stories [universe <id>] | show 'Tony Stark' in universe <id> | enemies of 'Rogue' in universe <id> | last time they saw 'Deadpool' in universe <id>.\n"
-        'GM onboarding: start a new story [topics "urban fantasy, heists"] [story "Night Shift"] | save conversation | end scene.\n'
-        "Consejo: si mezclas narrativa y administración, el enrutador intentará decidir, pero puedes forzar el modo con los comandos.\n"
-        "Persistencia: este endpoint opera en 'copilot' (dry-run/staging) por defecto. 'end scene' intenta persistir automáticamente los cambios en staging; envía mode='autopilot' para persistir siempre."
-    )
+    return _HELP_TEXT
 
 
 def classify_intent(state: GraphState) -> GraphState:
@@ -35,6 +117,44 @@ def classify_intent(state: GraphState) -> GraphState:
 
     Honra override_mode si está presente en el estado.
     """
+    pending = _route_heuristics(state)
+    if pending is None:
+        return state
+    text, last_mode, mode, confidence, reason = pending
+
+    # Clasificador LLM (refina decisión) – robusto a backend mock
+    lm = _guarded_llm_classify(text, last_mode)
+    return _finalize(state, *_merge_llm(text, mode, confidence, reason, lm))
+
+
+async def aclassify_intent(state: GraphState) -> GraphState:
+    """Async variant of classify_intent.
+
+    Heuristics run inline; the LLM refinement runs off the event loop and is
+    abandoned after ROUTER_LLM_TIMEOUT_MS, keeping the heuristic decision.
+    """
+    pending = _route_heuristics(state)
+    if pending is None:
+        return state
+    text, last_mode, mode, confidence, reason = pending
+
+    try:
+        lm = await asyncio.wait_for(
+            asyncio.to_thread(_guarded_llm_classify, text, last_mode), timeout=_LLM_TIMEOUT_S
+        )
+    except TimeoutError as e:
+        _LLM_BREAKER.record_failure(e)
+        lm = None
+    return _finalize(state, *_merge_llm(text, mode, confidence, reason, lm))
+
+
+def _route_heuristics(state: GraphState) -> tuple[str, Mode, Mode, float, str] | None:
+    """Apply overrides and fast heuristics.
+
+    Returns None when the decision is already final (and recorded on the state);
+    otherwise (text, last_mode, mode, confidence, reason) for LLM refinement.
+    """
+    ensure_history(state)
     text = state.get("input") or ""
     last_mode: Mode = state.get("last_mode", "narration")  # default narrativo
     mode: Mode = last_mode
@@ -44,89 +164,119 @@ def classify_intent(state: GraphState) -> GraphState:
     # Overrides explícitos
     override = state.get("override_mode")
     if override in ("narration", "monitor"):
-        state["mode"] = override  # decide ya
-        meta = state.get("meta") or {}
-        meta.update(
-            {"router": {"confidence": 1.0, "reason": f"override:{override}", "decided": override}}
-        )
-        state["meta"] = meta
-        return state
+        _finalize(state, override, 1.0, f"override:{override}")  # decide ya
+        return None
 
     # Heurísticas rápidas
     t = text.strip()
-    if _CMD_HELP.match(t):
+    cmd = match_command(t)
+    if cmd == "help":
         # Help se maneja como monitor para presentar ayuda
         mode, reason, confidence = "monitor", "help", 0.99
         state["_help"] = True  # flag interna
-    elif _CMD_MONITOR.match(t):
+    elif cmd == "mon":
         mode, reason, confidence = "monitor", "command_prefix", 0.95
-    elif _CMD_NARRATE.match(t):
+    elif cmd == "nar":
         mode, reason, confidence = "narration", "command_prefix", 0.95
-    elif any(
-        k in t.lower()
-        for k in [
-            "monitor:",
-            "administra",
-            "configura",
-            "crea",
-            "actualiza",
-            "consulta",
-            "borra",
-            "persistir",
-            "guardar",
-            "dataset",
-            "índice",
-            "indice",
-            "vector",
-            "embedding",
-        ]
-    ):
+    elif (kw_mode := _keyword_mode(t)) == "monitor":
         mode, reason, confidence = "monitor", "keywords", 0.75
-    elif any(
-        k in t.lower()
-        for k in [
-            "cuenta",
-            "narra",
-            "qué pasó",
-            "que paso",
-            "continúa",
-            "continua",
-            "siguiente capítulo",
-            "siguiente capitulo",
-            "rol",
-            "personaje",
-        ]
-    ):
+    elif kw_mode == "narration":
         mode, reason, confidence = "narration", "keywords", 0.7
 
-    # Clasificador LLM (refina decisión) – robusto a backend mock
-    try:
-        llm = select_llm_from_env()
-        sys = (
-            "Clasifica el mensaje como 'narration' (historia diegética) o 'monitor' "
-            "(operaciones del sistema: crear/actualizar/consultar, admin, ERPs, APIs). "
-            'Responde SOLO JSON: {"intent":"narration|monitor","confidence":0.0-1.0,"reason":"..."}.'
-        )
-        user = f"Mensaje: {text}\nÚltimo modo: {last_mode}"
-        out = llm.complete(
-            system_prompt=sys,
-            messages=[{"role": "user", "content": user}],
-            temperature=0.0,
-            max_tokens=120,
-        )
-        data = json.loads(out) if isinstance(out, str) else {}
-        lm_intent = str(data.get("intent", "")).lower()
-        lm_conf = float(data.get("confidence", 0.0))
-        lm_reason = str(data.get("reason", ""))
+    # Heurística concluyente (o LLM desactivado): no hace falta consultar al LLM
+    if not _LLM_ROUTER_ENABLED or (confidence >= _LLM_MIN_CONF and reason != "fallback"):
+        _finalize(state, mode, confidence, reason)
+        return None
+
+    # Borrador local confiable que no contradice la heurística: tampoco
+    draft = confident_draft(t)
+    if draft is not None and (reason == "fallback" or draft[0] == mode):
+        _finalize(state, draft[0], draft[1], "draft")  # type: ignore[arg-type]
+        return None
+    return text, last_mode, mode, confidence, reason
+
+
+def _merge_llm(
+    text: str, mode: Mode, confidence: float, reason: str, lm: tuple[str, float, str] | None
+) -> tuple[Mode, float, str]:
+    """Let the LLM verdict override the heuristic when it is at least as confident.
+
+    Accepted verdicts are fed back to the local draft classifier's training log.
+    """
+    if lm is not None:
+        lm_intent, lm_conf, lm_reason = lm
         if lm_intent in ("narration", "monitor") and (
             lm_conf >= confidence or reason == "fallback"
         ):
-            mode, confidence, reason = lm_intent, lm_conf, f"llm:{lm_reason}"
-    except Exception:
-        pass
+            record_verdict(text, lm_intent)
+            return lm_intent, lm_conf, f"llm:{lm_reason}"  # type: ignore[return-value]
+    return mode, confidence, reason
 
+
+def _finalize(state: GraphState, mode: Mode, confidence: float, reason: str) -> GraphState:
+    """Record the routing decision on the state."""
     state["mode"] = mode
-    meta = state.get("meta") or {}
-    meta.update({"router": {"confidence": confidence, "reason": reason, "decided": mode}})
-    state["meta"] = meta
+    get_meta(state)["router"] = {"confidence": confidence, "reason": reason, "decided": mode}
     return state
+
+
+def _normalize(text: str) -> str:
+    """Normalize router input for cache lookups (trim, lowercase, collapse spaces)."""
+    return _WS.sub(" ", text.strip().lower())
+
+
+def _guarded_llm_classify(text: str, last_mode: Mode) -> tuple[str, float, str] | None:
+    """Call _llm_classify behind the circuit breaker; None when skipped or failed."""
+    if not _LLM_BREAKER.allow():
+        return None
+    try:
+        lm = _llm_classify(text, last_mode)
+    except (TypeError, ValueError) as e:
+        # Malformed payload: the provider answered, so the breaker stays closed
+        logger.debug("Router LLM returned an unusable payload: %s", e)
+        _LLM_BREAKER.record_success()
+        return None
+    except Exception as e:  # provider/network failure
+        logger.warning("Router LLM call failed: %s", e)
+        _LLM_BREAKER.record_failure(e)
+        return None
+    _LLM_BREAKER.record_success()
+    return lm
+
+
+def _llm_classify(text: str, last_mode: Mode) -> IntentVerdict:
+    """Ask the LLM for (intent, confidence, reason); cached on normalized input.
+
+    Unusable replies raise ValueError and are not cached, so they are retried.
+    """
+    key = f"{last_mode}:{_normalize(text[:CLASSIFIER_INPUT_MAX_CHARS])}"
+    cached = _ROUTER_CACHE.get(key)
+    if cached is not None:
+        _ROUTER_CACHE_STATS["hits"] += 1
+        return cached
+    _ROUTER_CACHE_STATS["misses"] += 1
+
+    llm = cached_llm_from_env()
+    user = f"Mensaje: {text[:CLASSIFIER_INPUT_MAX_CHARS]}\nÚltimo modo: {last_mode}"
+    data = llm.complete_json(
+        system_prompt=_ROUTER_SYS_V1,
+        messages=[{"role": "user", "content": user}],
+        schema=INTENT_SCHEMA,
+        temperature=0.0,
+        max_tokens=40,
+    )
+    result = decode_intent_verdict(data)
+    _ROUTER_CACHE.set(key, result)
+    return result
+
+
+def get_router_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters and current size of the router LLM cache."""
+    return {**_ROUTER_CACHE_STATS, "size": _ROUTER_CACHE.size()}
+
+
+def clear_router_cache() -> None:
+    """Drop cached router decisions and reset counters."""
+    _ROUTER_CACHE.clear()
+    _ROUTER_CACHE_STATS["hits"] = 0
+    _ROUTER_CACHE_STATS["misses"] = 0
@@ -0,0 +1,145 @@
+"""Local draft classifier for mode routing (draft, then verify with the LLM).
+
+A multinomial naive Bayes over word unigrams/bigrams, trained from a JSONL log of
+LLM-confirmed verdicts (``{"text": ..., "intent": "narration|monitor"}``) found at
+ROUTER_DRAFT_LOG. The classifiers consult it before calling the LLM and skip the
+call when the draft is confident; accepted LLM verdicts are appended back to the
+log, so the draft improves as the deployment runs. Without a log, or with too few
+examples per mode, the draft abstains and routing is unchanged. The log is
+appended off the request thread and rotated once (to ``<log>.1``) when it
+reaches ROUTER_DRAFT_LOG_MAX_KB; the draft trains on both files.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from functools import lru_cache
+import json
+import logging
+import math
+import os
+import re
+import threading
+
+from core.utils.env import env_float, env_str
+
+from .monitor_actions import run_in_background
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+_LABELS = ("narration", "monitor")
+# Examples needed per mode before the draft is trusted at all
+_MIN_EXAMPLES = 20
+# Draft confidence at/above which the LLM verification is skipped
+DRAFT_MIN_CONF = env_float("ROUTER_DRAFT_MIN_CONF", 0.7)
+
+_LOG_LOCK = threading.Lock()
+# Size at which the verdict log is rotated; bounds the log at about twice this
+_LOG_MAX_BYTES = int(env_float("ROUTER_DRAFT_LOG_MAX_KB", 4096) * 1024)
+
+
+def _features(text: str) -> list[str]:
+    words = _TOKEN.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:], strict=False)]
+
+
+class DraftModel:
+    """Two-class multinomial naive Bayes with Laplace smoothing."""
+
+    def __init__(self, examples: Iterable[tuple[str, str]]):
+        self.docs: Counter[str] = Counter()
+        self.counts: dict[str, Counter[str]] = {label: Counter() for label in _LABELS}
+        for text, label in examples:
+            if label in self.counts:
+                self.docs[label] += 1
+                self.counts[label].update(_features(text))
+        self.totals = {label: sum(c.values()) for label, c in self.counts.items()}
+        self.vocab = len(set().union(*self.counts.values()))
+
+    @property
+    def ready(self) -> bool:
+        return all(self.docs[label] >= _MIN_EXAMPLES for label in _LABELS)
+
+    def predict(self, text: str) -> tuple[str, float]:
+        """Return (label, probability) for the most likely mode."""
+        n_docs = sum(self.docs.values())
+        feats = _features(text)
+        scores = {}
+        for label in _LABELS:
+            counts, denom = self.counts[label], self.totals[label] + self.vocab + 1
+            score = math.log(self.docs[label] / n_docs)
+            score += sum(math.log((counts[f] + 1) / denom) for f in feats)
+            scores[label] = score
+        best = max(scores, key=scores.__getitem__)
+        other = scores[_LABELS[0] if best == _LABELS[1] else _LABELS[1]]
+        return best, 1.0 / (1.0 + math.exp(other - scores[best]))
+
+
+def _log_path() -> str | None:
+    return env_str("ROUTER_DRAFT_LOG")
+
+
+@lru_cache(maxsize=1)
+def _load_model(path: str) -> DraftModel | None:
+    examples: list[tuple[str, str]] = []
+    found = False
+    for part in (f"{path}.1", path):
+        try:
+            with open(part, encoding="utf-8") as f:
+                found = True
+                for line in f:
+                    try:
+                        row = json.loads(line)
+                        examples.append((str(row["text"]), str(row["intent"])))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            continue
+    if not found:
+        return None
+    model = DraftModel(examples)
+    return model if model.ready else None
+
+
+def confident_draft(text: str) -> tuple[str, float] | None:
+    """Return (mode, confidence) when the local model is confident, else None."""
+    path = _log_path()
+    if not path:
+        return None
+    model = _load_model(path)
+    if model is None:
+        return None
+    label, conf = model.predict(text)
+    return (label, conf) if conf >= DRAFT_MIN_CONF else None
+
+
+def record_verdict(text: str, intent: str) -> None:
+    """Queue an accepted LLM verdict for the draft's training log (best effort).
+
+    The write runs on the shared background pool. The draft is retrained on the
+    next process start (or after reload_draft()).
+    """
+    path = _log_path()
+    if not path or intent not in _LABELS:
+        return
+    line = json.dumps({"text": text, "intent": intent}, ensure_ascii=False)
+    run_in_background(_append_verdict, path, line)
+
+
+def _append_verdict(path: str, line: str) -> None:
+    """Append one log line, first rotating the log if it reached _LOG_MAX_BYTES."""
+    try:
+        with _LOG_LOCK:
+            if os.path.exists(path) and os.path.getsize(path) >= _LOG_MAX_BYTES:
+                os.replace(path, f"{path}.1")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    except OSError as e:
+        logger.debug("Could not append router verdict to %s: %s", path, e)
+
+
+def reload_draft() -> None:
+    """Drop the loaded draft model so the next call retrains from the log."""
+    _load_model.cache_clear()
@@ -2,18 +2,39 @@
 
 from __future__ import annotations
 
-from core.agents.narrator import narrator_agent
-from core.generation.providers import select_llm_from_env
-
-from .graph_state import GraphState, append_message, generate_id
+import logging
+
+from core.agents.narrator import cached_narrator_agent
+from core.generation.providers import cached_llm_from_env
+
+from .constants import INTRO_BEAT_PROMPT
+from .graph_state import (
+    GraphState,
+    WizardState,
+    append_message,
+    generate_id,
+    get_meta,
+    get_wizard,
+)
+
+logger = logging.getLogger(__name__)
+
+# Prompt hints for fields a wizard is still waiting for (meta.wizard.needs)
+_STORY_FIELD_HINTS = {
+    "topics": 'topics (e.g., topics "superheroes, urban mystery")',
+    "story_title": 'story title (e.g., story "Night Shift")',
+}
+_UNIVERSE_FIELD_HINTS = {
+    "multiverse_id": "multiverse_id (p.ej. multiverse mv:demo)",
+    "name": 'name (p.ej. nombre "Mi Universo")',
+}
 
 
 def handle_start_story_wizard(state: GraphState, intent: Any) -> GraphState:
     """Handle the start_story wizard flow."""
     # Gather topics/interests and optional names
-    meta = state.get("meta") or {}
-    w = dict(meta.get("wizard") or {})
-    w.update({"flow": "gm_onboarding"})
+    w = get_wizard(state)
+    w["flow"] = "gm_onboarding"
 
     if intent.topics:
         w["topics"] = intent.topics
@@ -26,21 +47,17 @@ def handle_start_story_wizard(state: GraphState, intent: Any) -> GraphState:
     if intent.description:
         w["story_title"] = intent.description
 
-    meta["wizard"] = w
-    state["meta"] = meta
-
-    # Check for missing information
-    missing = []
-    if not w.get("topics"):
-        missing.append('topics (e.g., topics "superheroes, urban mystery")')
-    if not w.get("story_title"):
-        missing.append('story title (e.g., story "Night Shift")')
+    # Fields still missing; kept on the wizard so replies skip the full intent parser
+    needs = [k for k in ("topics", "story_title") if not w.get(k)]
+    w["needs"] = needs
 
-    if missing:
+    if needs:
         append_message(
             state,
             "assistant",
-            "To start your story, please provide: " + ", ".join(missing) + ".",
+            "To start your story, please provide: "
+            + ", ".join(_STORY_FIELD_HINTS[k] for k in needs)
+            + ".",
         )
         state["last_mode"] = "monitor"
         return state
@@ -51,8 +68,7 @@ def handle_start_story_wizard(state: GraphState, intent: Any) -> GraphState:
 
 def handle_setup_universe_wizard(state: GraphState, intent: Any) -> GraphState:
     """Handle the setup_universe wizard flow."""
-    wizard = (state.get("meta") or {}).get("wizard") or {}
-    w = dict(wizard)
+    w = get_wizard(state)
     w.setdefault("flow", "setup_universe")
 
     if intent.id:
@@ -63,20 +79,20 @@ def handle_setup_universe_wizard(state: GraphState, intent: Any) -> GraphState:
         w["multiverse_id"] = intent.multiverse_id
 
     # Check for missing data
-    missing = []
+    needs = []
     if not w.get("multiverse_id") and not state.get("multiverse_id"):
-        missing.append("multiverse_id (p.ej. multiverse mv:demo)")
+        needs.append("multiverse_id")
     if not w.get("name"):
-        missing.append('name (p.ej. nombre "Mi Universo")')
+        needs.append("name")
 
-    if missing:
-        meta = state.get("meta") or {}
-        meta["wizard"] = w
-        state["meta"] = meta
+    if needs:
+        w["needs"] = needs
         append_message(
             state,
             "assistant",
-            "Configurar universo: por favor indica " + ", ".join(missing) + ".",
+            "Configurar universo: por favor indica "
+            + ", ".join(_UNIVERSE_FIELD_HINTS[k] for k in needs)
+            + ".",
         )
         state["last_mode"] = "monitor"
         return state
@@ -85,9 +101,9 @@ def handle_setup_universe_wizard(state: GraphState, intent: Any) -> GraphState:
     return _create_universe(state, w)
 
 
-def _create_story_structure(state: GraphState, wizard_data: dict) -> GraphState:
+def _create_story_structure(state: GraphState, wizard_data: WizardState) -> GraphState:
     """Create the complete story scaffolding."""
-    from .monitor_actions import commit_deltas
+    from .monitor_actions import commit_deltas, run_in_background
 
     # Generate IDs
     mv_id = state.get("multiverse_id") or generate_id("multiverse")
@@ -123,9 +139,12 @@ def _create_story_structure(state: GraphState, wizard_data: dict) -> GraphState:
     }
 
     res = commit_deltas(state, deltas)
-
-    # Generate intro beat
-    _generate_intro_beat(state, wizard_data, sc_id, uni_id)
+    # The intro beat is generated and recorded off the critical path
+    intro_job = None
+    if state.get("tools"):
+        intro_job = run_in_background(
+            _record_intro_beat, {"tools": state["tools"]}, dict(wizard_data), sc_id, uni_id
+        )
 
     # Update state with new IDs
     state["multiverse_id"] = mv_id
@@ -134,20 +153,19 @@ def _create_story_structure(state: GraphState, wizard_data: dict) -> GraphState:
     state["scene_id"] = sc_id
 
     # Clear wizard
-    meta = state.get("meta") or {}
-    meta.pop("wizard", None)
-    state["meta"] = meta
+    get_meta(state).pop("wizard", None)
 
+    intro_note = "The intro is being written; you" if intro_job is not None else "You"
     append_message(
         state,
         "assistant",
-        f"Story created (mode={res.get('mode')}). You can now /narrate to continue from the intro.",
+        f"Story created (mode={res.get('mode')}). {intro_note} can /narrate to continue.",
     )
     state["last_mode"] = "monitor"
     return state
 
 
-def _create_universe(state: GraphState, wizard_data: dict) -> GraphState:
+def _create_universe(state: GraphState, wizard_data: WizardState) -> GraphState:
     """Create a new universe and set up story wizard."""
     from .monitor_actions import commit_deltas
 
@@ -160,9 +178,7 @@ def _create_universe(state: GraphState, wizard_data: dict) -> GraphState:
     )
 
     # Continue wizard: create story
-    meta = state.get("meta") or {}
-    meta["wizard"] = {"flow": "setup_story", "universe_id": uid}
-    state["meta"] = meta
+    get_meta(state)["wizard"] = {"flow": "setup_story", "universe_id": uid}
     state["universe_id"] = uid
 
     append_message(
@@ -174,22 +190,43 @@ def _create_universe(state: GraphState, wizard_data: dict) -> GraphState:
     return state
 
 
-def _generate_intro_beat(
-    state: GraphState, wizard_data: dict, scene_id: str, universe_id: str
+def _record_intro_beat(
+    ctx_state: GraphState, wizard_data: WizardState, sc_id: str, uni_id: str
 ) -> None:
-    """Generate and persist an intro beat for the story."""
+    """Generate the intro beat and record it as a Fact of the first scene.
+
+    Runs on the background pool after the story was committed, so failures are
+    logged and otherwise ignored.
+    """
+    from .monitor_actions import commit_deltas
+
+    primer = _generate_intro_beat(wizard_data)
+    if not primer:
+        return
     try:
-        from .monitor_actions import commit_deltas
+        commit_deltas(
+            ctx_state,
+            {
+                "facts": [{"description": primer, "occurs_in": sc_id, "universe_id": uni_id}],
+                "_draft": "Intro beat",
+            },
+        )
+    except Exception as e:
+        logger.debug("Intro beat for %s failed: %s", sc_id, e)
+
 
-        llm = select_llm_from_env()
-        agent = narrator_agent(llm)
+def _generate_intro_beat(wizard_data: WizardState) -> str | None:
+    """Generate the story's intro beat; None if the LLM call fails."""
+    try:
+        llm = cached_llm_from_env()
+        agent = cached_narrator_agent(llm)
         topics_text = ", ".join(wizard_data.get("topics") or [])
 
-        primer = agent.act(
+        return agent.act(
             [
                 {
                     "role": "system",
-                    "content": "You are the GM. Write a short intro beat (3-5 sentences) based on the given topics and interests. Keep it engaging and concise.",
+                    "content": INTRO_BEAT_PROMPT,
                 },
                 {
                     "role": "user",
@@ -197,15 +234,5 @@ def _generate_intro_beat(
                 },
             ]
         )
-
-        commit_deltas(
-            state,
-            {
-                "facts": [
-                    {"description": primer, "occurs_in": scene_id, "universe_id": universe_id}
-                ],
-                "_draft": primer[:120],
-            },
-        )
     except Exception:
-        pass
+        return None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 import re
 from typing import Literal
 
@@ -55,24 +56,101 @@ class MonitorIntent:
 
 
 _RE_QSTR = r'"([^\"]+)"|\'([^\']+)\''
+_NAME_RE = re.compile(r"(?:nombre|name)\s+(?:\"([^\"]+)\"|'([^']+)')", re.IGNORECASE)
+_MONITOR_PREFIX_RE = re.compile(r"^[\s]*[\/@]?(monitor)\b[:\s]*", re.IGNORECASE)
+_QSTR_RE = re.compile(_RE_QSTR)
+_QSTR_OR_PLAIN_RE = re.compile(rf"{_RE_QSTR}|([^,]+)")
+_STRIP_QUOTES_RE = re.compile(r"^['\"]|['\"]$")
+_NAME_LIST_RE = re.compile(
+    r"\b(seed|crear|create|agregar|add)\b[\s\S]*?\b(pcs|players|npcs|pnjs|characters|personajes)\b\s+(.+)$",
+    re.IGNORECASE,
+)
+_PARTICIPANTS_RE = re.compile(
+    r"(?:participants|con|including|incluyendo)\s+((?:\"[^\"]+\"|'[^']+'|[^,]+)(?:\s*,\s*(?:\"[^\"]+\"|'[^']+'|[^,]+))*)",
+    re.IGNORECASE,
+)
+
+# Action triggers, matched against the lowercased text in parse order
+_CREATE_MULTIVERSE_RE = re.compile(r"\b(crea(r)?|create)\s+(multiverso|multiverse)\b")
+_CREATE_UNIVERSE_RE = re.compile(r"\b(crea(r)?|create)\s+(universo|universe)\b")
+_SETUP_UNIVERSE_RE = re.compile(
+    r"\b(iniciar|configurar|setup|start|nuevo|nueva)\s+(universo|universe)\b"
+)
+_SAVE_FACT_RE = re.compile(r"\b(guardar|persistir|save)\s+(hecho|fact)\b")
+_LIST_MULTIVERSES_RE = re.compile(r"\b(list|show)\s+(multiverses|multiversos)\b")
+_LIST_UNIVERSES_RE = re.compile(r"\b(list|show)\s+(universes|universos)\b")
+_LIST_STORIES_RE = re.compile(r"\b(list|show)\s+(stories|historias|arcs)\b")
+_SHOW_ENTITY_RE = re.compile(r"\b(show|info|who\s+is|tell\s+me\s+about)\b")
+_LIST_ENEMIES_RE = re.compile(r"\b(enemies\s+of|enemigos\s+de)\b")
+_LAST_SEEN_RE = re.compile(
+    r"\blast\s+time\s+(they\s+)?saw\b|\bultima\s+vez\s+que\s+(lo|la|les)\s+vieron\b"
+)
+_ADD_SCENE_RE = re.compile(r"\b(add|create)\s+(a\s+)?scene\b|\bagregar\s+(una\s+)?escena\b")
+_MODIFY_LAST_SCENE_RE = re.compile(
+    r"\b(modify|update|append)\s+(the\s+)?last\s+scene\b|\bmodificar\s+(la\s+)?ultima\s+escena\b"
+)
+_RETCON_RE = re.compile(r"\bretcon\b")
+_START_STORY_RE = re.compile(
+    r"\bstart\s+(a\s+)?new\s+story\b|\biniciar\s+(una\s+)?nueva\s+historia\b"
+)
+_SEED_PCS_RE = re.compile(r"\bseed\s+(pcs|players)\b|\bsembrar\s+(pj|pjs)\b")
+_SEED_NPCS_RE = re.compile(r"\bseed\s+(npcs|pnjs)\b")
+_CREATE_ENTITY_RE = re.compile(r"\b(create|add|crear|agregar)\s+(entity|character|personaje)\b")
+_AS_PC_RE = re.compile(r"\bas\s+pc\b|\bcomo\s+pj\b")
+_AS_NPC_RE = re.compile(r"\bas\s+npc\b|\bcomo\s+pnj\b")
+_SAVE_CONVERSATION_RE = re.compile(r"\bsave\s+(the\s+)?conversation\b")
+_SHOW_CONVERSATION_RE = re.compile(r"\b(show|mostrar)\s+(conversation|transcript|conversación)\b")
+_END_SCENE_RE = re.compile(
+    r"\b(end|finish|close)\s+(the\s+)?scene\b|\b(terminar|cerrar)\s+(la\s+)?escena\b"
+)
+
+# Payload extraction, matched against the original-case text
+_SAVE_FACT_HEAD_RE = re.compile(
+    r"^[\s\S]*?(guardar|persistir|save)\s+(hecho|fact)\s*", re.IGNORECASE
+)
+_SCENE_REF_RE = re.compile(r"(?:scene|escena)\s+\S+\s*", re.IGNORECASE)
+_SHOW_ENTITY_NAME_RE = re.compile(
+    rf"(show|info|who\\s+is|tell\\s+me\\s+about)\s+({_RE_QSTR}|[A-Za-z0-9_\- ]+)",
+    re.IGNORECASE,
+)
+_ENEMIES_OF_RE = re.compile(r"(?:enemies\s+of|enemigos\s+de)\s+([^,]+)", re.IGNORECASE)
+_SEEN_NAME_RE = re.compile(r"(?:saw|vieron)\s+([^,]+)$", re.IGNORECASE)
+_WITH_TAIL_RE = re.compile(r"\bwith\b\s+(.*)$", re.IGNORECASE)
+_MODIFY_LAST_SCENE_HEAD_RE = re.compile(
+    r"^[\s\S]*?(modify|update|append)\s+(the\s+)?last\s+scene\s*", re.IGNORECASE
+)
+_RETCON_ARGS_RE = re.compile(r"retcon\s+([^\s].*?)\s*(?:to\s+([^\s].*))?$", re.IGNORECASE)
+_QUOTE_START_RE = re.compile(r"^['\"]")
+_WITH_DESC_RE = re.compile(r"\bwith\b\s+('([^']+)'|\"([^\"]+)\"|(.+))$", re.IGNORECASE)
+_ENTITY_NAME_RE = re.compile(
+    r"(?:entity|character|personaje)\s+(?:\"([^\"]+)\"|'([^']+)')", re.IGNORECASE
+)
+_INTERESTS_RE = re.compile(r"interests?\s+(.+)$", re.IGNORECASE)
+_UNIVERSE_NAME_RE = re.compile(r"\buniverse\s+('([^']+)'|\"([^\"]+)\")", re.IGNORECASE)
+_STORY_NAME_RE = re.compile(r"\bstory\s+('([^']+)'|\"([^\"]+)\")", re.IGNORECASE)
 
 
 # Common helpers
 def _extract_name(text: str) -> str | None:
     # Match either double- or single-quoted name without including quotes in the group result
-    m = re.search(r"(?:nombre|name)\s+(?:\"([^\"]+)\"|'([^']+)')", text, flags=re.IGNORECASE)
+    m = _NAME_RE.search(text)
     if not m:
         return None
     return m.group(1) or m.group(2)
 
 
+@lru_cache(maxsize=32)
+def _after_re(keyword: str) -> re.Pattern[str]:
+    return re.compile(rf"{keyword}\s+(\S+)", re.IGNORECASE)
+
+
 def _extract_after(keyword: str, text: str) -> str | None:
-    m = re.search(rf"{keyword}\s+(\S+)", text, flags=re.IGNORECASE)
+    m = _after_re(keyword).search(text)
     return m.group(1) if m else None
 
 
 def _strip_command_prefix(text: str) -> str:
-    return re.sub(r"^[\s]*[\/@]?(monitor)\b[:\s]*", "", text, flags=re.IGNORECASE)
+    return _MONITOR_PREFIX_RE.sub("", text)
 
 
 def _extract_name_list(text: str) -> list[str]:
@@ -80,27 +158,34 @@ def _extract_name_list(text: str) -> list[str]:
     # This is best-effort: look for quoted strings anywhere, else fallback to comma-separated words after the verb
     names: list[str] = []
     # Prefer quoted strings
-    for m in re.finditer(_RE_QSTR, text):
+    for m in _QSTR_RE.finditer(text):
         nm = m.group(1) or m.group(2)
         if nm:
             names.append(nm.strip())
     if names:
         return names
     # Fallback: capture after the keyword, split by comma
-    m = re.search(
-        r"\b(seed|crear|create|agregar|add)\b[\s\S]*?\b(pcs|players|npcs|pnjs|characters|personajes)\b\s+(.+)$",
-        text,
-        flags=re.IGNORECASE,
-    )
+    m = _NAME_LIST_RE.search(text)
     if m:
         tail = m.group(3)
         for part in tail.split(","):
             nm = part.strip()
             if nm:
-                names.append(re.sub(r"^['\"]|['\"]$", "", nm))
+                names.append(_STRIP_QUOTES_RE.sub("", nm))
     return names
 
 
+def _extract_participants(text: str) -> list[str]:
+    # Names after participants/con/including: quoted or comma-separated, quotes stripped
+    parts: list[str] = []
+    for m in _PARTICIPANTS_RE.finditer(text):
+        for q1, q2, plain in _QSTR_OR_PLAIN_RE.findall(m.group(1)):
+            candidate = (q1 or q2 or plain).strip()
+            if candidate:
+                parts.append(_STRIP_QUOTES_RE.sub("", candidate))
+    return parts
+
+
 def parse_monitor_intent(text: str) -> MonitorIntent | None:
     """Parse simple Monitor commands from free text.
 
@@ -129,62 +214,53 @@ def parse_monitor_intent(text: str) -> MonitorIntent | None:
     tl = t.lower()
 
     # Create multiverse
-    if re.search(r"\b(crea(r)?|create)\s+(multiverso|multiverse)\b", tl):
+    if _CREATE_MULTIVERSE_RE.search(tl):
         id_ = _extract_after(r"(?:multiverso|multiverse)", t)
         name = _extract_name(t)
         return MonitorIntent(action="create_multiverse", id=id_, name=name)
 
     # Create universe
-    if re.search(r"\b(crea(r)?|create)\s+(universo|universe)\b", tl):
+    if _CREATE_UNIVERSE_RE.search(tl):
         id_ = _extract_after(r"(?:universo|universe)", t)
         name = _extract_name(t)
         mv = _extract_after(r"(?:multiverso|multiverse)", t)
         return MonitorIntent(action="create_universe", id=id_, name=name, multiverse_id=mv)
 
     # Setup universe (wizard)
-    if re.search(r"\b(iniciar|configurar|setup|start|nuevo|nueva)\s+(universo|universe)\b", tl):
-        id_ = _extract_after(r"(?:universo|universe)", t)
-        name = _extract_name(t)
-        mv = _extract_after(r"(?:multiverso|multiverse)", t)
-        return MonitorIntent(action="setup_universe", id=id_, name=name, multiverse_id=mv)
+    if _SETUP_UNIVERSE_RE.search(tl):
+        return _setup_universe_intent(t)
     # Save fact
-    if re.search(r"\b(guardar|persistir|save)\s+(hecho|fact)\b", tl):
+    if _SAVE_FACT_RE.search(tl):
         # everything after the keyword becomes description; try to capture scene
         # Extract scene first to avoid including it in description
         scene = _extract_after(r"(?:scene|escena)", t)
-        desc = re.sub(
-            r"^[\s\S]*?(guardar|persistir|save)\s+(hecho|fact)\s*", "", t, flags=re.IGNORECASE
-        )
-        desc = re.sub(r"(?:scene|escena)\s+\S+\s*", "", desc, flags=re.IGNORECASE).strip()
+        desc = _SAVE_FACT_HEAD_RE.sub("", t)
+        desc = _SCENE_REF_RE.sub("", desc).strip()
         return MonitorIntent(action="save_fact", description=desc or None, scene_id=scene)
 
     # List multiverses
-    if re.search(r"\b(list|show)\s+(multiverses|multiversos)\b", tl):
+    if _LIST_MULTIVERSES_RE.search(tl):
         return MonitorIntent(action="list_multiverses")
 
     # List universes (optionally within multiverse)
-    if re.search(r"\b(list|show)\s+(universes|universos)\b", tl):
+    if _LIST_UNIVERSES_RE.search(tl):
         mv = _extract_after(r"(?:multiverso|multiverse)", t)
         return MonitorIntent(action="list_universes", multiverse_id=mv)
 
     # List stories (optionally within universe)
-    if re.search(r"\b(list|show)\s+(stories|historias|arcs)\b", tl):
+    if _LIST_STORIES_RE.search(tl):
         u = _extract_after(r"(?:universo|universe)", t)
         return MonitorIntent(action="list_stories", universe_id=u)
 
     # Show entity info by name within a universe
-    if re.search(r"\b(show|info|who\s+is|tell\s+me\s+about)\b", tl):
+    if _SHOW_ENTITY_RE.search(tl):
         # capture quoted or unquoted name chunk before optional 'in universe'
-        m = re.search(
-            rf"(show|info|who\\s+is|tell\\s+me\\s+about)\s+({_RE_QSTR}|[A-Za-z0-9_\- ]+)",
-            t,
-            flags=re.IGNORECASE,
-        )
+        m = _SHOW_ENTITY_NAME_RE.search(t)
         if m:
             raw = m.group(2)
             name = None
             if raw:
-                qq = re.match(rf"{_RE_QSTR}", raw)
+                qq = _QSTR_RE.match(raw)
                 if qq:
                     name = qq.group(1) or qq.group(2)
                 else:
@@ -193,48 +269,27 @@ def parse_monitor_intent(text: str) -> MonitorIntent | None:
             return MonitorIntent(action="show_entity_info", entity_name=name, universe_id=u)
 
     # List enemies of <name>
-    if re.search(r"\b(enemies\s+of|enemigos\s+de)\b", tl):
-        m = re.search(r"(?:enemies\s+of|enemigos\s+de)\s+([^,]+)", t, flags=re.IGNORECASE)
+    if _LIST_ENEMIES_RE.search(tl):
+        m = _ENEMIES_OF_RE.search(t)
         name = m.group(1).strip() if m else None
         u = _extract_after(r"(?:universo|universe)", t)
         return MonitorIntent(action="list_enemies", entity_name=name, universe_id=u)
 
     # Last time they saw <name>
-    if re.search(r"\blast\s+time\s+(they\s+)?saw\b", tl) or re.search(
-        r"\bultima\s+vez\s+que\s+(lo|la|les)\s+vieron\b", tl
-    ):
-        m = re.search(r"(?:saw|vieron)\s+([^,]+)$", t, flags=re.IGNORECASE)
+    if _LAST_SEEN_RE.search(tl):
+        m = _SEEN_NAME_RE.search(t)
         name = m.group(1).strip() if m else None
         u = _extract_after(r"(?:universo|universe)", t)
         return MonitorIntent(action="last_seen", entity_name=name, universe_id=u)
 
     # Add scene
-    if re.search(r"\b(add|create)\s+(a\s+)?scene\b", tl) or re.search(
-        r"\bagregar\s+(una\s+)?escena\b", tl
-    ):
+    if _ADD_SCENE_RE.search(tl):
         name = _extract_name(t)
         story = _extract_after(r"(?:story|historia)", t)
         # participants: quoted names after 'participants' or 'with'
-        parts: list[str] = []
-        for m in re.finditer(
-            r"(?:participants|con|including|incluyendo)\s+((?:\"[^\"]+\"|'[^']+'|[^,]+)(?:\s*,\s*(?:\"[^\"]+\"|'[^']+'|[^,]+))*)",
-            t,
-            flags=re.IGNORECASE,
-        ):
-            chunk = m.group(1)
-            for p in re.findall(rf"{_RE_QSTR}|([^,]+)", chunk):
-                if isinstance(p, tuple):
-                    # when using findall with groups, we get tuples; flatten
-                    q1, q2, plain = p
-                    candidate = (q1 or q2 or plain).strip()
-                else:
-                    candidate = str(p).strip()
-                if candidate:
-                    # strip surrounding quotes if any
-                    candidate = re.sub(r"^['\"]|['\"]$", "", candidate)
-                    parts.append(candidate)
+        parts = _extract_participants(t)
         # description after 'with'
-        m = re.search(r"\bwith\b\s+(.*)$", t, flags=re.IGNORECASE)
+        m = _WITH_TAIL_RE.search(t)
         desc = m.group(1).strip() if m else None
         return MonitorIntent(
             action="add_scene",
@@ -245,40 +300,18 @@ def parse_monitor_intent(text: str) -> MonitorIntent | None:
         )
 
     # Modify last scene
-    if re.search(r"\b(modify|update|append)\s+(the\s+)?last\s+scene\b", tl) or re.search(
-        r"\bmodificar\s+(la\s+)?ultima\s+escena\b", tl
-    ):
+    if _MODIFY_LAST_SCENE_RE.search(tl):
         # capture description after the phrase
-        desc = re.sub(
-            r"^[\s\S]*?(modify|update|append)\s+(the\s+)?last\s+scene\s*",
-            "",
-            t,
-            flags=re.IGNORECASE,
-        ).strip()
+        desc = _MODIFY_LAST_SCENE_HEAD_RE.sub("", t).strip()
         # optional participants list
-        parts: list[str] = []
-        for m in re.finditer(
-            r"(?:participants|con|including|incluyendo)\s+((?:\"[^\"]+\"|'[^']+'|[^,]+)(?:\s*,\s*(?:\"[^\"]+\"|'[^']+'|[^,]+))*)",
-            t,
-            flags=re.IGNORECASE,
-        ):
-            chunk = m.group(1)
-            for p in re.findall(rf"{_RE_QSTR}|([^,]+)", chunk):
-                if isinstance(p, tuple):
-                    q1, q2, plain = p
-                    candidate = (q1 or q2 or plain).strip()
-                else:
-                    candidate = str(p).strip()
-                if candidate:
-                    candidate = re.sub(r"^['\"]|['\"]$", "", candidate)
-                    parts.append(candidate)
+        parts = _extract_participants(t)
         return MonitorIntent(
             action="modify_last_scene", description=(desc or None), participants=(parts or None)
         )
 
     # Retcon entity
-    if re.search(r"\bretcon\b", tl):
-        m = re.search(r"retcon\s+([^\s].*?)\s*(?:to\s+([^\s].*))?$", t, flags=re.IGNORECASE)
+    if _RETCON_RE.search(tl):
+        m = _RETCON_ARGS_RE.search(t)
         name = m.group(1).strip() if m else None
         replacement = (
             m.group(2).strip() if (m and m.lastindex and m.lastindex >= 2 and m.group(2)) else None
@@ -286,53 +319,32 @@ def parse_monitor_intent(text: str) -> MonitorIntent | None:
         return MonitorIntent(action="retcon_entity", entity_name=name, replacement_name=replacement)
 
     # Start a new story (GM onboarding)
-    if re.search(r"\bstart\s+(a\s+)?new\s+story\b", tl) or re.search(
-        r"\biniciar\s+(una\s+)?nueva\s+historia\b", tl
-    ):
-        topics = _extract_name_list(t)
-        interests_match = re.search(r"interests?\s+(.+)$", t, flags=re.IGNORECASE)
-        interests = _extract_name_list(interests_match.group(1)) if interests_match else None
-        system_id = _extract_after(r"(?:system|sistema)", t)
-        uni_name = None
-        m_un = re.search(r"\buniverse\s+('([^']+)'|\"([^\"]+)\")", t, flags=re.IGNORECASE)
-        if m_un:
-            uni_name = m_un.group(2) or m_un.group(3)
-        story_name = None
-        m_st = re.search(r"\bstory\s+('([^']+)'|\"([^\"]+)\")", t, flags=re.IGNORECASE)
-        if m_st:
-            story_name = m_st.group(2) or m_st.group(3)
-        return MonitorIntent(
-            action="start_story",
-            topics=(topics or None),
-            interests=interests,
-            system_id=system_id,
-            name=uni_name,
-            description=story_name,
-        )
+    if _START_STORY_RE.search(tl):
+        return _start_story_intent(t)
 
     # Seed PCs
-    if re.search(r"\bseed\s+(pcs|players)\b", tl) or re.search(r"\bsembrar\s+(pj|pjs)\b", tl):
+    if _SEED_PCS_RE.search(tl):
         names = _extract_name_list(t)
         return MonitorIntent(action="seed_pcs", names=(names or None), kind="PC")
 
     # Seed NPCs
-    if re.search(r"\bseed\s+(npcs|pnjs)\b", tl):
+    if _SEED_NPCS_RE.search(tl):
         names = _extract_name_list(t)
         return MonitorIntent(action="seed_npcs", names=(names or None), kind="NPC")
 
     # Create single entity/character
-    if re.search(r"\b(create|add|crear|agregar)\s+(entity|character|personaje)\b", tl):
+    if _CREATE_ENTITY_RE.search(tl):
         name = _extract_name(t)
         kind = None
-        if re.search(r"\bas\s+pc\b", tl) or re.search(r"\bcomo\s+pj\b", tl):
+        if _AS_PC_RE.search(tl):
             kind = "PC"
-        if re.search(r"\bas\s+npc\b", tl) or re.search(r"\bcomo\s+pnj\b", tl):
+        if _AS_NPC_RE.search(tl):
             kind = "NPC"
         etype = _extract_after(r"(?:type|tipo)", t)
-        if etype and re.match(r"^['\"]", etype):
-            etype = re.sub(r"^['\"]|['\"]$", "", etype)
+        if etype and _QUOTE_START_RE.match(etype):
+            etype = _STRIP_QUOTES_RE.sub("", etype)
         # Optional description for attribute distillation
-        m_desc = re.search(r"\bwith\b\s+('([^']+)'|\"([^\"]+)\"|(.+))$", t, flags=re.IGNORECASE)
+        m_desc = _WITH_DESC_RE.search(t)
         desc = None
         if m_desc:
             desc = (m_desc.group(2) or m_desc.group(3) or m_desc.group(4) or "").strip()
@@ -341,11 +353,7 @@ def parse_monitor_intent(text: str) -> MonitorIntent | None:
         scene = _extract_after(r"(?:scene|escena)", t)
         # Fallback: name right after keyword character/entity
         if not name:
-            m2 = re.search(
-                r"(?:entity|character|personaje)\s+(?:\"([^\"]+)\"|'([^']+)')",
-                t,
-                flags=re.IGNORECASE,
-            )
+            m2 = _ENTITY_NAME_RE.search(t)
             if m2:
                 name = m2.group(1) or m2.group(2)
         return MonitorIntent(
@@ -359,17 +367,82 @@ def parse_monitor_intent(text: str) -> MonitorIntent | None:
         )
 
     # Save conversation
-    if re.search(r"\bsave\s+(the\s+)?conversation\b", tl):
+    if _SAVE_CONVERSATION_RE.search(tl):
         return MonitorIntent(action="save_conversation")
 
     # Show conversation / transcript
-    if re.search(r"\b(show|mostrar)\s+(conversation|transcript|conversación)\b", tl):
+    if _SHOW_CONVERSATION_RE.search(tl):
         return MonitorIntent(action="show_conversation")
 
     # End scene
-    if re.search(r"\b(end|finish|close)\s+(the\s+)?scene\b", tl) or re.search(
-        r"\b(terminar|cerrar)\s+(la\s+)?escena\b", tl
-    ):
+    if _END_SCENE_RE.search(tl):
         return MonitorIntent(action="end_scene")
 
     return None
+
+
+@lru_cache(maxsize=2048)
+def _parse_cached(t: str) -> MonitorIntent | None:
+    return parse_monitor_intent(t)
+
+
+def cached_parse_monitor_intent(text: str) -> MonitorIntent | None:
+    """Memoized parse_monitor_intent for the per-turn hot path.
+
+    Keyed on the stripped text only (quoted names are case-sensitive, so no
+    further normalization). The returned intent is shared: treat it as read-only.
+    """
+    return _parse_cached(text.strip())
+
+
+def _setup_universe_intent(t: str) -> MonitorIntent:
+    id_ = _extract_after(r"(?:universo|universe)", t)
+    name = _extract_name(t)
+    mv = _extract_after(r"(?:multiverso|multiverse)", t)
+    return MonitorIntent(action="setup_universe", id=id_, name=name, multiverse_id=mv)
+
+
+def _start_story_intent(t: str) -> MonitorIntent:
+    topics = _extract_name_list(t)
+    interests_match = _INTERESTS_RE.search(t)
+    interests = _extract_name_list(interests_match.group(1)) if interests_match else None
+    system_id = _extract_after(r"(?:system|sistema)", t)
+    uni_name = None
+    m_un = _UNIVERSE_NAME_RE.search(t)
+    if m_un:
+        uni_name = m_un.group(2) or m_un.group(3)
+    story_name = None
+    m_st = _STORY_NAME_RE.search(t)
+    if m_st:
+        story_name = m_st.group(2) or m_st.group(3)
+    return MonitorIntent(
+        action="start_story",
+        topics=(topics or None),
+        interests=interests,
+        system_id=system_id,
+        name=uni_name,
+        description=story_name,
+    )
+
+
+# Wizard flow -> field extractor for replies to that wizard's prompt
+_WIZARD_REPLY_PARSERS = {
+    "setup_universe": _setup_universe_intent,
+    "gm_onboarding": _start_story_intent,
+}
+
+
+def parse_wizard_reply(flow: str | None, text: str) -> MonitorIntent | None:
+    """Extract the fields of an active wizard from a plain reply.
+
+    Skips the full intent scan: the reply is read only with the flow's own field
+    extractors. Returns None for flows without a reply parser and for replies
+    that carry none of the flow's fields (e.g. a new request mid-wizard).
+    """
+    parse = _WIZARD_REPLY_PARSERS.get(flow or "")
+    intent = parse(text.strip()) if parse else None
+    if intent is None or not any(
+        getattr(intent, f.name) for f in fields(intent) if f.name != "action"
+    ):
+        return None
+    return intent
@@ -60,6 +60,9 @@ class MockQueryService:
     def facts_for_story(self, *_a, **_k):
         return []
 
+    def latest_transcript_fact(self, *_a, **_k):
+        return None
+
     def scenes_for_entity(self, *_a, **_k):
         return []
 
@@ -78,6 +81,12 @@ class MockQueryService:
     def entity_by_name_in_universe(self, *_a, **_k):
         return None
 
+    def entities_by_names_in_universe(self, *_a, **_k):
+        return {}
+
+    def last_scene_for_entity_by_name(self, *_a, **_k):
+        return None
+
     def commit_deltas(self, **_payload):
         """Mock commit that returns successful result without persistence."""
         return {"ok": True, "written": {}, "warnings": []}
@@ -35,13 +35,13 @@ def run_once(
     In copilot, Recorder can pause if MONITOR_COPILOT_PAUSE is truthy.
     """
     tools = ctx or build_live_tools(dry_run=(mode != "autopilot"))
-    from core.generation.providers import select_llm_from_env
+    from core.generation.providers import cached_llm_from_env
 
-    llm = llm or select_llm_from_env()
+    llm = llm or cached_llm_from_env()
     backend = select_engine_backend()
     if backend == "langgraph":
         try:
-            from core.agents.factory import build_agents
+            from core.agents.factory import cached_build_agents
             from core.engine.langgraph_flow import build_langgraph_flow
         except Exception as e:
             # Treat missing/failed LangGraph as app down
@@ -58,7 +58,7 @@ def run_once(
             "retrieval_tool": retrieval_tool,
             "object_upload_tool": object_upload_tool,
             "llm": llm,
-            **build_agents(llm),
+            **cached_build_agents(llm),
         }
         graph = build_langgraph_flow(tools_pkg)
         out = graph.invoke({"intent": user_intent, "scene_id": scene_id})
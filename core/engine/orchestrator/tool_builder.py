@@ -8,15 +8,19 @@ from typing import Any
 from core.engine.autocommit import AutoCommitWorker
 from core.engine.cache import ReadThroughCache, StagingStore
 from core.engine.tools import ToolContext
+from core.generation.interfaces.llm import LLM
 from core.persistence.neo4j_repo import Neo4jRepo
 from core.persistence.queries import QueryService
 from core.persistence.recorder import RecorderService
-from core.utils.env import env_bool, env_str
+from core.utils.env import env_bool, env_float, env_str
 
 # Module-level singletons to avoid spawning a worker per request
 _AUTOCOMMIT_WORKER: AutoCommitWorker | None = None
 _AUTOCOMMIT_QUEUE: Queue | None = None
 _IDEMPOTENCY_SET: set[str] = set()
+# In-memory read caches shared across requests, one per query backend (mock vs live).
+# Writes through recorder_tool clear them; MONITOR_CACHE_TTL bounds staleness otherwise.
+_READ_CACHES: dict[bool, ReadThroughCache] = {}
 
 try:
     from core.engine.cache_redis import RedisReadThroughCache, RedisStagingStore  # type: ignore
@@ -44,6 +48,37 @@ def _fallback_embedder(text: str) -> list[float]:
     return features[:384]
 
 
+def _shared_read_cache(dry_run: bool) -> ReadThroughCache:
+    """Return the process-wide read cache for the given query backend."""
+    cache = _READ_CACHES.get(dry_run)
+    if cache is None:
+        cache = _READ_CACHES[dry_run] = ReadThroughCache(
+            capacity=1024, ttl_seconds=env_float("MONITOR_CACHE_TTL", 10.0)
+        )
+    return cache
+
+
+_DECIDER_SCHEMA = {
+    "type": "object",
+    "properties": {"commit": {"type": "boolean"}, "reason": {"type": "string"}},
+    "required": ["commit", "reason"],
+}
+
+
+def _llm_commit_decision(llm: LLM, payload: dict[str, Any]) -> tuple[bool, str]:
+    """Ask the LLM whether a staged change should be committed; False on any error."""
+    try:
+        obj = llm.complete_json(
+            system_prompt="You are AutoCommit. Decide if this change should be committed.",
+            messages=[{"role": "user", "content": f"Payload: {payload}"}],
+            schema=_DECIDER_SCHEMA,
+            max_tokens=120,
+        )
+        return (bool(obj.get("commit")), str(obj.get("reason") or "agentic"))
+    except Exception:
+        return False, "decider_llm_error"
+
+
 def build_live_tools(dry_run: bool = True) -> ToolContext:
     """Construct a ToolContext backed by the live Neo4j graph using env vars, with optional caching.
 
@@ -78,7 +113,7 @@ def build_live_tools(dry_run: bool = True) -> ToolContext:
         cache = RedisReadThroughCache()
         staging = RedisStagingStore()
     else:
-        cache = ReadThroughCache()
+        cache = _shared_read_cache(dry_run)
         staging = StagingStore()
 
     # Auto-commit setup
@@ -87,24 +122,12 @@ def build_live_tools(dry_run: bool = True) -> ToolContext:
         _IDEMPOTENCY_SET = set()
 
         # Get LLM for agents and decider
-        from core.generation.providers import select_llm_from_env
-        llm = select_llm_from_env()
+        from core.generation.providers import cached_llm_from_env
+        llm = cached_llm_from_env()
 
         def _llm_decider(payload: dict[str, Any]) -> tuple[bool, str]:
             """LLM-based auto-commit decision function."""
-            try:
-                prompt = (
-                    "You are AutoCommit. Decide if this change should be committed.\n"
-                    'Return ONLY JSON: {"commit": <true|false>, "reason": <short>}\n'
-                    f"Payload: {payload}"
-                )
-                ans = llm.chat([{"role": "user", "content": prompt}])
-                txt = ans or "{}"
-                import json as _json
-                obj = _json.loads(txt) if isinstance(txt, str) else {}
-                return (bool(obj.get("commit")), str(obj.get("reason") or "agentic"))
-            except Exception:
-                return False, "decider_llm_error"
+            return _llm_commit_decision(llm, payload)
 
         def _no_llm(payload: dict[str, Any]) -> tuple[bool, str]:
             """Fallback decider when LLM is unavailable."""
@@ -3,7 +3,8 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from core.agents.resolve import resolve_agent
+from core.agents.resolve import cached_resolve_agent
+from core.generation.json_output import parse_json_object
 
 
 def resolve_commit_tool(context: dict[str, Any]) -> dict[str, Any]:
@@ -24,7 +25,7 @@ def resolve_commit_tool(context: dict[str, Any]) -> dict[str, Any]:
         "mode": context.get("mode"),
         "hints": context.get("hints"),
     }
-    agent = resolve_agent(llm)
+    agent = cached_resolve_agent(llm)
     try:
         reply_text = agent.act(
             [{"role": "user", "content": json.dumps(payload, ensure_ascii=False)}]
@@ -34,12 +35,9 @@ def resolve_commit_tool(context: dict[str, Any]) -> dict[str, Any]:
 
     # Normalize defensively
     decision: dict[str, Any] = {"commit": False, "reason": "undecided"}
-    try:
-        obj = json.loads(reply_text) if isinstance(reply_text, str) else {}
-        if isinstance(obj, dict):
-            decision.update(obj)
-    except Exception as e:
-        decision = {"commit": False, "reason": f"resolve_error: {e}"}
+    obj = parse_json_object(reply_text)
+    if obj:
+        decision.update(obj)
     # Fail-open in autopilot if validations are ok and agent didn't produce a usable JSON decision
     try:
         mode = (context.get("mode") or "").lower()
@@ -5,13 +5,9 @@ from typing import Any
 
 from .tool_context import ToolContext
 
-
-def query_tool(ctx: ToolContext, method: str, **kwargs) -> Any:
-    """Generic, whitelisted proxy to QueryService.
-
-    Example: query_tool(ctx, "relations_effective_in_scene", scene_id="scene:1").
-    """
-    allowed = {
+# QueryService methods reachable through query_tool (built once, not per call)
+_ALLOWED_QUERIES = frozenset(
+    {
         # Systems
         "system_usage_summary",
         "effective_system_for_universe",
@@ -34,6 +30,7 @@ def query_tool(ctx: ToolContext, method: str, **kwargs) -> Any:
         # Facts / scenes
         "facts_for_scene",
         "facts_for_story",
+        "latest_transcript_fact",
         "scenes_for_entity",
         "scenes_in_story",
         # Catalog/listing helpers
@@ -43,8 +40,18 @@ def query_tool(ctx: ToolContext, method: str, **kwargs) -> Any:
         "list_universes",
         # Entity lookup helpers
         "entity_by_name_in_universe",
+        "entities_by_names_in_universe",
+        "last_scene_for_entity_by_name",
     }
-    if method not in allowed:
+)
+
+
+def query_tool(ctx: ToolContext, method: str, **kwargs) -> Any:
+    """Generic, whitelisted proxy to QueryService.
+
+    Example: query_tool(ctx, "relations_effective_in_scene", scene_id="scene:1").
+    """
+    if method not in _ALLOWED_QUERIES:
         raise ValueError(f"Query method not allowed: {method}")
     fn: Callable[..., Any] | None = getattr(ctx.query_service, method, None)
     if not callable(fn):
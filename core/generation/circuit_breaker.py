@@ -0,0 +1,45 @@
+"""Minimal circuit breaker for LLM provider calls.
+
+After ``threshold`` consecutive failures the breaker opens and callers skip the
+provider for an exponentially growing window (capped at ``max_backoff_s``), so an
+outage costs one fast check per turn instead of a timeout.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CircuitBreaker:
+    name: str
+    threshold: int = 3
+    base_backoff_s: float = 2.0
+    max_backoff_s: float = 60.0
+    fails: int = 0
+    open_until: float = 0.0
+
+    def allow(self) -> bool:
+        return time.monotonic() >= self.open_until
+
+    def record_success(self) -> None:
+        self.fails = 0
+        self.open_until = 0.0
+
+    def record_failure(self, error: BaseException | None = None) -> None:
+        self.fails += 1
+        if self.fails < self.threshold:
+            return
+        backoff = min(self.max_backoff_s, self.base_backoff_s * 2 ** (self.fails - self.threshold))
+        self.open_until = time.monotonic() + backoff
+        logger.warning(
+            "%s: %d consecutive LLM failures, skipping calls for %.0fs (last error: %s)",
+            self.name,
+            self.fails,
+            backoff,
+            error,
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -20,6 +21,65 @@ class LLM(ABC):
     ) -> str:  # returns assistant text
         raise NotImplementedError
 
+    def stream(
+        self,
+        *,
+        system_prompt: str,
+        messages: list[Message],
+        temperature: float = 0.7,
+        max_tokens: int = 400,
+        extra: dict[str, Any] | None = None,
+    ) -> Iterator[str]:  # yields assistant text chunks
+        """Yield the reply incrementally; backends without streaming yield it whole."""
+        yield self.complete(
+            system_prompt=system_prompt,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra=extra,
+        )
+
+
+    def complete_json(
+        self,
+        *,
+        system_prompt: str,
+        messages: list[Message],
+        schema: dict[str, Any],
+        temperature: float = 0.0,
+        max_tokens: int = 400,
+    ) -> dict[str, Any]:
+        """Return a JSON object matching ``schema``.
+
+        Backends with constrained decoding override this; the default asks for
+        free-form JSON and extracts the first object from the reply. For flat
+        schemas generation stops at the first "}" so no trailing prose is produced.
+        """
+        from core.generation.json_output import parse_json_object
+
+        props = schema.get("properties") or {}
+        flat = all(p.get("type") not in ("object", "array") for p in props.values())
+        out = self.complete(
+            system_prompt=system_prompt,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra={"stop": ["}"]} if flat else None,
+        )
+        # The stop sequence itself is not returned; close the object again
+        if flat and isinstance(out, str) and "{" in out and not out.rstrip().endswith("}"):
+            out += "}"
+        return parse_json_object(out)
+
+
+def collect_stream(chunks: Iterable[str], on_chunk: Callable[[str], Any]) -> str:
+    """Forward each chunk to on_chunk and return the concatenated reply."""
+    parts: list[str] = []
+    for chunk in chunks:
+        on_chunk(chunk)
+        parts.append(chunk)
+    return "".join(parts)
+
 
 @dataclass
 class CompletionConfig:
@@ -0,0 +1,73 @@
+"""Tolerant JSON decoding for LLM replies.
+
+Uses orjson when installed (optional), falling back to the stdlib json module.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import Any
+
+try:  # optional fast decoder
+    import orjson as _orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+logger = logging.getLogger(__name__)
+
+# First flat {...} block in a reply that wraps JSON in prose or code fences
+_JSON_OBJ = re.compile(r"\{[^{}]*\}", re.S)
+# Decodes one value starting at an offset and ignores trailing text
+_DECODER = json.JSONDecoder()
+
+_DECODE_STATS = {"failures": 0}
+
+
+def _loads(raw: str) -> Any:
+    return _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+
+
+def parse_json_object(text: Any) -> dict[str, Any]:
+    """Return the JSON object contained in an LLM reply, or {} if none decodes.
+
+    Strict fast path when the reply is a bare object; otherwise the object at the
+    first ``{`` is decoded (fences and surrounding prose ignored), then the first
+    flat ``{...}`` block is tried. Failures are counted rather than raised.
+    """
+    if not isinstance(text, str):
+        return {}
+    raw = text.strip()
+    if raw.startswith("{"):
+        try:
+            data = _loads(raw)
+            if isinstance(data, dict):
+                return data
+        except ValueError:
+            pass
+    # Prose around the object: decode from the first brace (nested objects ok)
+    start = raw.find("{")
+    if start >= 0:
+        try:
+            data, _end = _DECODER.raw_decode(raw, start)
+            if isinstance(data, dict):
+                return data
+        except ValueError:
+            pass
+    m = _JSON_OBJ.search(raw)
+    if m:
+        try:
+            data = _loads(m.group(0))
+            if isinstance(data, dict):
+                return data
+        except ValueError:
+            pass
+    _DECODE_STATS["failures"] += 1
+    logger.debug("LLM reply did not contain a JSON object: %.80r", raw)
+    return {}
+
+
+def get_json_decode_stats() -> dict[str, int]:
+    """Return counters for LLM replies that failed to decode."""
+    return dict(_DECODE_STATS)
@@ -1,12 +1,75 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from functools import lru_cache
+import hashlib
 import os
+import threading
 from typing import Any
 
 from core.generation.interfaces.llm import LLM, Message
+from core.generation.json_output import parse_json_object
 from core.generation.mock_llm import MockLLM
 
 
+@lru_cache(maxsize=1)
+def _shared_http_client() -> Any | None:
+    """Process-wide httpx client shared by the OpenAI/Groq SDK clients.
+
+    Every provider instance reuses one keep-alive pool (HTTP/2 when the optional
+    h2 package is installed). Returns None to fall back to each SDK's own client.
+    """
+    try:
+        import httpx  # type: ignore
+    except Exception:  # pragma: no cover - httpx ships with the openai/groq SDKs
+        return None
+    try:
+        import h2  # type: ignore  # noqa: F401
+
+        http2 = True
+    except Exception:
+        http2 = False
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+
+
+# Token accounting across provider calls; cached_prompt_tokens shows how much of the
+# prompt the provider served from its automatic prefix cache
+_USAGE = {"calls": 0, "prompt_tokens": 0, "cached_prompt_tokens": 0, "completion_tokens": 0}
+_USAGE_LOCK = threading.Lock()
+
+
+def _record_usage(usage: Any) -> None:
+    """Add an OpenAI-style ``usage`` object to the process-wide counters."""
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) or 0
+    with _USAGE_LOCK:
+        _USAGE["calls"] += 1
+        _USAGE["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+        _USAGE["cached_prompt_tokens"] += cached
+        _USAGE["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+
+
+def get_llm_usage_stats() -> dict[str, float]:
+    """Return token counters and the prompt cache hit ratio since process start."""
+    with _USAGE_LOCK:
+        stats: dict[str, float] = dict(_USAGE)
+    prompt = stats["prompt_tokens"]
+    stats["cache_hit_ratio"] = stats["cached_prompt_tokens"] / prompt if prompt else 0.0
+    return stats
+
+
+@lru_cache(maxsize=32)
+def _prompt_cache_key(system_prompt: str) -> str:
+    """Stable routing key for a system prompt (prompts are module constants)."""
+    return hashlib.sha1(system_prompt.encode("utf-8")).hexdigest()[:16]
+
+
 class OpenAIChat(LLM):
     """OpenAI-compatible chat backend.
 
@@ -20,11 +83,27 @@ class OpenAIChat(LLM):
             from openai import OpenAI  # type: ignore
         except Exception as e:  # pragma: no cover
             raise RuntimeError("openai package not installed; pip install openai") from e
-        kwargs = {"api_key": api_key}
+        kwargs: dict[str, Any] = {"api_key": api_key}
         if base_url:
             kwargs["base_url"] = base_url
+        http_client = _shared_http_client()
+        if http_client is not None:
+            kwargs["http_client"] = http_client
         self._client = OpenAI(**kwargs)  # type: ignore
         self._model = model
+        # Usage on streamed replies; only requested from the official endpoint since
+        # some OpenAI-compatible servers reject stream_options
+        self._stream_options: dict[str, Any] = (
+            {} if base_url else {"stream_options": {"include_usage": True}}
+        )
+        # Requests sharing a system prompt are routed to the same prefix cache;
+        # official endpoint only, like stream_options
+        self._cache_routing = not base_url
+
+    def _cache_hint(self, system_prompt: str) -> dict[str, Any]:
+        if not self._cache_routing:
+            return {}
+        return {"extra_body": {"prompt_cache_key": _prompt_cache_key(system_prompt)}}
 
     def complete(
         self,
@@ -43,10 +122,64 @@ class OpenAIChat(LLM):
             messages=msgs,
             temperature=temperature,
             max_tokens=max_tokens,
+            **self._cache_hint(system_prompt),
             **({} if extra is None else extra),
         )
+        _record_usage(getattr(resp, "usage", None))
         return resp.choices[0].message.content or ""  # type: ignore
 
+    def stream(
+        self,
+        *,
+        system_prompt: str,
+        messages: list[Message],
+        temperature: float = 0.7,
+        max_tokens: int = 400,
+        extra: dict[str, Any] | None = None,
+    ) -> Iterator[str]:
+        msgs = [{"role": "system", "content": system_prompt}] + [
+            {"role": m["role"], "content": m["content"]} for m in messages
+        ]
+        resp = self._client.chat.completions.create(  # type: ignore
+            model=self._model,
+            messages=msgs,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            **self._stream_options,
+            **self._cache_hint(system_prompt),
+            **({} if extra is None else extra),
+        )
+        for chunk in resp:
+            if chunk.choices and chunk.choices[0].delta.content:  # type: ignore
+                yield chunk.choices[0].delta.content  # type: ignore
+            elif getattr(chunk, "usage", None) is not None:
+                _record_usage(chunk.usage)  # final chunk when include_usage is on
+
+    def complete_json(
+        self,
+        *,
+        system_prompt: str,
+        messages: list[Message],
+        schema: dict[str, Any],
+        temperature: float = 0.0,
+        max_tokens: int = 400,
+    ) -> dict[str, Any]:
+        # Structured Outputs: the server guarantees a reply matching the schema
+        out = self.complete(
+            system_prompt=system_prompt,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra={
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {"name": "result", "schema": schema, "strict": True},
+                }
+            },
+        )
+        return parse_json_object(out)
+
 
 class GroqChat(LLM):
     """Groq chat backend.
@@ -62,7 +195,11 @@ class GroqChat(LLM):
             )
         except Exception as e:  # pragma: no cover
             raise RuntimeError("groq package not installed; pip install groq") from e
-        self._client = Groq(api_key=api_key)  # type: ignore
+        http_client = _shared_http_client()
+        if http_client is not None:
+            self._client = Groq(api_key=api_key, http_client=http_client)  # type: ignore
+        else:
+            self._client = Groq(api_key=api_key)  # type: ignore
         self._model = model
         self._BadRequestError = locals().get("BadRequestError")  # type: ignore
 
@@ -86,6 +223,7 @@ class GroqChat(LLM):
                 max_tokens=max_tokens,
                 **({} if extra is None else extra),
             )
+            _record_usage(getattr(resp, "usage", None))
             return resp.choices[0].message.content or ""  # type: ignore
         except Exception as e:  # pragma: no cover - network/client errors
             # Convert common Groq errors into a friendlier message for callers/UI.
@@ -100,6 +238,52 @@ class GroqChat(LLM):
                 pass
             raise RuntimeError(err_msg) from e
 
+    def stream(
+        self,
+        *,
+        system_prompt: str,
+        messages: list[Message],
+        temperature: float = 0.7,
+        max_tokens: int = 400,
+        extra: dict[str, Any] | None = None,
+    ) -> Iterator[str]:
+        msgs = [{"role": "system", "content": system_prompt}] + [
+            {"role": m["role"], "content": m["content"]} for m in messages
+        ]
+        try:
+            resp = self._client.chat.completions.create(  # type: ignore
+                model=self._model,
+                messages=msgs,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **({} if extra is None else extra),
+            )
+            for chunk in resp:
+                if chunk.choices and chunk.choices[0].delta.content:  # type: ignore
+                    yield chunk.choices[0].delta.content  # type: ignore
+        except Exception as e:  # pragma: no cover - network/client errors
+            raise RuntimeError(str(e)) from e
+
+    def complete_json(
+        self,
+        *,
+        system_prompt: str,
+        messages: list[Message],
+        schema: dict[str, Any],
+        temperature: float = 0.0,
+        max_tokens: int = 400,
+    ) -> dict[str, Any]:
+        # JSON mode guarantees a syntactically valid object (schema stays in the prompt)
+        out = self.complete(
+            system_prompt=system_prompt,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra={"response_format": {"type": "json_object"}},
+        )
+        return parse_json_object(out)
+
 
 SUPPORTED_GROQ_MODELS = [
     # Production
@@ -226,3 +410,34 @@ def select_llm_from_env() -> LLM:
             return MockLLM()
     # default mock
     return MockLLM()
+
+
+# Env vars that influence select_llm_from_env(); part of the cached-instance key
+_LLM_ENV_KEYS = (
+    "MONITOR_LLM_BACKEND",
+    "MONITOR_OPENAI_API_KEY",
+    "OPENAI_API_KEY",
+    "MONITOR_OPENAI_MODEL",
+    "MONITOR_OPENAI_BASE_URL",
+    "MONITOR_GROQ_API_KEY",
+    "GROQ_API_KEY",
+    "MONITOR_GROQ_MODEL",
+)
+
+
+@lru_cache(maxsize=8)
+def _llm_for_env(_env_key: tuple[str | None, ...]) -> LLM:
+    return select_llm_from_env()
+
+
+def cached_llm_from_env() -> LLM:
+    """Like select_llm_from_env(), but reuses the instance while the env is unchanged.
+
+    Avoids re-creating provider clients (and their HTTP pools) on every graph node call.
+    """
+    return _llm_for_env(tuple(os.getenv(k) for k in _LLM_ENV_KEYS))
+
+
+def clear_llm_cache() -> None:
+    """Drop cached provider instances (tests, or after rotating credentials in place)."""
+    _llm_for_env.cache_clear()
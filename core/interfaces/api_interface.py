@@ -16,7 +16,7 @@ from core.engine.orchestrator import (
     run_once,
 )
 from core.engine.steward import StewardService
-from core.generation.providers import select_llm_from_env
+from core.generation.providers import cached_llm_from_env
 from core.interfaces.branches_api import router as branches_router
 from core.interfaces.langgraph_modes_api import router as langgraph_modes_router
 from core.loaders.agent_prompts import load_agent_prompts
@@ -101,7 +101,7 @@ class StepRequest(BaseModel):
 
 @app.post("/chat")
 def chat(req: ChatRequest):
-    llm = select_llm_from_env()
+    llm = cached_llm_from_env()
     ctx = build_live_tools(dry_run=(req.mode != "autopilot"))
     outs: list[dict[str, Any]] = []
     for t in req.turns:
@@ -174,9 +174,7 @@ def resolve(req: ResolveRequest):
     ok, warns, errs = svc.validate(merged)
     # Resolve + stage/commit using unified helper
     try:
-        from core.generation.providers import select_llm_from_env
-
-        llm = select_llm_from_env()
+        llm = cached_llm_from_env()
     except Exception:
         llm = None
     live_ctx = build_live_tools(dry_run=(req.mode != "autopilot"))
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from core.engine.modes.graph_builder import build_langgraph_modes
-from core.engine.modes.graph_state import GraphState
+from core.engine.modes.graph_state import GraphState, ensure_history
 from core.engine.orchestrator import build_live_tools
 
 router = APIRouter(tags=["langgraph-modes"])
@@ -33,7 +35,39 @@ class ChatRes(BaseModel):
 
 @router.post("/langgraph/modes/chat", response_model=ChatRes)
 def chat(req: ChatReq, request: Request) -> ChatRes:
-    state = _SESSIONS.get(req.session_id) or {"messages": [], "last_mode": "narration"}
+    state = _prepare_state(req, request)
+
+    out: GraphState = _graph.invoke(state)
+
+    # Extrae última respuesta
+    messages = out.get("messages", [])
+    reply = ""
+    for m in reversed(messages):
+        if m.get("role") == "assistant":
+            reply = m.get("content", "")
+            break
+    if not reply:
+        raise HTTPException(status_code=500, detail="No reply generated")
+
+    _save_session(req.session_id, out)
+    return ChatRes(mode=out.get("mode", "narration"), reply=reply, meta=out.get("meta", {}))
+
+
+@router.post("/langgraph/modes/chat/stream")
+def chat_stream(req: ChatReq, request: Request) -> StreamingResponse:
+    """Same as /chat, but streams the reply text as it is generated."""
+    state = _prepare_state(req, request)
+
+    def _body() -> Iterator[str]:
+        out = yield from _graph.stream(state)
+        _save_session(req.session_id, out)
+
+    return StreamingResponse(_body(), media_type="text/plain; charset=utf-8")
+
+
+def _prepare_state(req: ChatReq, request: Request) -> GraphState:
+    state = _SESSIONS.get(req.session_id) or {"last_mode": "narration"}
+    ensure_history(state)  # bounded deque from the first turn; a no-op afterwards
     state["input"] = req.message
     state["session_id"] = req.session_id
     if req.universe_id:
@@ -64,25 +98,15 @@ def chat(req: ChatReq, request: Request) -> ChatRes:
     except Exception:
         pass
     state["tools"] = tools  # type: ignore[index]
+    return state
 
-    out: GraphState = _graph.invoke(state)
-
-    # Extrae última respuesta
-    messages = out.get("messages", [])
-    reply = ""
-    for m in reversed(messages):
-        if m.get("role") == "assistant":
-            reply = m.get("content", "")
-            break
-    if not reply:
-        raise HTTPException(status_code=500, detail="No reply generated")
 
+def _save_session(session_id: str, out: GraphState) -> None:
     # Persiste sesión (limpiando input y override efímeros)
     cleaned: dict[str, Any] = {
-        k: v for k, v in out.items() if k not in ("input", "override_mode", "tools")
+        k: v for k, v in out.items() if k not in ("input", "override_mode", "tools", "stream_cb")
     }
-    _SESSIONS[req.session_id] = cleaned
-    return ChatRes(mode=out.get("mode", "narration"), reply=reply, meta=out.get("meta", {}))
+    _SESSIONS[session_id] = cleaned
 
 
 class HelpRes(BaseModel):
@@ -0,0 +1,3 @@
+MATCH (u:Universe {id:$uid})-[:HAS_STORY]->(:Story)-[:HAS_SCENE]->(:Scene)<-[:APPEARS_IN]-(e:Entity)
+WHERE toLower(e.name) IN $names
+RETURN DISTINCT e.id AS id, e.name AS name, e.type AS type
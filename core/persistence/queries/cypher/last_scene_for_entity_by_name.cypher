@@ -0,0 +1,6 @@
+MATCH (u:Universe {id:$uid})-[:HAS_STORY]->(st:Story)-[:HAS_SCENE]->(sc:Scene)<-[:APPEARS_IN]-(e:Entity)
+WHERE toLower(e.name) = toLower($name)
+RETURN e.id AS id, e.name AS name, e.type AS type,
+       st.id AS story_id, sc.id AS scene_id, sc.sequence_index AS sequence_index
+ORDER BY story_id DESC, coalesce(sequence_index, -1) DESC
+LIMIT 1
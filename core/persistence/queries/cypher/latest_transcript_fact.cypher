@@ -0,0 +1,12 @@
+CALL {
+  MATCH (f:Fact)-[:OCCURS_IN]->(:Scene {id:$scene_id})
+  WHERE f.description STARTS WITH $prefix
+  RETURN f, 0 AS rank
+  UNION
+  MATCH (:Story {id:$story_id})-[:HAS_SCENE]->(:Scene)<-[:OCCURS_IN]-(f:Fact)
+  WHERE f.description STARTS WITH $prefix
+  RETURN f, 1 AS rank
+}
+RETURN f.id AS id, f.description AS description
+ORDER BY rank, id DESC
+LIMIT 1
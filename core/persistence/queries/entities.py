@@ -69,3 +69,19 @@ class EntitiesQueryService:
             name=name,
         )
         return rows[0] if rows else None
+
+    def entities_by_names_in_universe(
+        self, universe_id: str, names: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Resolve several names in one round trip; maps each found name to its row."""
+        if not names:
+            return {}
+        rows = self.executor._rows(
+            load_query("entities_by_names_in_universe"),
+            uid=universe_id,
+            names=sorted({n.lower() for n in names}),
+        )
+        by_lower: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            by_lower.setdefault(str(row.get("name") or "").lower(), row)
+        return {n: by_lower[n.lower()] for n in names if n.lower() in by_lower}
@@ -4,6 +4,9 @@ from typing import Any, Protocol
 
 from core.persistence.queries.builders.query_loader import load_query
 
+# Description prefix of the facts that store saved conversation transcripts
+TRANSCRIPT_PREFIX = "TRANSCRIPT\n"
+
 
 class QueryExecutor(Protocol):
     """Protocol for executing queries and returning rows."""
@@ -29,3 +32,15 @@ class FactsQueryService:
             load_query("facts_for_story"),
             sid=story_id,
         )
+
+    def latest_transcript_fact(
+        self, scene_id: str | None, story_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Newest saved transcript of the scene, else of any scene in the story."""
+        rows = self.executor._rows(
+            load_query("latest_transcript_fact"),
+            scene_id=scene_id,
+            story_id=story_id,
+            prefix=TRANSCRIPT_PREFIX,
+        )
+        return rows[0] if rows else None
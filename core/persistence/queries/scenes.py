@@ -23,6 +23,15 @@ class ScenesQueryService:
             eid=entity_id,
         )
 
+    def last_scene_for_entity_by_name(self, universe_id: str, name: str) -> dict[str, Any] | None:
+        """Entity (id/name/type) plus its latest scene in the universe, in one round trip."""
+        rows = self.executor._rows(
+            load_query("last_scene_for_entity_by_name"),
+            uid=universe_id,
+            name=name,
+        )
+        return rows[0] if rows else None
+
     def participants_by_role_for_scene(self, scene_id: str) -> list[dict[str, Any]]:
         return self.executor._rows(
             load_query("participants_by_role_for_scene"),
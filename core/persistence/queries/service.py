@@ -39,6 +39,9 @@ class QueryService(BaseQueries):
     def facts_for_story(self, story_id: str):
         return self.facts.facts_for_story(story_id)
 
+    def latest_transcript_fact(self, scene_id: str | None, story_id: str | None = None):
+        return self.facts.latest_transcript_fact(scene_id, story_id)
+
     def relations_effective_in_scene(self, scene_id: str):
         return self.relations.relations_effective_in_scene(scene_id)
 
@@ -81,7 +84,16 @@ class QueryService(BaseQueries):
     def entities_in_arc_by_role(self, arc_id: str, role: str):
         return self.entities.entities_in_arc_by_role(arc_id, role)
 
+    def entity_by_name_in_universe(self, universe_id: str, name: str):
+        return self.entities.entity_by_name_in_universe(universe_id, name)
+
+    def entities_by_names_in_universe(self, universe_id: str, names: list[str]):
+        return self.entities.entities_by_names_in_universe(universe_id, names)
+
     # Additional scenes delegation methods
+    def last_scene_for_entity_by_name(self, universe_id: str, name: str):
+        return self.scenes.last_scene_for_entity_by_name(universe_id, name)
+
     def next_scene_for_entity_in_story(self, story_id: str, entity_id: str, after_sequence_index: int):
         return self.scenes.next_scene_for_entity_in_story(story_id, entity_id, after_sequence_index)
 
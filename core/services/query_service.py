@@ -34,6 +34,9 @@ class QueryServiceFacade(QueryReadPort):
     def facts_for_story(self, story_id: str):  # type: ignore[override]
         return self._impl.facts_for_story(story_id)
 
+    def latest_transcript_fact(self, scene_id: str | None, story_id: str | None = None):  # type: ignore[override]
+        return self._impl.latest_transcript_fact(scene_id, story_id)
+
     def relations_effective_in_scene(self, scene_id: str):  # type: ignore[override]
         return self._impl.relations_effective_in_scene(scene_id)
 
@@ -75,3 +78,9 @@ class QueryServiceFacade(QueryReadPort):
 
     def entity_by_name_in_universe(self, universe_id: str, name: str):  # type: ignore[override]
         return self._impl.entity_by_name_in_universe(universe_id, name)
+
+    def entities_by_names_in_universe(self, universe_id: str, names: list[str]):  # type: ignore[override]
+        return self._impl.entities_by_names_in_universe(universe_id, names)
+
+    def last_scene_for_entity_by_name(self, universe_id: str, name: str):  # type: ignore[override]
+        return self._impl.last_scene_for_entity_by_name(universe_id, name)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime
 import json
 import os
@@ -25,6 +26,9 @@ from core.utils.merge import deep_merge as _dm
 
 st.set_page_config(page_title="MONITOR — Agents Chat", layout="wide")
 
+# Turns kept on screen; Streamlit re-renders the whole history on every rerun
+HISTORY_MAX = 50
+
 
 def build_orchestrator(mode: str) -> dict[str, Any]:
     # Ensure env reflects current sidebar configuration for provider selection
@@ -50,10 +54,10 @@ def build_orchestrator(mode: str) -> dict[str, Any]:
         os.environ.pop("MONITOR_AUTOCOMMIT", None)
 
     from core.engine.orchestrator import build_live_tools
-    from core.generation.providers import select_llm_from_env
+    from core.generation.providers import cached_llm_from_env
 
     ctx = build_live_tools(dry_run=(mode != "autopilot"))
-    llm = select_llm_from_env()
+    llm = cached_llm_from_env()
     # Return runtime pieces directly (no Orchestrator wrapper)
     return {"llm": llm, "ctx": ctx}
 
@@ -67,7 +71,7 @@ def ensure_session_objects():
         "mode": "copilot",
         "scene_id": "",
         "persist_each": False,
-        "history": [],
+        "history": deque(maxlen=HISTORY_MAX),
         "config_key": None,
         "llm": None,
         "ctx": None,
@@ -92,7 +96,7 @@ def current_config_key() -> str:
 
 
 def reset_session():
-    st.session_state["history"] = []
+    st.session_state["history"] = deque(maxlen=HISTORY_MAX)
     st.session_state["llm"] = None
     st.session_state["ctx"] = None
     st.session_state["config_key"] = None
@@ -248,11 +252,11 @@ with st.sidebar:
                 ok, warns, errs = svc.validate(merged)
                 # Ask Resolve agent
                 from core.engine.resolve_tool import resolve_commit_tool
-                from core.generation.providers import select_llm_from_env
+                from core.generation.providers import cached_llm_from_env
 
                 decision = resolve_commit_tool(
                     {
-                        "llm": select_llm_from_env(),
+                        "llm": cached_llm_from_env(),
                         "deltas": merged,
                         "validations": {"ok": ok, "warnings": warns, "errors": errs},
                         "mode": st.session_state.mode,
@@ -34,3 +34,12 @@ def test_character_and_archivist_agents_reply():
     b = arc.act(msgs)
     assert isinstance(a, str) and isinstance(b, str)
     assert "- Summary:" in b
+
+
+def test_cached_build_agents_reused_per_llm():
+    from core.agents import cached_build_agents
+
+    llm = MockLLM()
+    agents = cached_build_agents(llm)
+    assert cached_build_agents(llm) is agents
+    assert cached_build_agents(MockLLM()) is not agents
@@ -138,3 +138,44 @@ def test_staging_and_flush(tmp_path):
     flush_res = ctx.staging.flush(rec, clear_after=True)
     assert flush_res["ok"] is True
     assert ctx.staging.pending() == 0
+
+
+def test_shared_read_cache_is_per_backend(monkeypatch):
+    from core.engine.orchestrator import tool_builder
+
+    monkeypatch.setattr(tool_builder, "_READ_CACHES", {})
+    dry = tool_builder._shared_read_cache(True)
+    assert tool_builder._shared_read_cache(True) is dry
+    assert tool_builder._shared_read_cache(False) is not dry
+
+
+def test_autocommit_llm_decider_uses_llm_interface():
+    from core.engine.orchestrator import tool_builder
+    from core.generation.interfaces.llm import LLM
+
+    class _LLM(LLM):
+        def complete(self, *, system_prompt, messages, **kwargs):
+            return 'Sure: {"commit": true, "reason": "new fact"}'
+
+    class _Broken(LLM):
+        def complete(self, **kwargs):
+            raise RuntimeError("down")
+
+    assert tool_builder._llm_commit_decision(_LLM(), {"facts": [1]}) == (True, "new fact")
+    assert tool_builder._llm_commit_decision(_Broken(), {}) == (False, "decider_llm_error")
+
+
+def test_read_through_cache_is_thread_safe():
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = ReadThroughCache(capacity=8, ttl_seconds=60)
+
+    def churn(n: int) -> None:
+        for i in range(2000):
+            key = str((n + i) % 16)
+            cache.set(key, i)
+            cache.get(str(i % 16))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(churn, range(8)))
+    assert cache.size() <= 8
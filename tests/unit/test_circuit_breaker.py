@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from core.generation.circuit_breaker import CircuitBreaker
+
+
+def test_breaker_opens_after_threshold_and_resets_on_success():
+    cb = CircuitBreaker("t", threshold=2, base_backoff_s=30.0)
+    cb.record_failure(RuntimeError("boom"))
+    assert cb.allow()
+    cb.record_failure(RuntimeError("boom"))
+    assert not cb.allow()
+    cb.record_success()
+    assert cb.allow() and cb.fails == 0
+
+
+def test_router_skips_llm_while_breaker_open(monkeypatch):
+    import core.engine.modes.router as router
+
+    calls = []
+
+    def failing(*_a):
+        calls.append(1)
+        raise ConnectionError("down")
+
+    monkeypatch.setattr(router, "_llm_classify", failing)
+    monkeypatch.setattr(router, "_LLM_BREAKER", CircuitBreaker("router", threshold=1))
+    for _ in range(3):
+        out = router.classify_intent({"input": "hola"})
+        assert out["meta"]["router"]["reason"] == "fallback"
+    assert len(calls) == 1
+
+
+def test_monitor_stream_failure_keeps_sent_text_in_reply(monkeypatch):
+    import core.engine.modes.monitor_actions as ma
+
+    class _LLM:
+        def stream(self, **kwargs):
+            yield "Hay tres"
+            raise ConnectionError("dropped")
+
+    monkeypatch.setattr(ma, "cached_llm_from_env", lambda: _LLM())
+    monkeypatch.setattr(ma, "_LLM_BREAKER", CircuitBreaker("monitor", threshold=5))
+    chunks: list[str] = []
+    reply = ma.generate_llm_response({"messages": [], "stream_cb": chunks.append}, "cuantos?")
+    assert reply == "".join(chunks)
+    assert reply.startswith("Hay tres") and reply.endswith(ma._LLM_UNAVAILABLE_REPLY)
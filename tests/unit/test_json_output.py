@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from core.generation.json_output import get_json_decode_stats, parse_json_object
+
+
+def test_parse_json_object_bare_and_wrapped():
+    assert parse_json_object('{"intent": "monitor"}') == {"intent": "monitor"}
+    wrapped = 'Sure! ```json\n{"intent": "narration", "confidence": 0.8}\n```'
+    assert parse_json_object(wrapped) == {"intent": "narration", "confidence": 0.8}
+
+
+def test_parse_json_object_preamble_with_nested_object():
+    reply = 'Decision: {"commit": true, "fixes": {"name": "x"}} -- done'
+    assert parse_json_object(reply) == {"commit": True, "fixes": {"name": "x"}}
+
+
+def test_parse_json_object_trailing_prose_keeps_outer_object():
+    reply = '{"commit": true, "fixes": {"name": "x"}}\nHope this helps!'
+    assert parse_json_object(reply) == {"commit": True, "fixes": {"name": "x"}}
+
+
+def test_parse_json_object_counts_failures():
+    before = get_json_decode_stats()["failures"]
+    assert parse_json_object("no json here") == {}
+    assert parse_json_object(None) == {}
+    assert get_json_decode_stats()["failures"] == before + 1
+
+
+def test_complete_json_default_uses_stop_and_closes_object():
+    from core.generation.interfaces.llm import LLM
+
+    class StopAwareLLM(LLM):
+        def complete(self, *, extra=None, **_kwargs) -> str:
+            self.extra = extra
+            return '{"intent": "monitor", "confidence": 0.9'  # cut at the stop sequence
+
+    llm = StopAwareLLM()
+    schema = {"type": "object", "properties": {"intent": {"type": "string"}}}
+    data = llm.complete_json(system_prompt="s", messages=[], schema=schema)
+    assert llm.extra == {"stop": ["}"]}
+    assert data == {"intent": "monitor", "confidence": 0.9}
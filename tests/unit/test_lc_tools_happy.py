@@ -55,6 +55,8 @@ def test_build_langchain_tools_happy(monkeypatch):
     qt = next(t for t in tools if t.name == "query_tool")
     out = qt.invoke({"method": "relations_effective_in_scene", "scene_id": "s1"})
     assert out and isinstance(out, list)
+    with pytest.raises(ValueError):
+        qt.invoke({"method": "delete_everything"})
 
     # Recorder tool should call our fake recorder
     rt = next(t for t in tools if t.name == "recorder_tool")
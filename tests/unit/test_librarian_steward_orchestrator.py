@@ -44,6 +44,29 @@ def test_librarian_scene_brief():
     assert "Context for scene s1" in out and "Relations:" in out and "Facts:" in out
 
 
+def test_librarian_scene_brief_async_matches_sync():
+    import asyncio
+
+    lb = LibrarianService(QImpl())
+    assert asyncio.run(lb.scene_brief_async("s1")) == lb.scene_brief("s1")
+
+
+def test_librarian_scene_brief_keeps_every_section_limit():
+    class Full:
+        def relations_effective_in_scene(self, scene_id):
+            return [{"a": f"A{i}", "b": "B", "type": "ALLY"} for i in range(20)]
+
+        def entities_in_scene(self, scene_id):
+            return [{"id": f"e{i}"} for i in range(20)]
+
+        def facts_for_scene(self, scene_id):
+            return [{"description": f"fact {i}"} for i in range(20)]
+
+    out = LibrarianService(Full()).scene_brief("s1", {"rels": 2, "ents": 2, "facts": 3})
+    assert out.count("-[ALLY]->") == 2
+    assert sum(line.startswith("  • fact") for line in out.splitlines()) == 3
+
+
 def test_steward_validate():
     st = StewardService(QImpl())
     ok, warns, errs = st.validate(
@@ -0,0 +1,554 @@
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from core.engine.modes.narrator_node import narrator_node
+
+
+def test_narrator_node_streams_reply_to_callback():
+    chunks: list[str] = []
+    state = {"input": "Abre la puerta", "messages": [], "stream_cb": chunks.append}
+    out = narrator_node(state)
+    reply = out["messages"][-1]["content"]
+    assert chunks and "".join(chunks) == reply
+    assert out["last_mode"] == "narration"
+
+
+def test_append_message_bounds_history():
+    from core.engine.modes.constants import CHAT_HISTORY_MAX
+    from core.engine.modes.graph_state import append_message, recent_messages
+
+    state: dict = {"messages": [{"role": "user", "content": "first"}]}
+    for i in range(CHAT_HISTORY_MAX + 5):
+        append_message(state, "assistant", str(i))
+    assert len(state["messages"]) == CHAT_HISTORY_MAX
+    assert [m["content"] for m in recent_messages(state, 2)] == [
+        str(CHAT_HISTORY_MAX + 3),
+        str(CHAT_HISTORY_MAX + 4),
+    ]
+
+
+def test_generate_id_is_unique_and_prefixed():
+    from core.engine.modes.graph_state import generate_id
+
+    ids = [generate_id("scene") for _ in range(1000)]
+    assert len(set(ids)) == len(ids)
+    assert all(i.startswith("scene:") for i in ids)
+
+
+def test_anchored_messages_keeps_window_start_stable():
+    from core.engine.modes.constants import CHAT_HISTORY_MAX, LLM_CONTEXT_STEP
+    from core.engine.modes.graph_state import anchored_messages, append_message
+
+    state: dict = {"messages": []}
+    starts = []
+    for i in range(CHAT_HISTORY_MAX + 20):
+        append_message(state, "assistant", str(i))
+        window = anchored_messages(state, 6)
+        assert 6 - LLM_CONTEXT_STEP < len(window) <= 6 or i < 6
+        assert window[-1]["content"] == str(i)
+        starts.append(window[0]["content"])
+    # The first message only changes once per block, also after the deque is full
+    tail = starts[-(2 * LLM_CONTEXT_STEP) :]
+    assert sum(a != b for a, b in zip(tail, tail[1:], strict=False)) <= 2
+
+
+def test_anchored_window_opens_on_user_turns():
+    from core.engine.modes.constants import LLM_CONTEXT_TURNS
+    from core.engine.modes.graph_state import anchored_messages, append_message
+
+    state: dict = {"messages": []}
+    prefixes = []
+    for i in range(20):
+        append_message(state, "user", f"q{i}")
+        append_message(state, "assistant", f"a{i}")
+        window = anchored_messages(state, LLM_CONTEXT_TURNS - 1)
+        assert window[0]["role"] == "user"
+        prefixes.append(window[0]["content"])
+    # Once the history outgrows the window, each prefix serves two consecutive turns
+    assert all(prefixes[k] == prefixes[k + 1] for k in range(3, 19, 2))
+
+
+def test_build_langgraph_modes_reuses_compiled_graph():
+    pytest.importorskip("langgraph")
+    from core.engine.modes.graph_builder import build_langgraph_modes
+
+    first, second = build_langgraph_modes(), build_langgraph_modes()
+    assert first is second
+    with_tools = build_langgraph_modes(tools=object())  # type: ignore[arg-type]
+    assert with_tools is not first
+    assert with_tools._compiled is first._compiled
+
+
+def test_ainvoke_batch_preserves_order():
+    import asyncio
+
+    from core.engine.modes.graph_builder import build_langgraph_modes
+
+    graph = build_langgraph_modes()
+    inputs = [{"input": f"turno {i}", "messages": []} for i in range(3)]
+    outs = asyncio.run(graph.ainvoke_batch(inputs))
+    assert [o["input"] for o in outs] == ["turno 0", "turno 1", "turno 2"]
+    assert all(o["messages"][-1]["role"] == "assistant" for o in outs)
+
+
+def test_compiled_modes_graph_returns_state_sync_and_async():
+    import asyncio
+
+    pytest.importorskip("langgraph")
+    from core.engine.modes.graph_builder import _get_compiled_graph
+
+    graph = _get_compiled_graph()
+    out = graph.invoke({"input": "/monitor estado", "messages": []})
+    assert out is not None and out["mode"] == "monitor"
+    out = asyncio.run(graph.ainvoke({"input": "/narrar sigue", "messages": []}))
+    assert out is not None and out["mode"] == "narration"
+    assert out["messages"][-1]["role"] == "assistant"
+
+
+def test_adapter_stream_yields_reply_and_returns_state():
+    from core.engine.modes.graph_builder import build_langgraph_modes
+
+    graph = build_langgraph_modes()
+    chunks: list[str] = []
+
+    def consume():
+        out = yield from graph.stream({"input": "Abre la puerta", "messages": []})
+        chunks.append(out)
+
+    streamed = list(consume())
+    out = chunks[0]
+    assert "".join(streamed) == out["messages"][-1]["content"]
+    assert "stream_cb" not in out
+
+
+def test_adapter_does_not_rerun_a_partly_streamed_turn():
+    from core.engine.modes.graph_builder import _create_langgraph_adapter
+
+    class _Compiled:
+        def __init__(self, emit: bool):
+            self.emit = emit
+
+        def invoke(self, state):
+            if self.emit:
+                state["stream_cb"]("Abre")
+            raise RuntimeError("graph failed")
+
+    chunks: list[str] = []
+    state = {"input": "Abre la puerta", "messages": [], "stream_cb": chunks.append}
+    with pytest.raises(RuntimeError):
+        _create_langgraph_adapter(None, _Compiled(emit=True)).invoke(state)
+    assert chunks == ["Abre"]
+
+    # Nothing sent yet: the sequential fallback answers the turn
+    out = _create_langgraph_adapter(None, _Compiled(emit=False)).invoke({**state})
+    assert out["messages"][-1]["role"] == "assistant"
+
+
+def test_intent_classifier_uses_structured_output(monkeypatch):
+    from core.engine.modes import intent_classifier
+    from core.engine.modes.constants import INTENT_SCHEMA
+
+    seen: dict = {}
+
+    class _LLM:
+        def complete_json(self, **kwargs):
+            seen.update(kwargs)
+            return {"intent": "monitor", "confidence": 0.8, "reason": "ops"}
+
+    monkeypatch.setattr(intent_classifier, "cached_llm_from_env", lambda: _LLM())
+    intent_classifier.clear_intent_cache()
+    out = intent_classifier.classify_intent({"input": "revisa los registros", "messages": []})
+    assert out["mode"] == "monitor"
+    assert out["meta"]["router"]["reason"] == "llm:ops"
+    assert seen["schema"] is INTENT_SCHEMA
+
+
+def test_intent_classifier_caches_llm_verdicts(monkeypatch):
+    from core.engine.modes import intent_classifier
+
+    calls = {"n": 0}
+
+    class _LLM:
+        def complete_json(self, **kwargs):
+            calls["n"] += 1
+            return {"intent": "monitor", "confidence": 0.8, "reason": "ops"}
+
+    monkeypatch.setattr(intent_classifier, "cached_llm_from_env", lambda: _LLM())
+    intent_classifier.clear_intent_cache()
+    for text in ("Revisa los registros", "revisa   los registros"):
+        out = intent_classifier.classify_intent({"input": text, "messages": []})
+        assert out["mode"] == "monitor"
+    assert calls["n"] == 1
+    intent_classifier.clear_intent_cache()
+
+
+def test_intent_classifier_drops_rejected_llm_verdicts(monkeypatch):
+    from core.engine.modes import intent_classifier
+
+    calls = {"n": 0}
+    recorded: list[tuple[str, str]] = []
+
+    class _LLM:
+        def complete_json(self, **kwargs):
+            calls["n"] += 1
+            return {"intent": "monitor", "confidence": 0.3, "reason": "unsure"}
+
+    monkeypatch.setattr(intent_classifier, "cached_llm_from_env", lambda: _LLM())
+    monkeypatch.setattr(intent_classifier, "record_verdict", lambda *a: recorded.append(a))
+    intent_classifier.clear_intent_cache()
+    for _ in range(2):
+        out = intent_classifier.classify_intent({"input": "revisa los registros"})
+        assert out["mode"] == "narration"
+    assert calls["n"] == 2 and recorded == []
+    intent_classifier.clear_intent_cache()
+
+
+def test_intent_keyword_prefilter_skips_llm(monkeypatch):
+    from core.engine.modes import intent_classifier
+
+    class _LLM:
+        def complete_json(self, **kwargs):
+            raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(intent_classifier, "cached_llm_from_env", lambda: _LLM())
+    out = intent_classifier.classify_intent({"input": "I roll the dice and continue"})
+    assert out["mode"] == "narration"
+    assert out["meta"]["router"]["reason"] == "keyword_prefilter"
+    assert intent_classifier._keyword_prefilter("roll to save") is None
+
+
+def test_help_command_routes_to_monitor_without_llm(monkeypatch):
+    from core.engine.modes import intent_classifier
+
+    class _LLM:
+        def complete_json(self, **kwargs):
+            raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(intent_classifier, "cached_llm_from_env", lambda: _LLM())
+    out = intent_classifier.classify_intent({"input": "/help"})
+    assert out["mode"] == "monitor"
+    assert out["_help"] is True
+
+    from core.engine.modes.constants import HELP_TEXT
+    from core.engine.modes.monitor_node import monitor_node
+
+    out = monitor_node(out)
+    assert out["messages"][-1]["content"] == HELP_TEXT
+    # The flag is consumed: the next monitor turn in the session is not help again
+    out["input"] = "/monitor lista los universos"
+    out = monitor_node(out)
+    assert out["messages"][-1]["content"] != HELP_TEXT
+
+
+def test_speculative_routing_uses_previous_verdict(monkeypatch):
+    from core.engine.modes import intent_classifier
+
+    class _LLM:
+        def complete_json(self, **kwargs):
+            return {"intent": "monitor", "confidence": 0.8, "reason": "ops"}
+
+    monkeypatch.setattr(intent_classifier, "cached_llm_from_env", lambda: _LLM())
+    monkeypatch.setattr(intent_classifier, "_SPECULATIVE", True)
+    intent_classifier.clear_intent_cache()
+
+    first = intent_classifier.classify_intent({"input": "revisa esto", "session_id": "s1"})
+    assert first["mode"] == "narration"  # no prior yet; the LLM runs in background
+    intent_classifier._REFINED.get("s1").result(timeout=5)
+
+    second = intent_classifier.classify_intent({"input": "y aquello", "session_id": "s1"})
+    assert second["mode"] == "monitor"
+    assert second["meta"]["router"]["reason"] == "speculative:prior"
+    intent_classifier._REFINED.get("s1").result(timeout=5)
+    intent_classifier.clear_intent_cache()
+
+
+def test_speculative_routing_uses_cached_verdict_or_sync_path(monkeypatch):
+    from core.engine.modes import intent_classifier
+
+    class _LLM:
+        def complete_json(self, **kwargs):
+            return {"intent": "monitor", "confidence": 0.8, "reason": "ops"}
+
+    monkeypatch.setattr(intent_classifier, "cached_llm_from_env", lambda: _LLM())
+    monkeypatch.setattr(intent_classifier, "_SPECULATIVE", True)
+    intent_classifier.clear_intent_cache()
+
+    # No session: the synchronous LLM path decides instead of defaulting to narration
+    out = intent_classifier.classify_intent({"input": "revisa esto"})
+    assert out["mode"] == "monitor"
+    assert out["meta"]["router"]["reason"] == "llm:ops"
+
+    # A cached verdict for the input wins over the (missing) session prior
+    out = intent_classifier.classify_intent({"input": "Revisa  esto", "session_id": "s9"})
+    assert out["mode"] == "monitor"
+    assert out["meta"]["router"]["reason"] == "llm:ops"
+    assert intent_classifier._REFINED.get("s9") is None
+    intent_classifier.clear_intent_cache()
+
+
+def test_speculative_routing_reads_while_refining(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from core.engine.cache import ReadThroughCache
+    from core.engine.modes import intent_classifier
+
+    class _LLM:
+        def complete_json(self, **kwargs):
+            return {"intent": "monitor", "confidence": 0.8, "reason": "ops"}
+
+    monkeypatch.setattr(intent_classifier, "cached_llm_from_env", lambda: _LLM())
+    monkeypatch.setattr(intent_classifier, "_SPECULATIVE", True)
+    # Small caches so eviction runs alongside the reads
+    monkeypatch.setattr(intent_classifier, "_VERDICT_CACHE", ReadThroughCache(capacity=8))
+    monkeypatch.setattr(intent_classifier, "_REFINED", ReadThroughCache(capacity=8))
+
+    def turn(i: int) -> str:
+        state = {"input": f"revisa esto {i % 32}", "session_id": f"s{i % 16}"}
+        return intent_classifier.classify_intent(state)["mode"]
+
+    # Request threads read both caches while the refine workers fill them
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        modes = list(pool.map(turn, range(400)))
+    intent_classifier._REFINE_POOL.submit(lambda: None).result(timeout=5)
+    assert set(modes) <= {"monitor", "narration"}
+    intent_classifier.clear_intent_cache()
+
+
+def test_wizard_reply_skips_full_parser(monkeypatch):
+    from core.engine.modes import monitor_node as mn
+
+    state = {"input": "setup universe", "messages": []}
+    mn.monitor_node(state)
+    assert state["meta"]["wizard"]["needs"] == ["multiverse_id", "name"]
+    assert len(state["messages"]) == 1  # wizard prompt only, no LLM fallback
+
+    monkeypatch.setattr(mn, "cached_parse_monitor_intent", lambda _t: pytest.fail("full parse"))
+    state["input"] = "multiverse mv:demo"
+    mn.monitor_node(state)
+    assert state["meta"]["wizard"]["needs"] == ["name"]
+    assert state["meta"]["wizard"]["multiverse_id"] == "mv:demo"
+
+
+def test_wizard_reply_without_fields_uses_full_parser(monkeypatch):
+    from core.engine.modes import monitor_node as mn
+
+    state = {"input": "setup universe", "messages": []}
+    mn.monitor_node(state)
+    seen: list[str] = []
+    monkeypatch.setattr(mn, "cached_parse_monitor_intent", lambda t: seen.append(t))
+    state["input"] = "list universes"
+    mn.monitor_node(state)
+    assert seen == ["list universes"]
+
+
+def test_run_in_background_skips_when_saturated(monkeypatch):
+    import threading
+
+    from core.engine.modes import monitor_actions
+
+    monkeypatch.setattr(monitor_actions, "_BACKGROUND_SLOTS", threading.BoundedSemaphore(1))
+    gate = threading.Event()
+    first = monitor_actions.run_in_background(gate.wait, 5)
+    assert first is not None
+    assert monitor_actions.run_in_background(gate.wait, 5) is None
+    gate.set()
+    assert first.result(timeout=5) is True
+
+
+def test_run_in_background_releases_the_slot_it_took(monkeypatch):
+    import threading
+
+    from core.engine.modes import monitor_actions
+
+    taken, rebound = threading.BoundedSemaphore(1), threading.BoundedSemaphore(1)
+    monkeypatch.setattr(monitor_actions, "_BACKGROUND_SLOTS", taken)
+    gate = threading.Event()
+    job = monitor_actions.run_in_background(gate.wait, 5)
+    monkeypatch.setattr(monitor_actions, "_BACKGROUND_SLOTS", rebound)
+    gate.set()
+    job.result(timeout=5)
+    # Released on the semaphore it came from; the rebound one is untouched
+    assert taken.acquire(timeout=5)
+    assert rebound.acquire(blocking=False) and not rebound.acquire(blocking=False)
+
+
+def test_modular_handlers_share_the_background_slot_budget(monkeypatch):
+    import threading
+
+    from core.engine.modes import monitor_actions
+    from core.engine.modes.monitor import entity_management_handlers, setup_handlers
+
+    monkeypatch.setattr(monitor_actions, "_BACKGROUND_SLOTS", threading.BoundedSemaphore(1))
+    gate = threading.Event()
+    first = monitor_actions.run_in_background(gate.wait, 5)
+    assert setup_handlers.run_in_background(gate.wait, 5) is None
+    assert entity_management_handlers.run_in_background(gate.wait, 5) is None
+    gate.set()
+    assert first.result(timeout=5) is True
+
+
+def test_async_classify_prefetches_scene_brief_for_narration(monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+
+    from core.engine.modes import graph_builder
+    from core.engine.modes import narrator_node as nn
+
+    class Q:
+        def relations_effective_in_scene(self, scene_id):
+            return []
+
+        def entities_in_scene(self, scene_id):
+            return [{"id": "e1"}]
+
+        def facts_for_scene(self, scene_id):
+            return []
+
+    monkeypatch.setattr(nn, "NARRATOR_BRIEF", True)
+    state = {
+        "input": "/narrar abre la puerta",
+        "messages": [],
+        "scene_id": "sc1",
+        "tools": SimpleNamespace(query_service=Q()),
+    }
+    out = asyncio.run(graph_builder._aclassify_and_prefetch(state))
+    assert out["mode"] == "narration"
+    assert out["_librarian_brief"].startswith("Context for scene sc1")
+    out = nn.narrator_node(out)
+    assert out["_librarian_brief"] is None
+
+
+def test_async_classify_cancels_brief_prefetch_on_error(monkeypatch):
+    import asyncio
+
+    from core.engine.modes import graph_builder
+
+    started = asyncio.Event()
+    tasks = []
+
+    async def _slow_brief(state):
+        tasks.append(asyncio.current_task())
+        started.set()
+        await asyncio.sleep(10)
+
+    async def _failing_classify(state):
+        await started.wait()
+        raise RuntimeError("classifier down")
+
+    monkeypatch.setattr(graph_builder, "aprefetch_scene_brief", _slow_brief)
+    monkeypatch.setattr(graph_builder, "aclassify_intent", _failing_classify)
+
+    async def _run():
+        with pytest.raises(RuntimeError):
+            await graph_builder._aclassify_and_prefetch({"input": "x"})
+        await asyncio.sleep(0)
+        return tasks[0].cancelled()
+
+    assert asyncio.run(_run()) is True
+
+
+def test_scene_wizard_commits_ready_primer_with_scene(monkeypatch):
+    from core.engine.modes.monitor import entity_management_handlers as emh
+
+    commits: list[dict] = []
+    monkeypatch.setattr(emh, "commit_deltas", lambda ctx, d: commits.append(d) or {"mode": "dry"})
+    monkeypatch.setattr(emh, "_generate_primer", lambda title: f"Gancho de {title}")
+    monkeypatch.setattr(emh, "PRIMER_WAIT_S", 5.0)
+
+    state = {"messages": [], "meta": {"wizard": {"flow": "setup_scene", "story_id": "st"}}}
+    out = emh.handle_wizard_setup_scene(state, 'nombre "Llegada"', object())
+    assert len(commits) == 1
+    assert commits[0]["new_scene"]["id"] == out["scene_id"]
+    assert commits[0]["facts"][0]["description"] == "Gancho de Llegada"
+    assert "wizard" not in out["meta"]
+
+
+def test_scene_wizard_does_not_promise_an_unscheduled_primer(monkeypatch):
+    from core.engine.modes.monitor import entity_management_handlers as emh
+
+    monkeypatch.setattr(emh, "commit_deltas", lambda ctx, d: {"mode": "dry"})
+    monkeypatch.setattr(emh, "_generate_primer", lambda title: pytest.fail("primer"))
+    state = {"messages": [], "meta": {"wizard": {"flow": "setup_scene", "story_id": "st"}}}
+    out = emh.handle_wizard_setup_scene(state, 'nombre "Llegada"', None)
+    assert "narrativa inicial" not in out["messages"][-1]["content"]
+
+    # Pool saturated: nothing scheduled, so nothing promised
+    monkeypatch.setattr(emh, "run_in_background", lambda *a: None)
+    state = {"messages": [], "meta": {"wizard": {"flow": "setup_scene", "story_id": "st"}}}
+    out = emh.handle_wizard_setup_scene(state, 'nombre "Llegada"', object())
+    assert "narrativa inicial" not in out["messages"][-1]["content"]
+
+
+def test_last_seen_falls_back_to_latest_scene_without_sorting():
+    from core.engine.modes.monitor.entity_handlers import handle_last_seen
+    from core.engine.monitor_parser import MonitorIntent
+    from core.engine.tools import ToolContext
+
+    class _Q:  # no fused last_scene_for_entity_by_name query
+        def entity_by_name_in_universe(self, universe_id, name):
+            return {"id": "e1", "name": name}
+
+        def scenes_for_entity(self, entity_id):
+            return [
+                {"story_id": "st2", "scene_id": "sc9", "sequence_index": None},
+                {"story_id": "st2", "scene_id": "sc3", "sequence_index": 3},
+                {"story_id": "st1", "scene_id": "sc7", "sequence_index": 7},
+            ]
+
+    intent = MonitorIntent(action="last_seen", entity_name="Deadpool", universe_id="u1")
+    out = handle_last_seen({"messages": []}, intent, ToolContext(query_service=_Q()))
+    assert "story=st2, scene=sc3" in out["messages"][-1]["content"]
+
+
+def test_monitor_reply_appends_reply_and_marks_mode():
+    from core.engine.modes.monitor.utils import monitor_reply
+
+    @monitor_reply
+    def handler(state, intent, ctx):
+        """Doc."""
+        state["scene_id"] = "sc1"
+        return "done"
+
+    state = {"messages": []}
+    out = handler(state, None, None)
+    assert out is state
+    assert out["messages"][-1] == {"role": "assistant", "content": "done"}
+    assert out["last_mode"] == "monitor" and out["scene_id"] == "sc1"
+    assert handler.__doc__ == "Doc."
+
+
+def test_legacy_modular_narration_node_runs_narrator():
+    from core.engine import langgraph_modes_modular as lm
+
+    state = {"input": "Abre la puerta", "messages": []}
+    out = lm.narration_node(state, None)
+    assert out["last_mode"] == "narration"
+    assert out["messages"][-1]["role"] == "assistant"
+
+
+def test_start_story_promises_intro_only_when_scheduled(monkeypatch):
+    from core.engine.modes.monitor import setup_handlers
+    from core.engine.monitor_parser import MonitorIntent
+
+    monkeypatch.setattr(setup_handlers, "commit_deltas", lambda ctx, d: {"mode": "dry"})
+    intent = MonitorIntent(action="start_story", topics=["noir"], description="Night Shift")
+    out = setup_handlers.handle_start_story({"messages": []}, intent, None)
+    assert "intro is being written" not in out["messages"][-1]["content"]
+
+    monkeypatch.setattr(setup_handlers, "run_in_background", lambda *a: object())
+    out = setup_handlers.handle_start_story({"messages": []}, intent, object())
+    assert "intro is being written" in out["messages"][-1]["content"]
+
+
+def test_live_intro_beat_swallows_commit_errors(monkeypatch):
+    from core.engine.modes import monitor_actions, wizard_flows
+
+    def boom(*_a):
+        raise RuntimeError("neo4j down")
+
+    monkeypatch.setattr(wizard_flows, "_generate_intro_beat", lambda _w: "Intro")
+    monkeypatch.setattr(monitor_actions, "commit_deltas", boom)
+    wizard_flows._record_intro_beat({"tools": object()}, {}, "sc1", "u1")
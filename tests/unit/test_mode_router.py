@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+import core.engine.modes.router as router
+from core.generation.interfaces.llm import LLM
+
+
+class CountingLLM(LLM):
+    def __init__(self, intent: str = "monitor", confidence: float = 0.8):
+        self.calls = 0
+        self.payload = json.dumps({"intent": intent, "confidence": confidence, "reason": "r"})
+
+    def complete(self, **kwargs) -> str:
+        self.calls += 1
+        self.last_kwargs = kwargs
+        return self.payload
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    fake = CountingLLM()
+    monkeypatch.setattr(router, "cached_llm_from_env", lambda: fake)
+    router.clear_router_cache()
+    yield fake
+    router.clear_router_cache()
+
+
+def test_router_llm_cache_hits_on_normalized_repeat(llm):
+    first = router.classify_intent({"input": "Hola  Mundo"})
+    second = router.classify_intent({"input": "  hola mundo "})
+    assert first["mode"] == second["mode"] == "monitor"
+    assert llm.calls == 1
+    stats = router.get_router_cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_router_llm_cache_keyed_by_last_mode(llm):
+    router.classify_intent({"input": "hola", "last_mode": "narration"})
+    router.classify_intent({"input": "hola", "last_mode": "monitor"})
+    assert llm.calls == 2
+
+
+def test_router_skips_llm_for_command_prefix(llm):
+    out = router.classify_intent({"input": "/narrar sigue la historia"})
+    assert out["mode"] == "narration"
+    assert out["meta"]["router"]["reason"] == "command_prefix"
+    assert llm.calls == 0
+
+
+@pytest.mark.parametrize(
+    "text,cmd",
+    [
+        ("/MONITOR list universes", "mon"),
+        ("@Narrador sigue", "nar"),
+        ("Help", "help"),
+        ("helpful hint", None),
+        ("el monitor dice", None),
+    ],
+)
+def test_match_command_is_case_insensitive_and_anchored(text, cmd):
+    from core.engine.modes.constants import match_command
+
+    assert match_command(text) == cmd
+
+
+def test_decode_intent_verdict_validates_and_clamps():
+    from core.engine.modes.constants import decode_intent_verdict
+
+    v = decode_intent_verdict({"intent": "Monitor", "confidence": 3, "reason": "ops"})
+    assert v == ("monitor", 1.0, "ops") and v.confidence == 1.0
+    with pytest.raises(ValueError):
+        decode_intent_verdict({"intent": "chat", "confidence": 0.9})
+
+
+def test_router_llm_disabled_keeps_heuristic(monkeypatch, llm):
+    monkeypatch.setattr(router, "_LLM_ROUTER_ENABLED", False)
+    out = router.classify_intent({"input": "hola otra vez", "last_mode": "monitor"})
+    assert out["mode"] == "monitor"
+    assert out["meta"]["router"]["reason"] == "fallback"
+    assert llm.calls == 0
+
+
+@pytest.mark.parametrize(
+    "text,mode",
+    [
+        ("Crea un universo nuevo", "monitor"),
+        ("Continúa con el siguiente capítulo", "narration"),
+        # Keywords are stems/phrases: they must match inside words and across spaces
+        ("Quiero crear otro mundo", "monitor"),
+        ("¿QUÉ PASÓ después?", "narration"),
+        # Monitor keywords win even when a narration keyword comes first
+        ("Narra el final y luego guardar", "monitor"),
+    ],
+)
+def test_router_keyword_heuristics(monkeypatch, text, mode):
+    monkeypatch.setattr(router, "_llm_classify", lambda *_a: ("", 0.0, ""))
+    out = router.classify_intent({"input": text})
+    assert out["mode"] == mode
+    assert out["meta"]["router"]["reason"] == "keywords"
+
+
+def test_aclassify_intent_matches_sync_decision(llm):
+    import asyncio
+
+    out = asyncio.run(router.aclassify_intent({"input": "hola"}))
+    assert out["mode"] == "monitor"
+    assert out["meta"]["router"]["reason"] == "llm:r"
+
+
+def test_aclassify_intent_keeps_heuristic_on_timeout(monkeypatch, llm):
+    import asyncio
+    import time
+
+    def slow(*_a):
+        time.sleep(0.2)
+        return ("monitor", 1.0, "late")
+
+    monkeypatch.setattr(router, "_llm_classify", slow)
+    monkeypatch.setattr(router, "_LLM_TIMEOUT_S", 0.01)
+    out = asyncio.run(router.aclassify_intent({"input": "continúa la historia"}))
+    assert out["mode"] == "narration"
+    assert out["meta"]["router"]["reason"] == "keywords"
+
+
+def test_router_requests_schema_constrained_json(llm):
+    router.classify_intent({"input": "hola"})
+    assert llm.last_kwargs["max_tokens"] == 40
+    assert llm.last_kwargs["temperature"] == 0.0
+
+
+def test_router_truncates_long_input_for_llm(llm):
+    from core.engine.modes.constants import CLASSIFIER_INPUT_MAX_CHARS
+
+    router.classify_intent({"input": "hola " * 200})
+    content = llm.last_kwargs["messages"][0]["content"]
+    assert len(content) < CLASSIFIER_INPUT_MAX_CHARS + 40
@@ -5,7 +5,10 @@ import pytest
 
 pytestmark = pytest.mark.unit
 
-from core.engine.monitor_parser import parse_monitor_intent  # noqa: E402
+from core.engine.monitor_parser import (  # noqa: E402
+    cached_parse_monitor_intent,
+    parse_monitor_intent,
+)
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -35,3 +38,11 @@ def test_parse_save_fact_with_scene():
     assert intent and intent.action == "save_fact"
     assert "héroe" in (intent.description or "")
     assert intent.scene_id == "scene:1"
+
+
+def test_cached_parse_reuses_result_and_preserves_case():
+    a = cached_parse_monitor_intent('create universe u:1 name "Earth Prime"')
+    b = cached_parse_monitor_intent('  create universe u:1 name "Earth Prime" ')
+    assert a is b and a.name == "Earth Prime"
+    c = cached_parse_monitor_intent('create universe u:1 name "earth prime"')
+    assert c.name == "earth prime"
@@ -4,7 +4,11 @@ import pytest
 
 pytestmark = pytest.mark.unit
 
-from core.generation.providers import select_llm_from_env
+from core.generation.providers import (
+    cached_llm_from_env,
+    clear_llm_cache,
+    select_llm_from_env,
+)
 
 
 def test_select_llm_default_mock(monkeypatch):
@@ -23,6 +27,74 @@ def test_select_llm_openai_misconfigured_returns_mock(monkeypatch):
     assert isinstance(out, str)
 
 
+def test_cached_llm_reused_until_env_changes(monkeypatch):
+    monkeypatch.setenv("MONITOR_LLM_BACKEND", "mock")
+    first = cached_llm_from_env()
+    assert cached_llm_from_env() is first
+    monkeypatch.setenv("MONITOR_OPENAI_MODEL", "other-model")
+    second = cached_llm_from_env()
+    assert second is not first
+    clear_llm_cache()
+    assert cached_llm_from_env() is not second
+
+
+def test_provider_clients_share_http_pool():
+    pytest.importorskip("openai")
+    pytest.importorskip("groq")
+    from core.generation.providers import GroqChat, OpenAIChat, _shared_http_client
+
+    pool = _shared_http_client()
+    assert OpenAIChat(api_key="k", model="m")._client._client is pool
+    assert GroqChat(api_key="k", model="m")._client._client is pool
+
+
+def test_usage_stats_count_cached_prompt_tokens():
+    from types import SimpleNamespace
+
+    from core.generation.providers import _record_usage, get_llm_usage_stats
+
+    before = get_llm_usage_stats()
+    _record_usage(
+        SimpleNamespace(
+            prompt_tokens=100,
+            completion_tokens=10,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=80),
+        )
+    )
+    _record_usage(SimpleNamespace(prompt_tokens=50, completion_tokens=5))
+    after = get_llm_usage_stats()
+    assert after["calls"] - before["calls"] == 2
+    assert after["prompt_tokens"] - before["prompt_tokens"] == 150
+    assert after["cached_prompt_tokens"] - before["cached_prompt_tokens"] == 80
+    assert 0.0 < after["cache_hit_ratio"] <= 1.0
+
+
+def test_openai_requests_carry_prompt_cache_key():
+    pytest.importorskip("openai")
+    from types import SimpleNamespace
+
+    from core.generation.providers import OpenAIChat
+
+    seen: list[dict] = []
+
+    def _create(**kwargs):
+        seen.append(kwargs)
+        msg = SimpleNamespace(content="ok")
+        return SimpleNamespace(choices=[SimpleNamespace(message=msg)], usage=None)
+
+    official = OpenAIChat(api_key="k", model="m")
+    compat = OpenAIChat(api_key="k", model="m", base_url="http://localhost:1234/v1")
+    for llm in (official, compat):
+        llm._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=_create))
+        )
+        llm.complete(system_prompt="sys", messages=[{"role": "user", "content": "hi"}])
+    official.complete(system_prompt="sys", messages=[{"role": "user", "content": "other"}])
+    keys = [kw.get("extra_body", {}).get("prompt_cache_key") for kw in seen]
+    assert keys[0] and keys[0] == keys[2]
+    assert keys[1] is None
+
+
 def test_import_ports_llm_module_executes():
     # Importing ensures top-level class definitions are executed for coverage
     import core.ports.llm as ports_llm  # noqa: F401
@@ -34,6 +34,11 @@ def test_queries_shapes():
     svc.facts_for_scene("SC-9")
     assert "MATCH (f:Fact)-[:OCCURS_IN]->(s:Scene {id:$sid})" in repo.last[0]
 
+    assert svc.latest_transcript_fact("SC-9", "ST-1") is None
+    text, params = repo.last
+    assert "WHERE f.description STARTS WITH $prefix" in text and "LIMIT 1" in text
+    assert params == {"scene_id": "SC-9", "story_id": "ST-1", "prefix": "TRANSCRIPT\n"}
+
     svc.relation_state_history("E-1", "E-2")
     text, params = repo.last
     assert "MATCH (rs:RelationState)-[:REL_STATE_FOR {endpoint:'A'}]->(a:Entity {id:$a})" in text
@@ -78,6 +83,16 @@ def test_queries_shapes():
     svc.next_scene_for_entity_in_story("ST-1", "E-1", 1)
     assert "ORDER BY sequence_index ASC" in repo.last[0]
 
+    svc.last_scene_for_entity_by_name("U-1", "Deadpool")
+    text, params = repo.last
+    assert "ORDER BY story_id DESC" in text and "LIMIT 1" in text
+    assert params == {"uid": "U-1", "name": "Deadpool"}
+
+    svc.entities_by_names_in_universe("U-1", ["Rogue", "rogue", "Logan"])
+    text, params = repo.last
+    assert "WHERE toLower(e.name) IN $names" in text
+    assert params == {"uid": "U-1", "names": ["logan", "rogue"]}
+
     svc.previous_scene_for_entity_in_story("ST-1", "E-1", 3)
     assert "ORDER BY sequence_index DESC" in repo.last[0]
 
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from core.engine.modes import response_cache as rc
+
+
+@pytest.fixture(autouse=True)
+def _enabled(monkeypatch):
+    monkeypatch.setattr(rc, "ENABLED", True)
+    rc.clear_response_cache()
+    yield
+    rc.clear_response_cache()
+
+
+def _msgs(*texts: str) -> list[dict]:
+    roles = ("user", "assistant")
+    return [{"role": roles[i % 2], "content": t} for i, t in enumerate(texts)]
+
+
+def test_exact_repeat_in_same_session_hits():
+    scope = rc.scope_for("s1", "u1")
+    assert rc.lookup(scope, "sys", _msgs("hola", "hey", "Help me  plan the session")) is None
+    rc.store(scope, "sys", _msgs("hola", "hey", "Help me  plan the session"), "plan reply")
+    assert rc.lookup(scope, "sys", _msgs("hola", "hey", "help me plan the session")) == (
+        "plan reply"
+    )
+
+
+def test_sessions_with_same_tail_do_not_share_replies():
+    tail = ("who is Ana?", "Ana is the spy.", "and her brother?")
+    rc.store(rc.scope_for("s1", "u1"), "sys", _msgs("secret plot", *tail), "private reply")
+    assert rc.lookup(rc.scope_for("s2", "u1"), "sys", _msgs("secret plot", *tail)) is None
+    # Same session, different earlier history: the full conversation is the key
+    assert rc.lookup(rc.scope_for("s1", "u1"), "sys", _msgs("other plot", *tail)) is None
+
+
+def test_no_session_or_disabled_skips_cache(monkeypatch):
+    assert rc.scope_for(None, "u1") is None
+    rc.store(None, "sys", _msgs("x"), "reply")
+    assert rc.lookup(None, "sys", _msgs("x")) is None
+    monkeypatch.setattr(rc, "ENABLED", False)
+    scope = rc.scope_for("s1", None)
+    rc.store(scope, "sys", _msgs("x"), "reply")
+    assert rc.lookup(scope, "sys", _msgs("x")) is None
+
+
+def test_similar_ask_after_same_history_hits_within_scope():
+    def embed(text: str) -> list[float]:
+        return [1.0, 0.0] if "plan" in text else [0.0, 1.0]
+
+    scope = rc.scope_for("s1", "u1")
+    rc.store(scope, "sys", _msgs("hola", "hey", "plan tonight"), "tonight", embed)
+    assert rc.lookup(scope, "sys", _msgs("hola", "hey", "plan for tonight?"), embed) == "tonight"
+    assert rc.lookup(scope, "sys", _msgs("hola", "hey", "who is Ana"), embed) is None
+    other = rc.scope_for("s2", "u1")
+    assert rc.lookup(other, "sys", _msgs("hola", "hey", "plan for tonight?"), embed) is None
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from core.engine.modes import router_draft
+
+
+@pytest.fixture
+def draft_log(tmp_path, monkeypatch):
+    path = tmp_path / "verdicts.jsonl"
+    rows = [{"text": f"lista los universos del multiverso {i}", "intent": "monitor"} for i in range(25)]
+    rows += [{"text": f"el dragón ataca la aldea al amanecer {i}", "intent": "narration"} for i in range(25)]
+    path.write_text("\n".join(json.dumps(r) for r in rows) + "\n", encoding="utf-8")
+    monkeypatch.setenv("ROUTER_DRAFT_LOG", str(path))
+    router_draft.reload_draft()
+    yield path
+    router_draft.reload_draft()
+
+
+def test_draft_abstains_without_log(monkeypatch):
+    monkeypatch.delenv("ROUTER_DRAFT_LOG", raising=False)
+    assert router_draft.confident_draft("lista los universos") is None
+
+
+def test_draft_predicts_from_logged_verdicts(draft_log):
+    assert router_draft.confident_draft("lista los universos")[0] == "monitor"
+    assert router_draft.confident_draft("el dragón ataca")[0] == "narration"
+
+
+def test_record_verdict_appends_to_log(draft_log, monkeypatch):
+    # Run the background write inline
+    monkeypatch.setattr(router_draft, "run_in_background", lambda fn, *a: fn(*a))
+    router_draft.record_verdict("abre la puerta", "narration")
+    router_draft.record_verdict("ignored", "other")
+    last = draft_log.read_text(encoding="utf-8").splitlines()[-1]
+    assert json.loads(last) == {"text": "abre la puerta", "intent": "narration"}
+
+
+def test_record_verdict_writes_off_thread_and_rotates(draft_log, monkeypatch):
+    import threading
+
+    threads: list[str] = []
+
+    def _bg(fn, *args):
+        t = threading.Thread(target=lambda: (threads.append("bg"), fn(*args)))
+        t.start()
+        t.join()
+
+    monkeypatch.setattr(router_draft, "run_in_background", _bg)
+    monkeypatch.setattr(router_draft, "_LOG_MAX_BYTES", draft_log.stat().st_size)
+    router_draft.record_verdict("abre la puerta", "narration")
+    assert threads == ["bg"]
+    rotated = draft_log.with_name(draft_log.name + ".1")
+    assert len(rotated.read_text(encoding="utf-8").splitlines()) == 50
+    assert draft_log.read_text(encoding="utf-8").count("\n") == 1
+    # The draft still trains on the rotated examples
+    router_draft.reload_draft()
+    assert router_draft.confident_draft("lista los universos")[0] == "monitor"
+
+
+def test_router_skips_llm_when_draft_is_confident(draft_log, monkeypatch):
+    from core.engine.modes import router
+
+    monkeypatch.setattr(router, "_llm_classify", pytest.fail)
+    out = router.classify_intent({"input": "lista los universos", "last_mode": "narration"})
+    assert out["mode"] == "monitor"
+    assert out["meta"]["router"]["reason"] == "draft"